@@ -4,12 +4,14 @@ import time
 from copy import deepcopy
 from datetime import timedelta
 
+import numpy as np
 import pandas as pd
 
 from petsard.constrainer import Constrainer
 from petsard.evaluator import Describer, Evaluator
 from petsard.exceptions import ConfigError
 from petsard.loader import Loader, Splitter
+from petsard.loader.splitter import SplitView
 from petsard.metadater.metadata import Schema
 from petsard.metadater.metadater import SchemaMetadater
 from petsard.processor import Processor
@@ -144,7 +146,6 @@ class BaseAdapter:
             tuple: (is_benchmark, local_path, benchmarker_config)
         """
         import re
-        from pathlib import Path
 
         # Handle non-string values (e.g., dict, Schema objects)
         if not isinstance(protocol_value, str):
@@ -179,18 +180,15 @@ class BaseAdapter:
             self._logger.error(error_msg)
             raise BenchmarkDatasetsError(error_msg) from e
 
-        # Update to local path
-        local_path = str(
-            Path("benchmark").joinpath(benchmarker_config.benchmark_filename)
-        )
+        # Update to local path, under the (possibly shared) benchmark directory
+        requests_config = benchmarker_config.get_benchmarker_config()
+        local_path = str(requests_config["filepath"])
         self._logger.debug(f"Updated {value_type} to local path: {local_path}")
 
         # Download benchmark file
         self._logger.info(f"Downloading benchmark {value_type}: {benchmark_name}")
         try:
-            benchmarker = BenchmarkerRequests(
-                benchmarker_config.get_benchmarker_config()
-            )
+            benchmarker = BenchmarkerRequests(requests_config)
             benchmarker.download()
             self._logger.debug(f"Benchmark {value_type} downloaded successfully")
         except BenchmarkDatasetsError as e:
@@ -642,6 +640,9 @@ class SplitterAdapter(BaseAdapter):
             "random_state",
             "max_overlap_ratio",
             "max_attempts",
+            "split_method",
+            "stratify_column",
+            "fold",
         ]
 
         loader_config = {}
@@ -665,7 +666,7 @@ class SplitterAdapter(BaseAdapter):
             input (dict):
                 Splitter input should contains
                     data (pd.DataFrame), metadata (Schema),
-                    and exclude_index (list[set]).
+                    and exist_train_indices (list[np.ndarray]).
 
         Attributes:
             data (Dict[int, Dict[str, pd.DataFrame]]):
@@ -673,7 +674,7 @@ class SplitterAdapter(BaseAdapter):
                     First layer is the splitting index, key as int, value as dictionary.
                     Second layer is the splitting result of specific splitting,
                     key as str: 'train' and 'validation', value as pd.DataFrame.
-            train_indices (Dict[int, List[int]]):
+            train_indices (list[np.ndarray]):
                 The original indices of training data for each sample.
         """
         self._logger.debug("Starting data splitting process")
@@ -716,7 +717,7 @@ class SplitterAdapter(BaseAdapter):
                     "validation": validation_metadata,
                 }
             }
-            self.train_indices = [set(ori_data.index.tolist())]
+            self.train_indices = [ori_data.index.to_numpy()]
         else:
             # Normal splitting process
             # Only pass parameters that Splitter.split() accepts and are not empty
@@ -732,15 +733,24 @@ class SplitterAdapter(BaseAdapter):
                 **split_params
             )
 
-        # Update schema statistics for train data after splitting
         # Update schema statistics for train data after splitting
         if self.metadata and 1 in self.metadata:
             train_metadata = self.metadata[1].get("train")
             if train_metadata and train_metadata.enable_stats:
                 train_data = self.data[1]["train"]
-                self.metadata[1]["train"] = self._update_schema_stats(
-                    train_metadata, train_data, "Splitter (train)"
-                )
+                if self.is_custom_data:
+                    self.metadata[1]["train"] = self._update_schema_stats(
+                        train_metadata, train_data, "Splitter (train)"
+                    )
+                else:
+                    # Train rows are the input rows minus the validation rows,
+                    # so statistics of the input are updated incrementally
+                    self._logger.debug("Updating statistics for Splitter (train)")
+                    self.metadata[1]["train"] = SchemaMetadater.update_stats(
+                        train_metadata,
+                        train_data,
+                        removed=self.data[1]["validation"],
+                    )
 
         self._logger.debug("Data splitting completed")
 
@@ -773,6 +783,9 @@ class SplitterAdapter(BaseAdapter):
         Retrieve the splitting result.
             Due to Config force num_samples = 1, return 1st dataset is fine.
         """
+        if isinstance(self.data[1], SplitView):
+            # Materialized on read, each part is already a new DataFrame
+            return dict(self.data[1])
         result: dict = deepcopy(self.data[1])
         return result
 
@@ -785,14 +798,14 @@ class SplitterAdapter(BaseAdapter):
         """
         return deepcopy(self.metadata[1]["train"])
 
-    def get_train_indices(self) -> list[set]:
+    def get_train_indices(self) -> list[np.ndarray]:
         """
         Retrieve the training indices for each sample.
 
         Returns:
-            list[set]: Training indices as list of sets
+            list[np.ndarray]: Training indices as list of index arrays
         """
-        return deepcopy(self.train_indices)
+        return list(self.train_indices)
 
 
 class PreprocessorAdapter(BaseAdapter):
@@ -801,6 +814,9 @@ class PreprocessorAdapter(BaseAdapter):
         using the configured Processor instance as a decorator.
     """
 
+    # Keys passed to Processor as arguments instead of processor config
+    PROCESSOR_OPTIONS: list[str] = ["max_workers", "executor", "profile"]
+
     def __init__(self, config: dict):
         """
         Args:
@@ -810,6 +826,8 @@ class PreprocessorAdapter(BaseAdapter):
             _processor (Processor): The processor object used by the Operator.
             _config (dict): The configuration parameters for the Processor.
             _sequence (list): The sequence of the pre-processing steps (if any
+            _processor_options (dict): The execution options of the Processor
+                (max_workers, executor, profile), if any.
         """
         super().__init__(config)
         self.processor = None
@@ -817,6 +835,9 @@ class PreprocessorAdapter(BaseAdapter):
         self._sequence = None
         if "sequence" in config:
             self._sequence = config["sequence"]
+        self._processor_options: dict = {
+            key: config[key] for key in self.PROCESSOR_OPTIONS if key in config
+        }
 
         # Extract the processor configuration properly
         if method == "default":
@@ -829,7 +850,9 @@ class PreprocessorAdapter(BaseAdapter):
             else:
                 # Remove non-processor keys from config
                 self._config = {
-                    k: v for k, v in config.items() if k not in ["method", "sequence"]
+                    k: v
+                    for k, v in config.items()
+                    if k not in ["method", "sequence", *self.PROCESSOR_OPTIONS]
                 }
 
         # Support simplified global outlier method configuration
@@ -940,6 +963,7 @@ class PreprocessorAdapter(BaseAdapter):
         self.processor = Processor(
             metadata=input["metadata"],
             config=expanded_config,
+            **self._processor_options,
         )
 
         if self._sequence is None:
@@ -117,5 +117,12 @@ class Config:
                 # fill zero on n
                 formatted_n = f"{n + 1:0{zero_padding}}"
                 iter_expt_name = f"{expt_name}_[{num_samples}-{formatted_n}]"
-                transformed_config[iter_expt_name] = iter_expt_config
+                if expt_config.get("split_method") == "kfold":
+                    # Each experiment takes its own fold of the same k folds
+                    transformed_config[iter_expt_name] = {
+                        **deepcopy(expt_config),
+                        "fold": n + 1,
+                    }
+                else:
+                    transformed_config[iter_expt_name] = iter_expt_config
         return transformed_config
@@ -6,6 +6,7 @@ import pandas as pd
 from tqdm import tqdm
 
 from petsard.evaluator.evaluator_base import BaseEvaluator
+from petsard.metadater import AttributeMetadater
 
 
 class MPUCCs(BaseEvaluator):
@@ -99,14 +100,13 @@ class MPUCCs(BaseEvaluator):
                     continue
 
                 # For floating point numbers, check decimal places
-                for value in non_null_values:
-                    if pd.isna(value):
-                        continue
-                    # Convert to string and check decimal places
-                    str_value = f"{value:.10f}".rstrip("0").rstrip(".")
-                    if "." in str_value:
-                        decimal_places = len(str_value.split(".")[1])
-                        min_precision = max(min_precision, decimal_places)
+                # rounded to 10 places to drop float noise
+                decimal_places = AttributeMetadater.infer_decimal_places(
+                    np.round(non_null_values.to_numpy(dtype="float64"), 10),
+                    max_precision=10,
+                )
+                if decimal_places is not None:
+                    min_precision = max(min_precision, decimal_places)
 
                 self._logger.debug(
                     f"Field {col} detected numeric precision: 10^-{min_precision}"
@@ -1,6 +1,8 @@
 import hashlib
+import json
 import logging
 import os
+import tempfile
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from importlib import resources
@@ -30,10 +32,15 @@ class BenchmarkerConfig(BaseConfig):
         benchmark_region_name (str): The benchmark region name.
         benchmark_bucket_name (str): The benchmark bucket name.
         benchmark_sha256 (str): The benchmark SHA-256 value.
+        benchmark_dir (str): Local directory of benchmark files,
+            defaults to $PETSARD_BENCHMARK_DIR or "benchmark".
+            Point it to a shared directory to reuse verified files across projects.
         filepath_raw (str): The raw file path.
     """
 
     YAML_FILENAME: str = "benchmark_datasets.yaml"
+    BENCHMARK_DIR_ENV: str = "PETSARD_BENCHMARK_DIR"
+    DEFAULT_BENCHMARK_DIR: str = "benchmark"
 
     benchmark_name: str | None = None
     benchmark_filename: str | None = None
@@ -41,6 +48,7 @@ class BenchmarkerConfig(BaseConfig):
     benchmark_region_name: str | None = None
     benchmark_bucket_name: str | None = None
     benchmark_sha256: str | None = None
+    benchmark_dir: str | None = None
     filepath_raw: str | None = None
 
     def __post_init__(self):
@@ -78,6 +86,10 @@ class BenchmarkerConfig(BaseConfig):
         self.benchmark_region_name = benchmark_value["region_name"]
         self.benchmark_bucket_name = benchmark_value["bucket_name"]
         self.benchmark_sha256 = benchmark_value["sha256"]
+        if self.benchmark_dir is None:
+            self.benchmark_dir = os.environ.get(
+                self.BENCHMARK_DIR_ENV, self.DEFAULT_BENCHMARK_DIR
+            )
         self._logger.info(
             f"Configured benchmark dataset: {self.benchmark_name}, filename: {self.benchmark_filename}"
         )
@@ -137,7 +149,7 @@ class BenchmarkerConfig(BaseConfig):
             "benchmark_filename": self.benchmark_filename,
             "benchmark_bucket_name": self.benchmark_bucket_name,
             "benchmark_sha256": self.benchmark_sha256,
-            "filepath": Path("benchmark").joinpath(self.benchmark_filename),
+            "filepath": Path(self.benchmark_dir).joinpath(self.benchmark_filename),
         }
 
 
@@ -164,8 +176,15 @@ class BaseBenchmarker(ABC):
         Base class for all "Benchmarker".
         The "Benchmarker" class defines the common API
         that all the "Loader" need to implement, as well as common functionality.
+
+        Verified files are recorded in a manifest (manifest.json) in their
+        directory with their SHA-256, size and mtime, so later runs, other
+        projects or containers sharing the directory trust an unchanged file
+        without hashing it again.
     """
 
+    MANIFEST_FILENAME: str = "manifest.json"
+
     def __init__(self, config: dict):
         """
         Attributes:
@@ -177,8 +196,12 @@ class BaseBenchmarker(ABC):
                 benchmark_sha256 (str)
                     The SHA-256 value of the benchmark data from benchmark_datasets.yaml.
                 filepath (str) The full path of the benchmark data in local.
+                benchmark_url (str, optional)
+                    Download URL, defaults to the public S3 bucket.
                 benchmark_already_exist (bool)
                     If the benchmark data already exist. Default is False.
+            _download_sha256 (str):
+                SHA-256 computed while downloading, None before a download.
         """
         self._logger: logging.Logger = logging.getLogger(
             f"PETsARD.{self.__class__.__name__}"
@@ -189,15 +212,23 @@ class BaseBenchmarker(ABC):
 
         self.config: dict = config
         self.config["benchmark_already_exist"] = False
+        self._download_sha256: str | None = None
         if os.path.exists(self.config["filepath"]):
             # if same name data already exist, check the sha256hash,
+            #     if recorded unchanged in the manifest, trust it without hashing,
             #     if match, ignore download and continue,
             #     if NOT match, raise Error
-            self._verify_file(already_exist=True)
+            if self._is_recorded(self.config["benchmark_sha256"]):
+                self.config["benchmark_already_exist"] = True
+                self._logger.info(
+                    f"Verified file recorded in manifest: {self.config['filepath']}"
+                )
+            else:
+                self._verify_file(already_exist=True)
         else:
             # if same name data didn't exist,
-            #     confirm "./benchmark/" folder is exist (create it if not)
-            os.makedirs("benchmark", exist_ok=True)
+            #     confirm benchmark folder is exist (create it if not)
+            os.makedirs(os.path.dirname(self.config["filepath"]) or ".", exist_ok=True)
 
     @abstractmethod
     def download(self):
@@ -215,9 +246,15 @@ class BaseBenchmarker(ABC):
             already_exist (bool) If the file already exist. Default is True.
               False means verify under download process.
         """
-        file_sha256hash = digest_sha256(self.config["filepath"])
         expected_sha256 = self.config["benchmark_sha256"]
 
+        # Downloads are hashed while streaming, no need to read the file again
+        file_sha256hash = (
+            self._download_sha256
+            if not already_exist and self._download_sha256 is not None
+            else digest_sha256(self.config["filepath"])
+        )
+
         # Always log the SHA-256 comparison
         self._logger.info(
             f"SHA-256 verification for: {self.config['filepath']}\n"
@@ -230,6 +267,7 @@ class BaseBenchmarker(ABC):
             self._logger.info(
                 f"SHA-256 verification PASSED for: {self.config['filepath']}"
             )
+            self._record(file_sha256hash)
         else:
             # Raise error on SHA-256 mismatch
             if already_exist:
@@ -260,6 +298,91 @@ class BaseBenchmarker(ABC):
                     self._logger.debug(f"Failed to remove corrupted file: {e}")
                 raise BenchmarkDatasetsError(error_msg)
 
+    def _manifest_path(self) -> Path:
+        """
+        Path of the manifest next to the benchmark file
+        """
+        return Path(self.config["filepath"]).parent / self.MANIFEST_FILENAME
+
+    def _read_manifest(self) -> dict:
+        """
+        Read the manifest, empty if missing or unreadable
+
+        Return:
+            (dict) {filename: {sha256, size, mtime_ns}}
+        """
+        try:
+            with open(self._manifest_path(), encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _is_recorded(self, expected_sha256: str) -> bool:
+        """
+        Whether the manifest records the unchanged file with the expected SHA-256
+
+        Args:
+            expected_sha256 (str) The SHA-256 value from benchmark_datasets.yaml.
+        """
+        entry = self._read_manifest().get(Path(self.config["filepath"]).name)
+        if not isinstance(entry, dict):
+            return False
+        try:
+            stat = os.stat(self.config["filepath"])
+        except OSError:
+            return False
+        return (
+            entry.get("sha256") == expected_sha256
+            and entry.get("size") == stat.st_size
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+        )
+
+    def _record(self, sha256: str) -> None:
+        """
+        Record the verified file in the manifest
+
+        The manifest is written to a temporary file and renamed into place,
+        so concurrent runs never read a partial manifest.
+
+        Args:
+            sha256 (str) The verified SHA-256 value of the file.
+        """
+        manifest_path = self._manifest_path()
+        try:
+            stat = os.stat(self.config["filepath"])
+            manifest = self._read_manifest()
+            manifest[Path(self.config["filepath"]).name] = {
+                "sha256": sha256,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=f".{self.MANIFEST_FILENAME}.", dir=manifest_path.parent
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, manifest_path)
+        except OSError as e:
+            self._logger.debug(f"Failed to update benchmark manifest: {e}")
+
+    @staticmethod
+    def _digest_part(filepath: str):
+        """
+        SHA-256 hash object of a partial download, to continue hashing from
+
+        Args:
+            filepath (str) The partial download path.
+
+        Return:
+            (hashlib._Hash) SHA-256 hash object updated with the file content.
+        """
+        sha256hash = hashlib.sha256()
+        with open(filepath, "rb") as f:
+            for byte_block in iter(lambda: f.read(131072), b""):
+                sha256hash.update(byte_block)
+        return sha256hash
+
 
 class BenchmarkerRequests(BaseBenchmarker):
     """
@@ -269,6 +392,10 @@ class BenchmarkerRequests(BaseBenchmarker):
 
     """
 
+    # Suffix of the partial file while downloading
+    PART_SUFFIX: str = ".part"
+    CHUNK_SIZE: int = 131072
+
     def __init__(self, config: dict):
         super().__init__(config)
 
@@ -277,6 +404,10 @@ class BenchmarkerRequests(BaseBenchmarker):
         Use requests.get() to download data,
             than confirm its SHA-256 is matched.
 
+        The data is written to "<filepath>.part" and hashed while streaming.
+        An interrupted download keeps the partial file, and the next download
+        resumes it with an HTTP Range request (restarting from zero
+        if the server does not support ranges).
         """
         # Check if requests is installed
         try:
@@ -293,42 +424,36 @@ class BenchmarkerRequests(BaseBenchmarker):
         if self.config["benchmark_already_exist"]:
             self._logger.info(f"Using existing local file: {self.config['filepath']}")
         else:
-            url = (
+            url = self.config.get("benchmark_url") or (
                 f"https://"
                 f"{self.config['benchmark_bucket_name']}"
                 f".s3.amazonaws.com/"
                 f"{self.config['benchmark_filename']}"
             )
+            part_path = f"{self.config['filepath']}{self.PART_SUFFIX}"
+            resume_size = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            headers = {"Range": f"bytes={resume_size}-"} if resume_size else {}
             self._logger.info(f"Downloading benchmark file from: {url}")
 
             try:
-                with requests.get(url, stream=True, timeout=300) as response:
-                    if response.status_code == 200:
-                        total_size = int(response.headers.get("content-length", 0))
-                        downloaded_size = 0
-
-                        with open(self.config["filepath"], "wb") as f:
-                            # load 8KB at one time
-                            for chunk in response.iter_content(chunk_size=8192):
-                                if chunk:
-                                    f.write(chunk)
-                                    downloaded_size += len(chunk)
-
-                                    # Log progress for large files
-                                    if (
-                                        total_size > 0
-                                        and downloaded_size % (1024 * 1024) == 0
-                                    ):
-                                        progress = (downloaded_size / total_size) * 100
-                                        self._logger.debug(
-                                            f"Download progress: {downloaded_size / (1024 * 1024):.1f}MB / "
-                                            f"{total_size / (1024 * 1024):.1f}MB ({progress:.1f}%)"
-                                        )
-
+                with requests.get(
+                    url, stream=True, timeout=300, headers=headers
+                ) as response:
+                    if response.status_code == 206 and resume_size:
+                        # Server honors the range, append to the partial file
                         self._logger.info(
-                            f"Download completed: {self.config['benchmark_filename']} "
-                            f"({downloaded_size / (1024 * 1024):.1f}MB)"
+                            f"Resuming download from {resume_size / (1024 * 1024):.1f}MB"
                         )
+                        sha256hash = self._digest_part(part_path)
+                        mode = "ab"
+                    elif response.status_code == 416 and resume_size:
+                        # Nothing left to download, the partial file is complete
+                        sha256hash = self._digest_part(part_path)
+                        mode = None
+                    elif response.status_code == 200:
+                        sha256hash = hashlib.sha256()
+                        resume_size = 0
+                        mode = "wb"
                     elif response.status_code == 404:
                         error_msg = (
                             f"Benchmark file not found on server: {self.config['benchmark_filename']}\n"
@@ -346,17 +471,50 @@ class BenchmarkerRequests(BaseBenchmarker):
                         )
                         self._logger.error(error_msg)
                         raise BenchmarkDatasetsError(error_msg)
-            except requests.exceptions.Timeout as e:
-                error_msg = (
-                    f"Download timeout for benchmark file: {self.config['benchmark_filename']}\n"
-                    f"The file may be too large or the connection may be slow.\n"
-                    f"Please try again with a better connection."
+
+                    downloaded_size = resume_size
+                    if mode is not None:
+                        total_size = resume_size + int(
+                            response.headers.get("content-length", 0)
+                        )
+                        logged_mb = downloaded_size // (1024 * 1024)
+                        with open(part_path, mode) as f:
+                            # Hash while streaming, the file is never read back
+                            for chunk in response.iter_content(
+                                chunk_size=self.CHUNK_SIZE
+                            ):
+                                if chunk:
+                                    f.write(chunk)
+                                    sha256hash.update(chunk)
+                                    downloaded_size += len(chunk)
+
+                                    # Log progress for large files, once per MB
+                                    if (
+                                        total_size > 0
+                                        and downloaded_size // (1024 * 1024) > logged_mb
+                                    ):
+                                        logged_mb = downloaded_size // (1024 * 1024)
+                                        progress = (downloaded_size / total_size) * 100
+                                        self._logger.debug(
+                                            f"Download progress: {downloaded_size / (1024 * 1024):.1f}MB / "
+                                            f"{total_size / (1024 * 1024):.1f}MB ({progress:.1f}%)"
+                                        )
+
+                self._download_sha256 = sha256hash.hexdigest()
+                os.replace(part_path, self.config["filepath"])
+                self._logger.info(
+                    f"Download completed: {self.config['benchmark_filename']} "
+                    f"({downloaded_size / (1024 * 1024):.1f}MB)"
                 )
-                self._logger.error(error_msg)
-                raise BenchmarkDatasetsError(error_msg) from e
-            except requests.exceptions.ConnectionError as e:
+            except (
+                requests.exceptions.Timeout,
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+            ) as e:
+                # Keep the partial file, the next download resumes from it
                 error_msg = (
-                    f"Connection error while downloading benchmark file: {self.config['benchmark_filename']}\n"
+                    f"Download interrupted for benchmark file: {self.config['benchmark_filename']}\n"
+                    f"The partial download is kept and resumed on the next run.\n"
                     f"Please check your internet connection and try again.\n"
                     f"Error details: {str(e)}"
                 )
@@ -364,16 +522,15 @@ class BenchmarkerRequests(BaseBenchmarker):
                 raise BenchmarkDatasetsError(error_msg) from e
             except Exception as e:
                 # Clean up partial download
-                if os.path.exists(self.config["filepath"]):
-                    try:
-                        os.remove(self.config["filepath"])
-                        self._logger.debug(
-                            f"Removed partial download: {self.config['filepath']}"
-                        )
-                    except OSError as remove_error:
-                        self._logger.debug(
-                            f"Failed to remove partial download: {remove_error}"
-                        )
+                for path in (part_path, self.config["filepath"]):
+                    if os.path.exists(path):
+                        try:
+                            os.remove(path)
+                            self._logger.debug(f"Removed partial download: {path}")
+                        except OSError as remove_error:
+                            self._logger.debug(
+                                f"Failed to remove partial download: {remove_error}"
+                            )
 
                 error_msg = (
                     f"Unexpected error downloading benchmark file: {self.config['benchmark_filename']}\n"
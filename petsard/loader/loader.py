@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import glob
 import logging
+import os
+import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 import yaml
@@ -11,8 +16,17 @@ from petsard.config_base import BaseConfig
 from petsard.exceptions import (
     ConfigError,
     UnableToFollowMetadataError,
+    UnableToLoadError,
     UnsupportedMethodError,
 )
+from petsard.loader.loader_cache import LoaderCache
+from petsard.loader.loader_database import (
+    NATIVE_DATABASE_PROTOCOLS,
+    database_protocol,
+    is_database,
+)
+from petsard.loader.loader_pandas import LoaderPandasExcel
+from petsard.loader.loader_remote import is_remote, list_remote_partitions
 from petsard.metadater import Attribute, Schema, SchemaMetadater
 
 
@@ -23,6 +37,12 @@ class LoaderFileExt:
 
     CSVTYPE: int = 1
     EXCELTYPE: int = 2
+    PARQUETTYPE: int = 3
+    ARROWTYPE: int = 4
+    DATABASETYPE: int = 5
+
+    # File types that can be streamed chunk by chunk
+    CHUNKABLE_TYPES: tuple[int, ...] = (CSVTYPE, PARQUETTYPE, DATABASETYPE)
 
     CSV: int = 10
     XLS: int = 20
@@ -32,6 +52,27 @@ class LoaderFileExt:
     ODF: int = 24
     ODS: int = 25
     ODT: int = 26
+    PARQUET: int = 30
+    FEATHER: int = 40
+    ARROW: int = 41
+
+    # Compression suffixes wrapping a file, e.g. data.csv.gz
+    COMPRESSIONS: dict[str, str] = {
+        ".gz": "gzip",
+        ".bz2": "bz2",
+        ".xz": "xz",
+        ".zst": "zstd",
+        ".zip": "zip",
+    }
+
+    # Compressions each file type can be decompressed from while reading
+    SUPPORTED_COMPRESSIONS: dict[int, tuple[str, ...]] = {
+        CSVTYPE: ("gzip", "bz2", "xz", "zstd", "zip"),
+        EXCELTYPE: (),
+        PARQUETTYPE: ("gzip", "bz2", "zstd"),
+        ARROWTYPE: ("gzip", "bz2", "zstd"),
+        DATABASETYPE: (),
+    }
 
     @classmethod
     def get(cls, file_ext: str) -> int:
@@ -43,6 +84,24 @@ class LoaderFileExt:
         """
         return cls.__dict__[file_ext[1:].upper()] // 10
 
+    @classmethod
+    def split_compression(cls, file_name: str) -> tuple[str, str | None]:
+        """
+        Split the compression suffix off a file name.
+
+        Args:
+            file_name (str): File name, e.g. "data.csv.gz"
+
+        Return:
+            (tuple[str, str | None]) File extension and compression,
+                e.g. (".csv", "gzip"), or (".csv", None) if not compressed.
+        """
+        stem, file_ext = os.path.splitext(file_name)
+        compression = cls.COMPRESSIONS.get(file_ext.lower())
+        if compression is not None:
+            file_ext = os.path.splitext(stem)[1]
+        return file_ext.lower(), compression
+
 
 @dataclass
 class LoaderConfig(BaseConfig):
@@ -51,10 +110,28 @@ class LoaderConfig(BaseConfig):
 
     Attributes:
         _logger (logging.Logger): The logger object.
-        filepath (str): The fullpath of dataset.
+        filepath (str): The fullpath of dataset, or a glob pattern / directory of partitions.
         column_types (dict): The dictionary of column types and their corresponding column names.
         header_names (list): **DEPRECATED in v2.0.0 - will be removed** Specifies a list of headers for the data without header.
         na_values (str | list | dict): Extra string to recognized as NA/NaN.
+        nrows (int): Number of rows to read for quick testing.
+        chunksize (int): Number of rows per chunk when streaming the file, None reads it at once.
+        usecols (list | str): Columns to read, or "schema" for the attributes defined in schema.
+        cache_dir (str): Directory of the loaded data cache, None disables caching.
+        infer_sample_size (int): Number of rows sampled for schema inference, None uses all rows.
+        max_workers (int): Number of threads reading partitions, None uses the executor default.
+        sample_size (int): Number of rows kept by streaming reservoir sampling.
+        sample_fraction (float): Probability of keeping each row by streaming Bernoulli sampling.
+        random_state (int): Seed of row sampling, None is not reproducible.
+        storage_options (dict): Filesystem options of an fsspec URL filepath, e.g. credentials.
+        excel_engine (str): pandas Excel engine, "auto" prefers calamine when installed.
+        excel_sidecar (bool): Whether to convert Excel files once into a Parquet sidecar.
+        memory_mode (str): "compact" shrinks column dtypes right after reading, "default" keeps them.
+        table (str): Table read from a database URL filepath.
+        query (str): SQL query read from a database URL filepath, instead of table.
+        where (str): Trusted SQL condition filtering the rows of table / query in the database.
+        params (list | tuple | dict): Values bound to the placeholders of where / query by the driver.
+        connection (Any): DB-API connection, or a callable returning one, of a database URL filepath.
         schema (Schema): Schema configuration object with field definitions and global parameters.
         schema_path (str): The path to schema file if loaded from YAML file.
         dir_name (str): The directory name of the file path.
@@ -62,6 +139,8 @@ class LoaderConfig(BaseConfig):
         file_name (str): The file name of the file path.
         file_ext (str): The file extension of the file path.
         file_ext_code (int): The file extension code.
+        compression (str): The compression of the file detected from its suffix, e.g. "gzip".
+        filepaths (list): The partition file paths when filepath is a glob pattern / directory.
     """
 
     filepath: str | None = None
@@ -75,6 +154,23 @@ class LoaderConfig(BaseConfig):
         None  # TODO: Deprecated in v2.0.0 - will be removed
     )
     nrows: int | None = None  # Number of rows to read for quick testing
+    chunksize: int | None = None  # Number of rows per chunk for streaming load
+    usecols: list[str] | str | None = None  # Column projection pushed to the reader
+    cache_dir: str | None = None  # Content-addressed cache of loaded data
+    infer_sample_size: int | None = None  # Rows sampled for schema inference
+    max_workers: int | None = None  # Threads reading partitions
+    sample_size: int | None = None  # Rows kept by reservoir sampling
+    sample_fraction: float | None = None  # Row probability of Bernoulli sampling
+    random_state: int | None = None  # Seed of row sampling
+    storage_options: dict | None = None  # fsspec filesystem options
+    excel_engine: str | None = None  # pandas Excel engine
+    excel_sidecar: bool = False  # Parquet sidecar of Excel files
+    memory_mode: str = "default"  # Dtype compaction after reading
+    table: str | None = None  # Database table
+    query: str | None = None  # Database query
+    where: str | None = None  # Row filter pushed into the database query
+    params: list | tuple | dict | None = None  # Bound values of where / query
+    connection: Any = None  # DB-API connection or its factory
     schema: Schema | None = None
     schema_path: str | None = None  # Record schema source path (if loaded from file)
 
@@ -84,6 +180,12 @@ class LoaderConfig(BaseConfig):
     file_name: str | None = None
     file_ext: str | None = None
     file_ext_code: int | None = None
+    compression: str | None = None
+    filepaths: list[str] | None = None
+
+    # Characters marking filepath as a glob pattern
+    GLOB_CHARS: str = "*?["
+    MEMORY_MODES: tuple[str, ...] = ("default", "compact")
 
     def __post_init__(self):
         super().__post_init__()
@@ -100,19 +202,254 @@ class LoaderConfig(BaseConfig):
         filepath_path: Path = Path(self.filepath)
         self.dir_name = str(filepath_path.parent)
         self.base_name = filepath_path.name
+        self.file_ext, self.compression = LoaderFileExt.split_compression(
+            filepath_path.name
+        )
         self.file_name = filepath_path.stem
-        self.file_ext = filepath_path.suffix.lower()
-        try:
-            self.file_ext_code = LoaderFileExt.get(self.file_ext)
-        except KeyError as e:
-            error_msg = f"Unsupported file extension: {self.file_ext}"
-            self._logger.error(error_msg)
-            raise UnsupportedMethodError(error_msg) from e
+        if self.compression is not None:
+            self.file_name = Path(self.file_name).stem
+        if is_remote(self.filepath):
+            self.filepaths = list_remote_partitions(
+                str(self.filepath), self.storage_options, self.GLOB_CHARS
+            )
+            if self.filepaths == []:
+                error_msg = f"No files found for filepath: {self.filepath}"
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+        elif filepath_path.is_dir() or (
+            not filepath_path.exists()
+            and any(char in str(self.filepath) for char in self.GLOB_CHARS)
+        ):
+            self.filepaths = self._resolve_partitions(filepath_path)
+        if self.filepaths is not None:
+            if not any(char in str(self.filepath) for char in self.GLOB_CHARS):
+                self.file_name = filepath_path.name
+            self.file_ext, self.compression = self._check_partition_formats()
+            self._logger.debug(f"Found {len(self.filepaths)} partitions")
+        if is_database(self.filepath):
+            self.file_ext_code = LoaderFileExt.DATABASETYPE
+        else:
+            try:
+                self.file_ext_code = LoaderFileExt.get(self.file_ext)
+            except KeyError as e:
+                error_msg = f"Unsupported file extension: {self.file_ext}"
+                self._logger.error(error_msg)
+                raise UnsupportedMethodError(error_msg) from e
         self._logger.debug(
             f"File path information - dir: {self.dir_name}, name: {self.file_name}, ext: {self.file_ext}, ext code: {self.file_ext_code}"
         )
+        if (
+            self.compression is not None
+            and self.compression
+            not in LoaderFileExt.SUPPORTED_COMPRESSIONS[self.file_ext_code]
+        ):
+            error_msg = (
+                f"{self.compression} compression is not supported "
+                f"for file extension: {self.file_ext}"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+        if self.storage_options is not None and not is_remote(self.filepath):
+            error_msg = "storage_options requires an fsspec URL filepath, e.g. s3://"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
 
-        # 4. validate column_types (using new Metadater architecture)
+        # 3. validate database options
+        if self.file_ext_code == LoaderFileExt.DATABASETYPE:
+            if (self.table is None) == (self.query is None):
+                error_msg = "Exactly one of table and query must be specified"
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+            if (
+                self.connection is None
+                and database_protocol(self.filepath) not in NATIVE_DATABASE_PROTOCOLS
+            ):
+                error_msg = (
+                    f"connection is required to read {self.filepath}, "
+                    f"only {NATIVE_DATABASE_PROTOCOLS} URLs are connected natively"
+                )
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+            if self.cache_dir is not None:
+                error_msg = "cache_dir is not supported for database sources"
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+            if self.params is not None and not isinstance(
+                self.params, list | tuple | dict
+            ):
+                error_msg = (
+                    f"params must be a list, tuple or dict of values, "
+                    f"got {type(self.params).__name__}"
+                )
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+        else:
+            database_params = [
+                name
+                for name in ("table", "query", "where", "params", "connection")
+                if getattr(self, name) is not None
+            ]
+            if database_params:
+                error_msg = (
+                    f"{database_params} are only supported for database URLs, "
+                    f"e.g. sqlite:///path/to/file.db"
+                )
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+
+        # 4. validate Excel options
+        if self.excel_engine is not None or self.excel_sidecar:
+            if self.file_ext_code != LoaderFileExt.EXCELTYPE:
+                error_msg = (
+                    f"excel_engine and excel_sidecar are only supported "
+                    f"for Excel files, got file extension: {self.file_ext}"
+                )
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+            if (
+                self.excel_engine is not None
+                and self.excel_engine not in LoaderPandasExcel.ENGINES
+            ):
+                error_msg = (
+                    f"excel_engine must be one of {LoaderPandasExcel.ENGINES}, "
+                    f"got {self.excel_engine}"
+                )
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+            if self.excel_sidecar and is_remote(self.filepath):
+                error_msg = "excel_sidecar is only supported for local files"
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+
+        # 5. validate chunksize
+        if self.chunksize is not None:
+            if (
+                not isinstance(self.chunksize, int)
+                or isinstance(self.chunksize, bool)
+                or self.chunksize <= 0
+            ):
+                error_msg = (
+                    f"chunksize must be a positive integer, got {self.chunksize}"
+                )
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+            if self.file_ext_code not in LoaderFileExt.CHUNKABLE_TYPES:
+                error_msg = (
+                    f"chunksize is not supported for file extension: {self.file_ext}"
+                )
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+
+        # 6. validate usecols
+        if self.usecols is not None:
+            if isinstance(self.usecols, str):
+                if self.usecols != "schema":
+                    error_msg = (
+                        f"usecols must be a list of column names or 'schema', "
+                        f"got '{self.usecols}'"
+                    )
+                    self._logger.error(error_msg)
+                    raise ConfigError(error_msg)
+                if self.schema is None or not self.schema.attributes:
+                    error_msg = "usecols: 'schema' requires a schema with attributes"
+                    self._logger.error(error_msg)
+                    raise ConfigError(error_msg)
+            elif not isinstance(self.usecols, list) or not all(
+                isinstance(col, str) for col in self.usecols
+            ):
+                error_msg = (
+                    f"usecols must be a list of column names or 'schema', "
+                    f"got {self.usecols}"
+                )
+                self._logger.error(error_msg)
+                raise ConfigError(error_msg)
+
+        # 7. validate infer_sample_size
+        if self.infer_sample_size is not None and (
+            not isinstance(self.infer_sample_size, int)
+            or isinstance(self.infer_sample_size, bool)
+            or self.infer_sample_size <= 0
+        ):
+            error_msg = (
+                f"infer_sample_size must be a positive integer, "
+                f"got {self.infer_sample_size}"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        # 8. validate max_workers
+        if self.max_workers is not None and (
+            not isinstance(self.max_workers, int)
+            or isinstance(self.max_workers, bool)
+            or self.max_workers <= 0
+        ):
+            error_msg = (
+                f"max_workers must be a positive integer, got {self.max_workers}"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        # 9. validate row sampling
+        if self.sample_size is not None and (
+            not isinstance(self.sample_size, int)
+            or isinstance(self.sample_size, bool)
+            or self.sample_size <= 0
+        ):
+            error_msg = (
+                f"sample_size must be a positive integer, got {self.sample_size}"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+        if self.sample_fraction is not None and (
+            not isinstance(self.sample_fraction, int | float)
+            or isinstance(self.sample_fraction, bool)
+            or not 0.0 < self.sample_fraction <= 1.0
+        ):
+            error_msg = (
+                f"sample_fraction must be a number in (0, 1], "
+                f"got {self.sample_fraction}"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+        sampling_params = [
+            name
+            for name in ("nrows", "sample_size", "sample_fraction")
+            if getattr(self, name) is not None
+        ]
+        if len(sampling_params) > 1:
+            error_msg = f"Only one of {sampling_params} can be specified"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+        if self.random_state is not None and (
+            not isinstance(self.random_state, int)
+            or isinstance(self.random_state, bool)
+        ):
+            error_msg = f"random_state must be an integer, got {self.random_state}"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+        # An unseeded sample differs on every load, a cached copy would freeze it
+        if (
+            self.cache_dir is not None
+            and (self.sample_size is not None or self.sample_fraction is not None)
+            and self.random_state is None
+        ):
+            error_msg = (
+                "random_state is required when sample_size or sample_fraction "
+                "is used with cache_dir"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        # 10. validate memory_mode
+        if self.memory_mode not in self.MEMORY_MODES:
+            error_msg = (
+                f"memory_mode must be one of {self.MEMORY_MODES}, "
+                f"got {self.memory_mode}"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        # 11. validate column_types (using new Metadater architecture)
         if self.column_types is not None:
             self._logger.debug(f"Validating column types: {self.column_types}")
             valid_column_types = ["category", "datetime"]
@@ -123,7 +460,7 @@ class LoaderConfig(BaseConfig):
                     raise UnsupportedMethodError(error_msg)
             self._logger.debug("Column types validation passed")
 
-        # 5. validate schema parameter and check for conflicts
+        # 12. validate schema parameter and check for conflicts
         if self.schema is not None:
             self._logger.debug("Schema configuration provided")
             # SchemaConfig validation is handled by its own dataclass validation
@@ -153,6 +490,58 @@ class LoaderConfig(BaseConfig):
                         "No conflicts found between schema and column_types"
                     )
 
+    def _resolve_partitions(self, filepath_path: Path) -> list[str]:
+        """
+        List the partition files of a glob pattern or directory.
+
+        Files of a directory starting with "." or "_" (e.g. _SUCCESS markers)
+        are skipped. All partitions must share one file extension.
+
+        Args:
+            filepath_path (Path): Glob pattern or directory.
+
+        Return:
+            (list[str]) Sorted partition file paths.
+        """
+        if filepath_path.is_dir():
+            paths = [
+                path
+                for path in filepath_path.iterdir()
+                if path.is_file() and not path.name.startswith((".", "_"))
+            ]
+        else:
+            paths = [
+                Path(path)
+                for path in glob.glob(str(self.filepath), recursive=True)
+                if Path(path).is_file()
+            ]
+
+        if not paths:
+            error_msg = f"No files found for filepath: {self.filepath}"
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+
+        return sorted(str(path) for path in paths)
+
+    def _check_partition_formats(self) -> tuple[str, str | None]:
+        """
+        Check all partitions share one file extension and compression.
+
+        Return:
+            (tuple[str, str | None]) File extension and compression of the partitions.
+        """
+        formats = {
+            LoaderFileExt.split_compression(Path(path).name) for path in self.filepaths
+        }
+        if len(formats) > 1:
+            error_msg = (
+                f"All partitions must share one file extension, "
+                f"got {sorted(formats, key=str)} for filepath: {self.filepath}"
+            )
+            self._logger.error(error_msg)
+            raise ConfigError(error_msg)
+        return formats.pop()
+
 
 class Loader:
     """
@@ -165,6 +554,9 @@ class Loader:
     3. Data reading: Use pandas reader module to load data with proper configuration
     """
 
+    # Rows per chunk when streaming a file for row sampling without chunksize
+    SAMPLE_CHUNKSIZE: int = 100_000
+
     def __init__(
         self,
         filepath: str = None,
@@ -175,11 +567,34 @@ class Loader:
         | dict[str, str]
         | None = None,  # TODO: Deprecated in v2.0.0
         nrows: int | None = None,
+        chunksize: int | None = None,
+        usecols: list[str] | str | None = None,
         schema: Schema | dict | str | None = None,
+        cache_dir: str | None = None,
+        infer_sample_size: int | None = None,
+        max_workers: int | None = None,
+        sample_size: int | None = None,
+        sample_fraction: float | None = None,
+        random_state: int | None = None,
+        storage_options: dict | None = None,
+        excel_engine: str | None = None,
+        excel_sidecar: bool = False,
+        memory_mode: str = "default",
+        table: str | None = None,
+        query: str | None = None,
+        where: str | None = None,
+        params: list | tuple | dict | None = None,
+        connection: Any = None,
     ):
         """
         Args:
             filepath (str): The fullpath of dataset.
+                A glob pattern (e.g. "data/daily_*.csv") or a directory loads
+                every matching file as one dataset, see max_workers.
+                Compressed files (.gz, .bz2, .xz, .zst, .zip) are detected
+                from the suffix, e.g. "data.csv.gz", and decompressed while reading.
+                fsspec URLs (e.g. "s3://bucket/data.parquet") are read through
+                fsspec, see storage_options.
             column_types (dict ,optional): **DEPRECATED in v2.0.0 - will be removed**
                 The dictionary of column types and their corresponding column names,
                 formatted as {type: [colname]}
@@ -200,16 +615,99 @@ class Loader:
                 Useful for quickly testing with a subset of data to reduce memory usage.
                 Similar to pandas.read_csv's nrows parameter.
                 Default is None, which reads all rows.
+            chunksize (int, optional): Number of rows per chunk for streaming load.
+                The file is read chunk by chunk, the schema is inferred and merged
+                incrementally, and each chunk is compacted (integers downcast,
+                strings stored as category) before concatenation,
+                so peak memory stays close to the final frame.
+                Only supported for CSV and Parquet files.
+                Default is None, which reads the whole file at once.
+            usecols (list | str, optional): Columns to read from the file.
+                Can be a list of column names, or "schema" to read only
+                the attributes defined in schema.
+                The projection is pushed down to the file reader,
+                so other columns are never parsed.
+                Default is None, which reads all columns.
             schema (Schema | dict | str, optional): Schema configuration.
                 Can be one of:
                 - Schema object: Direct schema configuration
                 - dict: Dictionary that will be converted to Schema using from_dict()
                 - str: Path to YAML file containing schema configuration
                 Contains field definitions and global parameters for data processing.
+            cache_dir (str, optional): Directory of the loaded data cache.
+                The typed data and its schema are stored under a key of
+                the file SHA-256 and the loader options, later loads of
+                the same file and options read the cached copy instead of
+                parsing and inferring again. Requires pyarrow.
+                Default is None, which disables caching.
+            infer_sample_size (int, optional): Number of rows sampled for
+                schema inference of columns not defined in schema.
+                Category, precision and logical type are inferred from
+                a seeded uniform row sample, nullable and statistics stay exact.
+                Useful to keep inference time flat on very large inputs.
+                Default is None, which infers from all rows.
+            max_workers (int, optional): Number of threads reading the partitions
+                of a glob pattern or directory filepath concurrently.
+                Each partition is inferred and compacted as in chunked loading,
+                the partition schemas are merged and categorical columns
+                are concatenated with consistent categories.
+                Default is None, which uses the ThreadPoolExecutor default.
+            sample_size (int, optional): Number of rows to keep as a uniform
+                random sample of the whole file, unlike nrows taking its head.
+                The file is streamed in chunks (chunksize, or SAMPLE_CHUNKSIZE
+                rows) through reservoir sampling, so memory stays bounded by
+                sample_size plus one chunk. Rows keep their file order.
+                Default is None, which disables sampling.
+            sample_fraction (float, optional): Probability in (0, 1] of keeping
+                each row, streamed in chunks as sample_size (Bernoulli sampling).
+                Mutually exclusive with nrows and sample_size.
+                Default is None, which disables sampling.
+            random_state (int, optional): Seed of row sampling.
+                Required when sampling with cache_dir.
+                Default is None, which draws a different sample on every load.
+            storage_options (dict, optional): Options of the fsspec filesystem
+                of a URL filepath, e.g. {"anon": True} for public S3 buckets.
+                Requires fsspec.
+                Default is None, which uses the filesystem defaults.
+            excel_engine (str, optional): pandas Excel engine, e.g. "calamine"
+                or "openpyxl". "auto" uses calamine (much faster on large
+                sheets) when python-calamine is installed, otherwise openpyxl.
+                Default is None, which uses the pandas default engine.
+            excel_sidecar (bool, optional): Whether to convert an Excel file once
+                into a hidden Parquet sidecar next to it, keyed by the file
+                mtime, size and read options. Later loads read the sidecar
+                instead of parsing the workbook. Requires pyarrow.
+                Default is False.
+            memory_mode (str, optional): "compact" shrinks the loaded frame
+                right after reading: categorical strings become category,
+                integers the smallest width and floats float32 where the
+                schema precision survives it. Bytes before and after are
+                reported in the Status timing records.
+                Default is "default", which keeps the aligned dtypes.
+            table (str, optional): Table to read when filepath is a database URL,
+                e.g. "sqlite:///data.db". usecols and where are pushed into
+                the SQL query, and rows are fetched in batches of chunksize.
+                Default is None.
+            query (str, optional): SQL query to read instead of table.
+                Default is None.
+            where (str, optional): SQL condition filtering rows in the
+                database, e.g. "age >= 18". It is inserted into the query
+                as is, so it must be trusted SQL: pass values through
+                params instead, e.g. where="age >= ?" and params=[18].
+                Default is None.
+            params (list | tuple | dict, optional): Values bound to the
+                placeholders of where / query by cursor.execute, in the
+                paramstyle of the driver (sqlite3 uses ? or :name).
+                Default is None.
+            connection (optional): DB-API connection, or a callable returning
+                a new one, for database URLs other than sqlite://.
+                Default is None.
 
         Attributes:
             _logger (logging.Logger): The logger object.
             config (LoaderConfig): Configuration
+            memory_usage (dict): Bytes of the loaded frame before and after
+                compaction, None unless memory_mode is "compact".
         """
         self._logger: logging.Logger = logging.getLogger(
             f"PETsARD.{self.__class__.__name__}"
@@ -228,10 +726,28 @@ class Loader:
             header_names=header_names,
             na_values=na_values,
             nrows=nrows,
+            chunksize=chunksize,
+            usecols=usecols,
             schema=processed_schema,
             schema_path=schema_path,
+            cache_dir=cache_dir,
+            infer_sample_size=infer_sample_size,
+            max_workers=max_workers,
+            sample_size=sample_size,
+            sample_fraction=sample_fraction,
+            random_state=random_state,
+            storage_options=storage_options,
+            excel_engine=excel_engine,
+            excel_sidecar=excel_sidecar,
+            memory_mode=memory_mode,
+            table=table,
+            query=query,
+            where=where,
+            params=params,
+            connection=connection,
         )
         self._logger.debug("LoaderConfig successfully initialized")
+        self.memory_usage: dict[str, int] | None = None
 
     def _process_schema_parameter(
         self, schema: Schema | dict | str | None
@@ -322,18 +838,189 @@ class Loader:
         """
         self._logger.info(f"Loading data from {self.config.filepath}")
 
+        cache, cache_key = None, None
+        if self.config.cache_dir is not None:
+            cache = LoaderCache(self.config.cache_dir)
+            cache_key = cache.make_key(
+                self.config.filepaths or self.config.filepath,
+                {
+                    "column_types": self.config.column_types,
+                    "header_names": self.config.header_names,
+                    "na_values": self.config.na_values,
+                    "nrows": self.config.nrows,
+                    "chunksize": self.config.chunksize,
+                    "usecols": self.config.usecols,
+                    "schema": self.config.schema,
+                    "infer_sample_size": self.config.infer_sample_size,
+                    "sample_size": self.config.sample_size,
+                    "sample_fraction": self.config.sample_fraction,
+                    "random_state": self.config.random_state,
+                    "excel_engine": self.config.excel_engine,
+                    "excel_sidecar": self.config.excel_sidecar,
+                    "memory_mode": self.config.memory_mode,
+                },
+                storage_options=self.config.storage_options,
+            )
+            if cache_key is None:
+                self._logger.warning(
+                    "Loaded result is not reproducible, cache_dir is bypassed"
+                )
+                cache = None
+            else:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
         # 1: Schema processing - merge legacy parameters into schema
         merged_schema_config = self._merge_legacy_to_schema()
 
+        # Attributes outside an explicit column projection are not loaded
+        if isinstance(self.config.usecols, list) and merged_schema_config.attributes:
+            for attr_name in list(merged_schema_config.attributes):
+                if attr_name not in self.config.usecols:
+                    merged_schema_config = SchemaMetadater.remove(
+                        merged_schema_config, attr_name
+                    )
+
         # 2: Data reading using pandas reader module
-        data = self._read_data_with_pandas_reader(merged_schema_config)
+        inferred_schema = None
+        if (
+            self.config.sample_size is not None
+            or self.config.sample_fraction is not None
+        ):
+            data = self._read_sample(merged_schema_config)
+        elif self.config.filepaths is not None:
+            data, inferred_schema = self._read_partitions(merged_schema_config)
+        elif self.config.chunksize is not None:
+            data, inferred_schema = self._read_data_in_chunks(merged_schema_config)
+        else:
+            data = self._read_data_with_pandas_reader(merged_schema_config)
 
         # 3: Pass schema to metadater for validation and processing
-        schema_metadata = self._process_with_metadater(data, merged_schema_config)
+        schema_metadata = self._process_with_metadater(
+            data, merged_schema_config, inferred_schema
+        )
+
+        # 4: Shrink column dtypes so every downstream copy is cheaper
+        if self.config.memory_mode == "compact":
+            data = self._compact_data(data, schema_metadata)
+
+        if cache is not None:
+            cache.put(cache_key, data, schema_metadata)
 
         self._logger.info("Data loading completed successfully")
         return data, schema_metadata
 
+    def _compact_data(self, data: pd.DataFrame, schema: Schema) -> pd.DataFrame:
+        """
+        Shrink the column dtypes of the loaded data.
+
+        - Columns marked as category in schema become category.
+        - Integers take the smallest width, nullable integers stay nullable.
+        - Floats become float32 when all values rounded to the schema
+            precision survive the float32 round trip.
+
+        The elapsed time and the bytes before and after are logged as a
+        "compact" timing record of Loader, and kept in self.memory_usage.
+
+        Args:
+            data: Loaded dataframe
+            schema: Schema of the loaded dataframe
+
+        Returns:
+            pd.DataFrame: Compacted dataframe
+        """
+        start_time: float = time.time()
+        self._logger.info(f"TIMING_START|Loader|compact|{start_time}")
+        bytes_before = int(data.memory_usage(deep=True).sum())
+
+        attributes = schema.attributes if schema and schema.attributes else {}
+        compacted = {}
+        for col in data.columns:
+            series = data[col]
+            attribute = attributes.get(col)
+            type_attr = attribute.type_attr if attribute and attribute.type_attr else {}
+
+            if isinstance(series.dtype, pd.CategoricalDtype) or (
+                pd.api.types.is_bool_dtype(series)
+                or pd.api.types.is_datetime64_any_dtype(series)
+            ):
+                continue
+            if pd.api.types.is_integer_dtype(series):
+                compacted[col] = self._downcast_int(series)
+            elif pd.api.types.is_float_dtype(series):
+                compacted[col] = self._downcast_float(
+                    series, type_attr.get("precision")
+                )
+            elif type_attr.get("category") and (
+                pd.api.types.is_object_dtype(series)
+                or pd.api.types.is_string_dtype(series)
+            ):
+                compacted[col] = series.astype("category")
+
+        if compacted:
+            data = data.assign(**compacted)
+
+        bytes_after = int(data.memory_usage(deep=True).sum())
+        self.memory_usage = {
+            "memory_bytes_before": bytes_before,
+            "memory_bytes_after": bytes_after,
+        }
+        self._logger.info(
+            f"TIMING_END|Loader|compact|{time.time()}|{time.time() - start_time}|"
+            + ",".join(f"{key}={value}" for key, value in self.memory_usage.items())
+        )
+        self._logger.debug(
+            f"Compacted data from {bytes_before:,} to {bytes_after:,} bytes"
+        )
+        return data
+
+    @staticmethod
+    def _downcast_int(series: pd.Series) -> pd.Series:
+        """
+        Downcast an integer column to the smallest width holding its range.
+
+        Args:
+            series: Integer Series, numpy or nullable
+
+        Returns:
+            pd.Series: Downcast Series, nullable when series is nullable
+        """
+        import numpy as np
+
+        nullable = pd.api.types.is_extension_array_dtype(series)
+        if series.isna().all():
+            return series.astype("Int8") if nullable else series
+        min_val, max_val = series.min(), series.max()
+        for dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min <= min_val and max_val <= info.max:
+                name = np.dtype(dtype).name
+                return series.astype(name.capitalize() if nullable else name)
+        return series
+
+    @staticmethod
+    def _downcast_float(series: pd.Series, precision: int | None) -> pd.Series:
+        """
+        Downcast a float column to float32 when the schema precision allows it.
+
+        Args:
+            series: Float Series
+            precision: Decimal places kept by schema, None keeps float64
+
+        Returns:
+            pd.Series: float32 Series if every value rounded to precision
+                is unchanged by the float32 round trip, otherwise series
+        """
+        if precision is None or series.dtype == "float32":
+            return series
+        rounded = series.round(precision)
+        roundtrip = rounded.astype("float32").astype("float64").round(precision)
+        if ((roundtrip == rounded) | rounded.isna()).all():
+            nullable = pd.api.types.is_extension_array_dtype(series)
+            return series.astype("Float32" if nullable else "float32")
+        return series
+
     def _merge_legacy_to_schema(self) -> Schema:
         """
         Merge legacy column_types and na_values into Schema.
@@ -409,14 +1096,460 @@ class Loader:
         Returns:
             pd.DataFrame: Loaded dataframe
         """
-        from petsard.loader.loader_pandas import LoaderPandasCsv, LoaderPandasExcel
-
         self._logger.debug("Reading data using pandas loader classes")
 
+        loader_class, config = self._build_reader_config(schema)
+
+        try:
+            # Create loader instance and load data
+            try:
+                data = loader_class(config).load()
+            except UnableToLoadError:
+                relaxed_config = self._relax_dtype_pushdown(config)
+                if relaxed_config is None:
+                    raise
+                data = loader_class(relaxed_config).load()
+            data = data.fillna(pd.NA)
+            self._logger.debug(f"Successfully loaded data with shape: {data.shape}")
+            return data
+
+        except Exception as e:
+            error_msg = f"Failed to load data from {self.config.filepath}: {str(e)}"
+            self._logger.error(error_msg)
+            raise UnableToFollowMetadataError(error_msg) from e
+
+    def _read_sample(self, schema: Schema) -> pd.DataFrame:
+        """
+        Read a uniform random sample of rows, streaming the file in chunks.
+
+        With sample_size, every row draws a uniform random key and the rows
+        with the sample_size smallest keys are kept (reservoir sampling),
+        so only the reservoir and one chunk are held in memory.
+        With sample_fraction, each row is kept with that probability.
+        Partitions of a glob pattern / directory are streamed in order
+        as one file. Sampled rows keep their file order.
+
+        Args:
+            schema: Merged schema configuration
+
+        Returns:
+            pd.DataFrame: Sampled dataframe
+        """
+        self._logger.debug(
+            f"Sampling rows - sample_size: {self.config.sample_size}, "
+            f"sample_fraction: {self.config.sample_fraction}"
+        )
+
+        loader_class, config = self._build_reader_config(schema)
+        if self.config.file_ext_code in LoaderFileExt.CHUNKABLE_TYPES:
+            config["chunksize"] = self.config.chunksize or self.SAMPLE_CHUNKSIZE
+
+        try:
+            try:
+                data = self._sample_chunks(loader_class, config)
+            except UnableToLoadError:
+                relaxed_config = self._relax_dtype_pushdown(config)
+                if relaxed_config is None:
+                    raise
+                data = self._sample_chunks(loader_class, relaxed_config)
+        except Exception as e:
+            error_msg = f"Failed to load data from {self.config.filepath}: {str(e)}"
+            self._logger.error(error_msg)
+            raise UnableToFollowMetadataError(error_msg) from e
+
+        data = data.fillna(pd.NA)
+        self._logger.debug(f"Successfully sampled data with shape: {data.shape}")
+        return data
+
+    def _sample_chunks(self, loader_class: type, config: dict) -> pd.DataFrame:
+        """
+        Stream all chunks through the configured row sampling.
+
+        Args:
+            loader_class: Loader class supporting load_chunks()
+            config: Loader configuration
+
+        Returns:
+            pd.DataFrame: Sampled rows in file order
+        """
+        import numpy as np
+
+        rng = np.random.default_rng(self.config.random_state)
+        sample_size = self.config.sample_size
+
+        kept: list[pd.DataFrame] = []
+        reservoir_keys = np.empty(0, dtype="float64")
+        for filepath in self.config.filepaths or [config["filepath"]]:
+            for chunk in self._iter_frames(
+                loader_class, {**config, "filepath": filepath}
+            ):
+                keys = rng.random(len(chunk))
+                if sample_size is None:
+                    kept.append(chunk[keys < self.config.sample_fraction])
+                    continue
+
+                # Keep the sample_size smallest keys of reservoir and chunk,
+                # positions stay in file order once sorted
+                kept.append(chunk)
+                reservoir_keys = np.concatenate([reservoir_keys, keys])
+                if len(reservoir_keys) > sample_size:
+                    positions = np.sort(
+                        np.argpartition(reservoir_keys, sample_size - 1)[:sample_size]
+                    )
+                    kept = [self._concat_frames(kept).take(positions)]
+                    reservoir_keys = reservoir_keys[positions]
+
+        if not kept:
+            error_msg = f"No data found in {self.config.filepath}"
+            self._logger.error(error_msg)
+            raise UnableToFollowMetadataError(error_msg)
+        return self._concat_frames(kept)
+
+    def _read_data_in_chunks(self, schema: Schema) -> tuple[pd.DataFrame, Schema]:
+        """
+        Read data chunk by chunk, inferring the schema incrementally.
+
+        Each chunk is inferred by SchemaMetadater before being compacted:
+        integer columns are downcast to the smallest width
+        (when schema.enable_optimize_type is on) and string columns are stored
+        as category, so the chunks kept in memory are already optimized.
+        Categorical chunks are combined with union_categoricals,
+        and string columns that turn out not to be categorical are
+        converted back to object at the end.
+
+        Args:
+            schema: Merged schema configuration
+
+        Returns:
+            tuple[pd.DataFrame, Schema]: Loaded dataframe and the schema
+                inferred from the columns not defined in `schema`
+        """
+
+        self._logger.debug(f"Reading data in chunks of {self.config.chunksize} rows")
+
+        loader_class, config = self._build_reader_config(schema)
+        config["chunksize"] = self.config.chunksize
+
+        defined_columns = (
+            set(schema.attributes) if schema and schema.attributes else set()
+        )
+        optimize_type = schema.enable_optimize_type if schema else True
+
+        try:
+            chunks, inferred_schema = self._collect_chunks_with_retry(
+                loader_class, config, defined_columns, optimize_type
+            )
+        except Exception as e:
+            error_msg = f"Failed to load data from {self.config.filepath}: {str(e)}"
+            self._logger.error(error_msg)
+            raise UnableToFollowMetadataError(error_msg) from e
+
+        return self._concat_chunks(chunks, inferred_schema)
+
+    def _read_partitions(self, schema: Schema) -> tuple[pd.DataFrame, Schema]:
+        """
+        Read the partitions of a glob pattern or directory as one dataset.
+
+        Partitions are read concurrently by a thread pool, each one through
+        the chunked pipeline of _read_data_in_chunks (inferred, then compacted).
+        Partition schemas are merged in file order by SchemaMetadater.merge,
+        and all chunks are concatenated with union_categoricals,
+        so categorical columns share one dtype across partitions.
+        With nrows, partitions are read in order until nrows rows are loaded.
+
+        Args:
+            schema: Merged schema configuration
+
+        Returns:
+            tuple[pd.DataFrame, Schema]: Loaded dataframe and the schema
+                inferred from the columns not defined in `schema`
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._logger.debug(f"Reading {len(self.config.filepaths)} partitions")
+
+        loader_class, config = self._build_reader_config(schema)
+        if self.config.chunksize is not None:
+            config["chunksize"] = self.config.chunksize
+
+        defined_columns = (
+            set(schema.attributes) if schema and schema.attributes else set()
+        )
+        optimize_type = schema.enable_optimize_type if schema else True
+
+        def read_partition(
+            filepath: str, nrows: int | None = None
+        ) -> tuple[list[pd.DataFrame], Schema | None]:
+            partition_config = {**config, "filepath": filepath}
+            if nrows is not None:
+                partition_config["nrows"] = nrows
+            return self._collect_chunks_with_retry(
+                loader_class, partition_config, defined_columns, optimize_type
+            )
+
+        try:
+            if self.config.nrows is None:
+                with ThreadPoolExecutor(max_workers=self.config.max_workers) as pool:
+                    results = list(pool.map(read_partition, self.config.filepaths))
+            else:
+                results = []
+                remaining = self.config.nrows
+                for filepath in self.config.filepaths:
+                    if remaining <= 0:
+                        break
+                    results.append(read_partition(filepath, remaining))
+                    remaining -= sum(len(chunk) for chunk in results[-1][0])
+        except Exception as e:
+            error_msg = f"Failed to load data from {self.config.filepath}: {str(e)}"
+            self._logger.error(error_msg)
+            raise UnableToFollowMetadataError(error_msg) from e
+
+        chunks: list[pd.DataFrame] = []
+        inferred_schema: Schema | None = None
+        for filepath, (partition_chunks, partition_schema) in zip(
+            self.config.filepaths, results, strict=False
+        ):
+            if not partition_chunks:
+                continue
+            if chunks and list(partition_chunks[0].columns) != list(chunks[0].columns):
+                error_msg = (
+                    f"Partition {filepath} has columns "
+                    f"{list(partition_chunks[0].columns)}, "
+                    f"expected {list(chunks[0].columns)}"
+                )
+                self._logger.error(error_msg)
+                raise UnableToFollowMetadataError(error_msg)
+            chunks.extend(partition_chunks)
+            inferred_schema = (
+                partition_schema
+                if inferred_schema is None
+                else SchemaMetadater.merge(inferred_schema, partition_schema)
+            )
+
+        return self._concat_chunks(chunks, inferred_schema)
+
+    def _collect_chunks_with_retry(
+        self,
+        loader_class: type,
+        config: dict,
+        defined_columns: set[str],
+        optimize_type: bool,
+    ) -> tuple[list[pd.DataFrame], Schema | None]:
+        """
+        _collect_chunks, retried without integer dtype pushdown on failure.
+
+        Args:
+            loader_class: Loader class supporting load_chunks()
+            config: Loader configuration
+            defined_columns: Columns defined in schema, not inferred
+            optimize_type: Whether to downcast integer columns
+
+        Returns:
+            tuple[list[pd.DataFrame], Schema | None]: Compacted chunks and merged schema
+        """
+        try:
+            return self._collect_chunks(
+                loader_class, config, defined_columns, optimize_type
+            )
+        except UnableToLoadError:
+            relaxed_config = self._relax_dtype_pushdown(config)
+            if relaxed_config is None:
+                raise
+            return self._collect_chunks(
+                loader_class, relaxed_config, defined_columns, optimize_type
+            )
+
+    def _concat_chunks(
+        self, chunks: list[pd.DataFrame], inferred_schema: Schema | None
+    ) -> tuple[pd.DataFrame, Schema]:
+        """
+        Concatenate compacted chunks into the loaded dataframe.
+
+        Args:
+            chunks: Compacted chunks from _collect_chunks
+            inferred_schema: Schema merged over the chunks
+
+        Returns:
+            tuple[pd.DataFrame, Schema]: Loaded dataframe and inferred schema
+        """
+        if not chunks:
+            error_msg = f"No data found in {self.config.filepath}"
+            self._logger.error(error_msg)
+            raise UnableToFollowMetadataError(error_msg)
+
+        chunk_count = len(chunks)
+        data = self._concat_frames(chunks)
+        chunks.clear()
+
+        # Category inference needs the unique count of the whole column,
+        # which is exact from the merged categories
+        for col, attribute in inferred_schema.attributes.items():
+            series = data[col]
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                continue
+            unique_count = len(series.cat.categories) + int(series.isna().any())
+            is_category = len(series) > 0 and unique_count / len(series) < 0.05
+            attribute.type_attr["category"] = is_category
+            if not is_category:
+                data[col] = series.astype("object")
+
+        self._logger.debug(
+            f"Successfully loaded data with shape: {data.shape} from {chunk_count} chunks"
+        )
+        return data, inferred_schema
+
+    @staticmethod
+    def _concat_frames(frames: list[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenate frames column by column, keeping categorical columns compact.
+
+        Categorical columns are combined with union_categoricals,
+        so frames with different categories still give one categorical dtype.
+
+        Args:
+            frames: Frames sharing the same columns
+
+        Returns:
+            pd.DataFrame: Concatenated frame with a fresh RangeIndex
+        """
+        from pandas.api.types import union_categoricals
+
+        columns = {}
+        for col in frames[0].columns:
+            parts = [frame[col] for frame in frames]
+            if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+                columns[col] = pd.Series(
+                    union_categoricals(parts, ignore_order=True), name=col
+                )
+            else:
+                columns[col] = pd.concat(parts, ignore_index=True)
+        return pd.DataFrame(columns)
+
+    @staticmethod
+    def _iter_frames(loader_class: type, config: dict) -> Iterator[pd.DataFrame]:
+        """
+        Read a file chunk by chunk when config has chunksize, otherwise at once.
+
+        Args:
+            loader_class: Loader class supporting load_chunks()
+            config: Loader configuration
+
+        Returns:
+            Iterator[pd.DataFrame]: Data by chunks
+        """
+        loader = loader_class(config)
+        if config.get("chunksize"):
+            yield from loader.load_chunks()
+        else:
+            yield loader.load()
+
+    def _collect_chunks(
+        self,
+        loader_class: type,
+        config: dict,
+        defined_columns: set[str],
+        optimize_type: bool,
+    ) -> tuple[list[pd.DataFrame], Schema | None]:
+        """
+        Read all chunks, inferring and merging the schema of undefined columns
+        and compacting each chunk before keeping it.
+
+        Args:
+            loader_class: Loader class supporting load_chunks()
+            config: Loader configuration
+            defined_columns: Columns defined in schema, not inferred
+            optimize_type: Whether to downcast integer columns
+
+        Returns:
+            tuple[list[pd.DataFrame], Schema | None]: Compacted chunks and merged schema
+        """
+        from petsard.metadater import AttributeMetadater
+
+        chunks: list[pd.DataFrame] = []
+        inferred_schema: Schema | None = None
+        for chunk in self._iter_frames(loader_class, config):
+            chunk = chunk.fillna(pd.NA)
+
+            # Infer schema of this chunk and merge it incrementally
+            chunk_schema = SchemaMetadater.from_data(
+                chunk[[col for col in chunk.columns if col not in defined_columns]],
+                infer_sample_size=self.config.infer_sample_size,
+            )
+            inferred_schema = (
+                chunk_schema
+                if inferred_schema is None
+                else SchemaMetadater.merge(inferred_schema, chunk_schema)
+            )
+
+            # Compact chunk before keeping it
+            for col in chunk.columns:
+                series = chunk[col]
+                if series.dtype == "object":
+                    chunk[col] = series.astype("category")
+                elif (
+                    optimize_type
+                    and pd.api.types.is_integer_dtype(series)
+                    and not pd.api.types.is_extension_array_dtype(series)
+                ):
+                    chunk[col] = AttributeMetadater._optimize_int_dtype(series)
+            chunks.append(chunk)
+        return chunks, inferred_schema
+
+    def _relax_dtype_pushdown(self, config: dict) -> dict | None:
+        """
+        Drop integer dtypes pushed to the reader, used to retry a failed read.
+
+        Integer columns holding non-integral values or missing values
+        cannot be parsed as integer dtypes directly,
+        they are read as float and converted in align stage instead.
+
+        Args:
+            config: Loader configuration
+
+        Returns:
+            dict | None: Configuration without integer dtypes,
+                None if no integer dtype was pushed
+        """
+        dtype_dict = config.get("dtype") or {}
+        int_columns = [
+            col for col, dtype in dtype_dict.items() if dtype in ["Int64", "int64"]
+        ]
+        if not int_columns:
+            return None
+
+        self._logger.warning(
+            f"Failed to read columns {int_columns} as integer, "
+            "retrying without integer dtype pushdown"
+        )
+        relaxed_dtype = {
+            col: dtype for col, dtype in dtype_dict.items() if col not in int_columns
+        }
+        relaxed_config = {k: v for k, v in config.items() if k != "dtype"}
+        if relaxed_dtype:
+            relaxed_config["dtype"] = relaxed_dtype
+        return relaxed_config
+
+    def _build_reader_config(self, schema: Schema) -> tuple[type, dict]:
+        """
+        Select the loader class and build its configuration.
+
+        Args:
+            schema: Merged schema configuration
+
+        Returns:
+            tuple[type, dict]: Loader class and configuration for the loader
+        """
+        from petsard.loader.loader_arrow import LoaderArrow
+        from petsard.loader.loader_database import LoaderDatabase
+        from petsard.loader.loader_pandas import LoaderPandasCsv
+
         # Map file extension codes to loader classes
         loaders_map = {
             LoaderFileExt.CSVTYPE: LoaderPandasCsv,
             LoaderFileExt.EXCELTYPE: LoaderPandasExcel,
+            LoaderFileExt.PARQUETTYPE: LoaderArrow,
+            LoaderFileExt.ARROWTYPE: LoaderArrow,
+            LoaderFileExt.DATABASETYPE: LoaderDatabase,
         }
 
         if self.config.file_ext_code not in loaders_map:
@@ -432,11 +1565,42 @@ class Loader:
             "header_names": self.config.header_names,
         }
 
+        # Decompress while reading, and open fsspec URLs with their options
+        if self.config.compression is not None:
+            config["compression"] = self.config.compression
+        if self.config.storage_options is not None:
+            config["storage_options"] = self.config.storage_options
+
         # Add nrows parameter if specified
         if self.config.nrows is not None:
             config["nrows"] = self.config.nrows
             self._logger.info(f"Reading only first {self.config.nrows} rows")
 
+        # Push column projection down to the reader
+        if self.config.usecols is not None:
+            if self.config.usecols == "schema":
+                config["usecols"] = list(schema.attributes.keys())
+            else:
+                config["usecols"] = list(self.config.usecols)
+            self._logger.debug(f"Reading only columns: {config['usecols']}")
+
+        if loader_class is LoaderPandasExcel:
+            if self.config.excel_engine is not None:
+                config["engine"] = self.config.excel_engine
+            config["sidecar"] = self.config.excel_sidecar
+
+        # Table / query and row filter are pushed into the SQL query
+        if loader_class is LoaderDatabase:
+            for key in ("table", "query", "where", "params", "connection"):
+                if getattr(self.config, key) is not None:
+                    config[key] = getattr(self.config, key)
+
+        # Arrow-based loaders are typed by the file itself,
+        # Schema attribute types are mapped onto Arrow types directly
+        if loader_class is LoaderArrow:
+            config["schema"] = schema
+            return loader_class, config
+
         # Handle legacy na_values (takes precedence over schema na_values for backward compatibility)
         if self.config.na_values is not None:
             config["na_values"] = self.config.na_values
@@ -456,15 +1620,26 @@ class Loader:
         # Handle schema-based dtype configuration
         if schema and schema.attributes:
             for attr_name, attribute in schema.attributes.items():
-                if attribute.type:
+                type_attr = attribute.type_attr or {}
+                if type_attr.get("category") and attribute.type in [
+                    None,
+                    "str",
+                    "string",
+                ]:
+                    # Categorical strings are parsed straight into category
+                    dtype_dict[attr_name] = "category"
+                elif attribute.type:
                     # Map schema types to pandas dtypes
                     if attribute.type == "string":
                         dtype_dict[attr_name] = str
                     elif "int" in attribute.type:
-                        # Don't set dtype for int columns during read to avoid casting issues
-                        # Let pandas read them as float64 first, then convert in align stage
-                        # This allows handling of float-like integers (e.g., "1.0") and na_values
-                        pass
+                        # Push (nullable) integer dtype to the reader,
+                        # float-like integers (e.g., "1.0") and na_values are parsed fine.
+                        # If the column holds real decimals the read is retried
+                        # without integer dtypes, see _relax_dtype_pushdown
+                        dtype_dict[attr_name] = (
+                            "Int64" if type_attr.get("nullable", True) else "int64"
+                        )
                     elif "float" in attribute.type:
                         dtype_dict[attr_name] = float
                     elif attribute.type == "boolean":
@@ -486,35 +1661,46 @@ class Loader:
                 config["na_values"] = na_values_dict
                 self._logger.debug(f"Using schema-based na_values: {na_values_dict}")
 
-        try:
-            # Create loader instance and load data
-            loader = loader_class(config)
-            data = loader.load().fillna(pd.NA)
-            self._logger.debug(f"Successfully loaded data with shape: {data.shape}")
-            return data
+        return loader_class, config
 
-        except Exception as e:
-            error_msg = f"Failed to load data from {self.config.filepath}: {str(e)}"
-            self._logger.error(error_msg)
-            raise UnableToFollowMetadataError(error_msg) from e
-
-    def _process_with_metadater(self, data: pd.DataFrame, schema: Schema) -> Schema:
+    def _process_with_metadater(
+        self,
+        data: pd.DataFrame,
+        schema: Schema,
+        inferred_schema: Schema | None = None,
+    ) -> Schema:
         """
         Process data and schema with metadater.
 
         Args:
             data: Loaded dataframe
             schema: Merged schema configuration
+            inferred_schema: Schema already inferred while reading (e.g. chunked load),
+                used instead of re-inferring columns not defined in `schema`
 
         Returns:
             Schema: Schema metadata
         """
         self._logger.debug("Processing with metadater")
 
+        # Columns already inferred while reading act as base attributes,
+        # they never overlap with attributes defined in schema
+        if inferred_schema is not None and schema is not None and schema.attributes:
+            schema = Schema(
+                **{
+                    **schema.__dict__,
+                    "attributes": {**schema.attributes, **inferred_schema.attributes},
+                }
+            )
+
         # If no schema exists, create one from data
         if schema is None or not schema.attributes:
             try:
-                schema = SchemaMetadater.from_data(data, base_schema=None)
+                schema = SchemaMetadater.from_data(
+                    data,
+                    base_schema=inferred_schema,
+                    infer_sample_size=self.config.infer_sample_size,
+                )
                 # Attributes can now be directly modified (frozen removed)
                 schema.id = self.config.file_name or "inferred_schema"
                 schema.name = self.config.base_name or "Inferred Schema"
@@ -528,7 +1714,11 @@ class Loader:
             # If schema has precision defined, use that precision without inferring from data
             try:
                 # Pass base_schema to from_data, it will correctly inherit all attributes (type, category, nullable, precision, etc.)
-                inferred_schema = SchemaMetadater.from_data(data, base_schema=schema)
+                inferred_schema = SchemaMetadater.from_data(
+                    data,
+                    base_schema=schema,
+                    infer_sample_size=self.config.infer_sample_size,
+                )
 
                 # Use inferred_schema directly, as it has correctly inherited all base_schema attributes
                 # Preserve original schema's metadata (id, name, description, etc.)
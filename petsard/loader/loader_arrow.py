@@ -0,0 +1,271 @@
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pandas as pd
+
+from petsard.exceptions import ConfigError, UnableToLoadError
+from petsard.loader.loader_base import LoaderBase
+from petsard.loader.loader_remote import is_remote, open_remote
+from petsard.metadater import Schema
+
+
+def _import_pyarrow():
+    """
+    Import pyarrow lazily, since it is an optional dependency.
+
+    Return:
+        (module) pyarrow module
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ConfigError(
+            "pyarrow is required to read Parquet / Feather / Arrow files. "
+            "Please install it with: pip install petsard[parquet]"
+        ) from e
+    return pa
+
+
+def schema_to_arrow_types(schema: Schema | None) -> dict:
+    """
+    Map Schema attribute types onto Arrow types.
+
+    Only attributes with a simplified type (int, float, str, date, datetime)
+    are mapped, categorical attributes become dictionary-encoded strings,
+    so they are converted to pandas category without a second pass.
+
+    Args:
+        schema (Schema): Schema configuration, None for no mapping.
+
+    Return:
+        (dict) {column name: pyarrow.DataType}
+    """
+    if schema is None or not schema.attributes:
+        return {}
+
+    pa = _import_pyarrow()
+
+    arrow_types = {}
+    for attr_name, attribute in schema.attributes.items():
+        is_category = bool(attribute.type_attr and attribute.type_attr.get("category"))
+        if is_category and attribute.type == "str":
+            arrow_types[attr_name] = pa.dictionary(pa.int32(), pa.string())
+        elif attribute.type == "int":
+            arrow_types[attr_name] = pa.int64()
+        elif attribute.type == "float":
+            arrow_types[attr_name] = pa.float64()
+        elif attribute.type == "str":
+            arrow_types[attr_name] = pa.string()
+        elif attribute.type in ["date", "datetime"]:
+            arrow_types[attr_name] = pa.timestamp("ns")
+    return arrow_types
+
+
+class LoaderArrow(LoaderBase):
+    """
+    LoaderArrow
+        pyarrow implementing of Loader, for Parquet and Feather / Arrow IPC files.
+
+        Column projection (config["usecols"]) is pushed down to the file reader,
+        and Schema attribute types (config["schema"]) are applied on the Arrow table
+        before converting to pandas.
+
+        Compressed files (config["compression"]) are decompressed into memory,
+        since Parquet readers need random access to the footer.
+        fsspec URLs are opened as seekable files with config["storage_options"].
+    """
+
+    PARQUET_EXTS: tuple[str, ...] = (".parquet",)
+
+    def __init__(self, config: dict):
+        """
+        Args:
+            config (dict): The configuration for the loader modules.
+
+        Attr:
+            config (dict): The configuration for the loader modules.
+        """
+        super().__init__(config)
+
+    def load(self) -> pd.DataFrame:
+        """
+        Load and return the data
+
+        Return:
+            (pd.DataFrame)
+                Data in parquet / feather / arrow by pd.DataFrame format.
+        """
+        filepath = self.config["filepath"]
+
+        try:
+            with self._open_source() as source:
+                if self._is_parquet():
+                    table = self._read_parquet_table(source)
+                else:
+                    table = self._read_ipc_table(source)
+            return self._to_pandas(table)
+        except ConfigError:
+            raise
+        except Exception as e:
+            raise UnableToLoadError(
+                f"Failed to load Arrow file: {filepath}", filepath=filepath
+            ) from e
+
+    def load_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Load the data chunk by chunk
+
+        Parquet files are read batch by batch of config["chunksize"] rows,
+        other formats are loaded at once.
+
+        Return:
+            (Iterator[pd.DataFrame])
+                Data by pd.DataFrame chunks.
+        """
+        if not self._is_parquet() or not self.config.get("chunksize"):
+            yield self.load()
+            return
+
+        pa = _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        filepath = self.config["filepath"]
+        nrows = self.config.get("nrows")
+
+        try:
+            with self._open_source() as source:
+                parquet_file = pq.ParquetFile(source)
+                remaining = nrows
+                for batch in parquet_file.iter_batches(
+                    batch_size=self.config["chunksize"],
+                    columns=self.config.get("usecols"),
+                ):
+                    if remaining is not None:
+                        if remaining <= 0:
+                            break
+                        batch = batch.slice(0, remaining)
+                        remaining -= batch.num_rows
+                    yield self._to_pandas(pa.Table.from_batches([batch]))
+        except ConfigError:
+            raise
+        except Exception as e:
+            raise UnableToLoadError(
+                f"Failed to load Arrow file: {filepath}", filepath=filepath
+            ) from e
+
+    def _is_parquet(self) -> bool:
+        """
+        Whether the file is a Parquet file, otherwise Feather / Arrow IPC
+        """
+        filepath = str(self.config["filepath"]).lower()
+        if self.config.get("compression") is not None:
+            filepath = os.path.splitext(filepath)[0]
+        return filepath.endswith(self.PARQUET_EXTS)
+
+    @contextmanager
+    def _open_source(self):
+        """
+        Open the file as a pyarrow readable source
+
+        Local uncompressed files are passed as paths, so they are memory-mapped.
+
+        Return:
+            (Iterator) File path, file object or pyarrow.BufferReader
+        """
+        filepath = self.config["filepath"]
+        compression = self.config.get("compression")
+
+        if not is_remote(filepath):
+            if compression is None:
+                yield filepath
+            else:
+                pa = _import_pyarrow()
+                with pa.input_stream(filepath, compression=compression) as stream:
+                    yield pa.BufferReader(stream.read_buffer())
+            return
+
+        with open_remote(filepath, self.config.get("storage_options")) as f:
+            if compression is None:
+                yield f
+            else:
+                pa = _import_pyarrow()
+                with pa.input_stream(f, compression=compression) as stream:
+                    yield pa.BufferReader(stream.read_buffer())
+
+    def _read_parquet_table(self, source):
+        """
+        Read Parquet file as pyarrow.Table, honoring usecols and nrows
+        """
+        pa = _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        columns = self.config.get("usecols")
+        nrows = self.config.get("nrows")
+
+        if nrows is None:
+            return pq.read_table(source, columns=columns, memory_map=True)
+
+        # Only read the row batches needed for the first nrows rows
+        batches = []
+        remaining = nrows
+        parquet_file = pq.ParquetFile(source, memory_map=True)
+        for batch in parquet_file.iter_batches(columns=columns):
+            if remaining <= 0:
+                break
+            batch = batch.slice(0, remaining)
+            remaining -= batch.num_rows
+            batches.append(batch)
+        if not batches:
+            return parquet_file.schema_arrow.empty_table().select(
+                columns or parquet_file.schema_arrow.names
+            )
+        return pa.Table.from_batches(batches)
+
+    def _read_ipc_table(self, source):
+        """
+        Read Feather / Arrow IPC file as pyarrow.Table, honoring usecols and nrows
+        """
+        _import_pyarrow()
+        import pyarrow.feather as feather
+
+        table = feather.read_table(
+            source,
+            columns=self.config.get("usecols"),
+            memory_map=True,
+        )
+        if self.config.get("nrows") is not None:
+            table = table.slice(0, self.config["nrows"])
+        return table
+
+    def _to_pandas(self, table) -> pd.DataFrame:
+        """
+        Apply header names and Schema attribute types, then convert to pandas
+
+        Columns failing to cast to the mapped Arrow type are kept as stored,
+        and left to be aligned by Metadater.
+
+        Args:
+            table (pyarrow.Table): Table read from file
+
+        Return:
+            (pd.DataFrame)
+        """
+        pa = _import_pyarrow()
+
+        if self.config.get("header_names") is not None:
+            table = table.rename_columns(self.config["header_names"])
+
+        arrow_types = schema_to_arrow_types(self.config.get("schema"))
+        for idx, field in enumerate(table.schema):
+            target_type = arrow_types.get(field.name)
+            if target_type is None or field.type.equals(target_type):
+                continue
+            try:
+                table = table.set_column(
+                    idx, field.name, table.column(idx).cast(target_type)
+                )
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                continue
+
+        return table.to_pandas()
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 import pandas as pd
 
@@ -28,3 +29,11 @@ class LoaderBase(ABC):
         Load and return the data
         """
         raise NotImplementedError()
+
+    def load_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Load the data as an iterator of DataFrame chunks.
+
+        Loaders without native chunked reading yield the whole data once.
+        """
+        yield self.load()
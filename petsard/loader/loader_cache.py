@@ -0,0 +1,269 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+
+import pandas as pd
+
+from petsard.loader.benchmarker import digest_sha256
+from petsard.loader.loader_arrow import _import_pyarrow
+from petsard.loader.loader_remote import digest_remote_sha256, is_remote
+from petsard.metadater import Schema
+
+
+class LoaderCache:
+    """
+    Content-addressed on-disk cache of loaded data and its Schema.
+
+    Each entry is a directory named by the cache key, holding the typed data
+    as an uncompressed Feather file (so it can be memory-mapped on read),
+    the pickled Schema and the pickled pandas dtypes of the data.
+    The key is the SHA-256 of the source file content together with every
+    loader option that changes the loaded result, so editing the file or the
+    configuration never returns a stale entry.
+
+    Arrow does not keep every pandas dtype, e.g. object columns of Timestamps
+    come back as datetime64, so the original dtypes and the missing value of
+    object columns are restored on read. Data that still does not read back
+    equal to what was loaded is not cached.
+    """
+
+    # Bump when the stored layout or the loading semantics change
+    CACHE_VERSION: int = 2
+
+    DATA_FILENAME: str = "data.feather"
+    SCHEMA_FILENAME: str = "schema.pkl"
+    DTYPES_FILENAME: str = "dtypes.pkl"
+
+    # Schema fields not affecting the loaded result
+    VOLATILE_FIELDS: tuple[str, ...] = ("created_at", "updated_at")
+
+    # Options drawing a random result, mapped to the seed making it reproducible
+    SEEDED_OPTIONS: dict[str, str] = {
+        "sample_size": "random_state",
+        "sample_fraction": "random_state",
+    }
+
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir (str): Directory to store the cache entries.
+
+        Attr:
+            _logger (logging.Logger): The logger object.
+            cache_dir (Path): Directory to store the cache entries.
+        """
+        self._logger: logging.Logger = logging.getLogger(
+            f"PETsARD.{self.__class__.__name__}"
+        )
+        self.cache_dir: Path = Path(cache_dir)
+
+    def make_key(
+        self,
+        filepath: str | list[str],
+        options: dict,
+        storage_options: dict | None = None,
+    ) -> str | None:
+        """
+        Build the cache key of a loading request.
+
+        A request whose result is random by configuration, i.e. an option of
+        SEEDED_OPTIONS set without its seed, has no key, since caching it
+        would return the same draw on every later load.
+
+        Args:
+            filepath (str | list[str]): Source file path, or the partition paths.
+                fsspec URLs are digested through fsspec.
+            options (dict): Loader options affecting the loaded result.
+                Schema values are reduced to their content, timestamps excluded.
+            storage_options (dict, optional): Filesystem options of fsspec URLs,
+                only used to read them, never part of the key.
+
+        Return:
+            (str | None) SHA-256 hex digest used as the cache key,
+                None if the request is not reproducible and must not be cached.
+        """
+        unseeded = [
+            option
+            for option, seed in self.SEEDED_OPTIONS.items()
+            if options.get(option) is not None and options.get(seed) is None
+        ]
+        if unseeded:
+            self._logger.debug(f"Not cacheable without a seed: {unseeded}")
+            return None
+
+        payload = {
+            "cache_version": self.CACHE_VERSION,
+            "pandas_version": pd.__version__,
+            "file_sha256": (
+                self._digest(filepath, storage_options)
+                if isinstance(filepath, str)
+                else [self._digest(path, storage_options) for path in filepath]
+            ),
+            "file_ext": Path(
+                filepath if isinstance(filepath, str) else filepath[0]
+            ).suffix.lower(),
+            "options": {key: self._normalize(value) for key, value in options.items()},
+        }
+        serialized = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> tuple[pd.DataFrame, Schema] | None:
+        """
+        Read a cache entry.
+
+        Args:
+            key (str): Cache key from make_key().
+
+        Return:
+            (tuple[pd.DataFrame, Schema] | None)
+                The cached data and schema, None if missing or unreadable.
+        """
+        entry_dir = self.cache_dir / key
+        if not all(
+            (entry_dir / filename).exists()
+            for filename in (
+                self.DATA_FILENAME,
+                self.SCHEMA_FILENAME,
+                self.DTYPES_FILENAME,
+            )
+        ):
+            self._logger.debug(f"Cache miss: {key}")
+            return None
+
+        try:
+            data = self._read_data(entry_dir)
+            with open(entry_dir / self.SCHEMA_FILENAME, "rb") as f:
+                schema = pickle.load(f)
+        except Exception as e:
+            self._logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+        self._logger.info(f"Loaded data from cache: {entry_dir}")
+        return data, schema
+
+    def put(self, key: str, data: pd.DataFrame, schema: Schema) -> None:
+        """
+        Write a cache entry.
+
+        The entry is written into a temporary directory and renamed into place,
+        so concurrent runs never read a partial entry. The written entry is
+        read back once, and data that Arrow cannot store (e.g. mixed-type
+        object columns) or that does not read back equal, dtypes and missing
+        values included (e.g. object columns mixing None and pd.NA),
+        is not cached.
+
+        Args:
+            key (str): Cache key from make_key().
+            data (pd.DataFrame): Loaded data.
+            schema (Schema): Schema of the loaded data.
+        """
+        _import_pyarrow()
+        import pyarrow.feather as feather
+
+        entry_dir = self.cache_dir / key
+        if entry_dir.exists():
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=self.cache_dir))
+        try:
+            data = data.reset_index(drop=True)
+            feather.write_feather(
+                data,
+                str(tmp_dir / self.DATA_FILENAME),
+                compression="uncompressed",
+            )
+            with open(tmp_dir / self.DTYPES_FILENAME, "wb") as f:
+                pickle.dump(
+                    {
+                        "dtypes": data.dtypes.to_dict(),
+                        "na_values": self._object_na_values(data),
+                    },
+                    f,
+                )
+            if not self._read_data(tmp_dir).equals(data):
+                self._logger.warning(
+                    "Unable to cache loaded data: it does not read back unchanged"
+                )
+                return
+            with open(tmp_dir / self.SCHEMA_FILENAME, "wb") as f:
+                pickle.dump(schema, f)
+            os.replace(tmp_dir, entry_dir)
+            self._logger.info(f"Saved data to cache: {entry_dir}")
+        except Exception as e:
+            self._logger.warning(f"Unable to cache loaded data: {e}")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _read_data(self, entry_dir: Path) -> pd.DataFrame:
+        """
+        Read the data of an entry with its original pandas dtypes.
+
+        Args:
+            entry_dir (Path): Directory of the cache entry.
+
+        Return:
+            (pd.DataFrame) Data as it was loaded.
+        """
+        _import_pyarrow()
+        import pyarrow.feather as feather
+
+        data = feather.read_table(
+            str(entry_dir / self.DATA_FILENAME), memory_map=True
+        ).to_pandas()
+        with open(entry_dir / self.DTYPES_FILENAME, "rb") as f:
+            stored = pickle.load(f)
+
+        for col, dtype in stored["dtypes"].items():
+            if data[col].dtype != dtype:
+                data[col] = data[col].astype(dtype)
+        # Arrow reads every missing value of object columns back as None
+        for col, na_value in stored["na_values"].items():
+            values = data[col].to_numpy(dtype=object, copy=True)
+            values[pd.isna(values)] = na_value
+            data[col] = pd.Series(values, index=data.index, dtype=object)
+        return data
+
+    @staticmethod
+    def _object_na_values(data: pd.DataFrame) -> dict:
+        """
+        Missing value of each object column with missing values, e.g. pd.NA
+        """
+        na_values: dict = {}
+        for col in data.columns:
+            series = data[col]
+            if series.dtype == object:
+                missing = series[series.isna()]
+                if not missing.empty:
+                    na_values[col] = missing.iloc[0]
+        return na_values
+
+    def _digest(self, filepath: str, storage_options: dict | None = None) -> str:
+        """
+        SHA-256 of a source file, local or fsspec URL
+        """
+        if is_remote(filepath):
+            return digest_remote_sha256(filepath, storage_options)
+        return digest_sha256(filepath)
+
+    def _normalize(self, value):
+        """
+        Reduce a loader option to JSON-serializable content
+        """
+        if is_dataclass(value):
+            value = asdict(value)
+        if isinstance(value, dict):
+            return {
+                str(k): self._normalize(v)
+                for k, v in value.items()
+                if k not in self.VOLATILE_FIELDS
+            }
+        if isinstance(value, (list, tuple)):
+            return [self._normalize(v) for v in value]
+        return value
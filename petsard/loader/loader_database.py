@@ -0,0 +1,321 @@
+import re
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+from petsard.exceptions import ConfigError, UnableToLoadError
+from petsard.loader.loader_base import LoaderBase
+
+# URL protocols of database sources, connected through DB-API
+DATABASE_PROTOCOLS: tuple[str, ...] = (
+    "sqlite",
+    "postgresql",
+    "postgres",
+    "mysql",
+    "mariadb",
+    "mssql",
+    "oracle",
+    "duckdb",
+)
+
+# Protocols connected natively, others need a DB-API connection
+NATIVE_DATABASE_PROTOCOLS: tuple[str, ...] = ("sqlite",)
+
+
+def database_protocol(filepath) -> str | None:
+    """
+    Get the database protocol of filepath, e.g. "sqlite" of "sqlite:///data.db".
+
+    Args:
+        filepath (str): File path or URL.
+
+    Return:
+        (str | None) Lower-cased protocol, None if filepath is not a database URL.
+    """
+    match = re.match(r"^([a-zA-Z][a-zA-Z0-9+.\-]*)://", str(filepath))
+    if match is None:
+        return None
+    # Driver suffixes, e.g. postgresql+psycopg://
+    protocol = match.group(1).lower().split("+")[0]
+    return protocol if protocol in DATABASE_PROTOCOLS else None
+
+
+def is_database(filepath) -> bool:
+    """
+    Whether filepath is a database URL, e.g. "sqlite:///data.db".
+
+    Args:
+        filepath (str): File path or URL.
+
+    Return:
+        (bool) True for URLs with a database protocol.
+    """
+    return database_protocol(filepath) is not None
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Quote a (dotted) SQL identifier, e.g. main.users -> "main"."users".
+
+    Args:
+        name (str): Table or column name.
+
+    Return:
+        (str) ANSI double-quoted identifier.
+    """
+    return ".".join('"' + part.replace('"', '""') + '"' for part in name.split("."))
+
+
+class LoaderDatabase(LoaderBase):
+    """
+    LoaderDatabase
+        DB-API implementing of Loader, for query results of databases.
+
+        The query is built from config["table"] or config["query"],
+        with column projection (config["usecols"]) and row filtering
+        (config["where"]) pushed into the SQL, so only the needed rows and
+        columns leave the database. config["where"] and config["query"] are
+        trusted SQL inserted as is; values go through config["params"],
+        which the driver binds to their placeholders. Rows are fetched in batches of
+        config["chunksize"] through cursor.fetchmany, and reading stops after
+        config["nrows"] rows, so drivers with server-side cursors never send
+        the rest of the result.
+
+        "sqlite:///path/to/file.db" URLs are opened read-only with sqlite3,
+        other databases are read through config["connection"], a DB-API
+        connection or a callable returning a new one.
+        Schema attribute types (config["dtype"]) are applied on every batch.
+    """
+
+    # Rows fetched at one time when config["chunksize"] is not set
+    BATCH_SIZE: int = 10_000
+    # Alias of a query wrapped as a subquery, without AS, which Oracle rejects
+    SUBQUERY_ALIAS: str = "petsard_source"
+
+    def __init__(self, config: dict):
+        """
+        Args:
+            config (dict): The configuration for the loader modules.
+
+        Attr:
+            config (dict): The configuration for the loader modules.
+        """
+        super().__init__(config)
+
+    def load(self) -> pd.DataFrame:
+        """
+        Load and return the data
+
+        Return:
+            (pd.DataFrame)
+                Query result by pd.DataFrame format.
+        """
+        filepath = self.config["filepath"]
+
+        try:
+            with self._cursor() as cursor:
+                columns = [column[0] for column in cursor.description]
+                rows = [row for batch in self._fetch_batches(cursor) for row in batch]
+            return self._to_frame(rows, columns)
+        except Exception as e:
+            raise UnableToLoadError(
+                f"Failed to load database query: {filepath}", filepath=filepath
+            ) from e
+
+    def load_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Load the data chunk by chunk
+
+        Return:
+            (Iterator[pd.DataFrame])
+                Query result by pd.DataFrame chunks of config["chunksize"] rows.
+        """
+        filepath = self.config["filepath"]
+
+        try:
+            with self._cursor() as cursor:
+                columns = [column[0] for column in cursor.description]
+                for batch in self._fetch_batches(cursor):
+                    yield self._to_frame(batch, columns)
+        except Exception as e:
+            raise UnableToLoadError(
+                f"Failed to load database query: {filepath}", filepath=filepath
+            ) from e
+
+    def build_query(self) -> str:
+        """
+        Build the SELECT statement from table / query, usecols and where.
+
+        Identifiers are quoted, but where and query are inserted as is,
+        so they must be trusted SQL. Values are bound from config["params"]
+        when the statement is executed.
+
+        Return:
+            (str) SQL query.
+        """
+        if self.config.get("table") is not None:
+            source = quote_identifier(self.config["table"])
+        else:
+            query = self.config["query"].strip().rstrip(";")
+            source = f"({query}) {self.SUBQUERY_ALIAS}"
+
+        usecols = self.config.get("usecols")
+        columns = (
+            ", ".join(quote_identifier(col) for col in usecols) if usecols else "*"
+        )
+
+        sql = f"SELECT {columns} FROM {source}"
+        if self.config.get("where"):
+            sql += f" WHERE {self.config['where']}"
+        return sql
+
+    @contextmanager
+    def _cursor(self):
+        """
+        Open a cursor executing the query, closing what was opened here.
+
+        Connections passed as objects are left open for the caller.
+        """
+        connection, owned = self._connect()
+        try:
+            cursor = connection.cursor()
+            cursor.arraysize = self.config.get("chunksize") or self.BATCH_SIZE
+            try:
+                params = self.config.get("params")
+                if params is None:
+                    cursor.execute(self.build_query())
+                else:
+                    cursor.execute(self.build_query(), params)
+                yield cursor
+            finally:
+                cursor.close()
+        finally:
+            if owned:
+                connection.close()
+
+    def _connect(self) -> tuple:
+        """
+        Connect to the database.
+
+        Return:
+            (tuple) DB-API connection, and whether it is closed by this loader.
+        """
+        connection = self.config.get("connection")
+        if connection is not None:
+            # Connection objects may be callable too, e.g. sqlite3.Connection
+            if hasattr(connection, "cursor"):
+                return connection, False
+            return connection(), True
+
+        filepath = self.config["filepath"]
+        if database_protocol(filepath) not in NATIVE_DATABASE_PROTOCOLS:
+            raise ConfigError(
+                f"A DB-API connection is required to read {filepath}, "
+                "please pass connection to Loader"
+            )
+
+        # SQLAlchemy style URL: sqlite:///relative.db, sqlite:////absolute.db
+        path = Path(str(filepath).split(":///", 1)[1])
+        if not path.is_file():
+            raise FileNotFoundError(f"SQLite database not found: {path}")
+        return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True), True
+
+    def _fetch_batches(self, cursor) -> Iterator[list]:
+        """
+        Fetch rows in batches of cursor.arraysize, up to config["nrows"] rows.
+
+        Args:
+            cursor: DB-API cursor with an executed query.
+
+        Return:
+            (Iterator[list]) Batches of row tuples.
+        """
+        remaining = self.config.get("nrows")
+        while remaining is None or remaining > 0:
+            size = cursor.arraysize
+            if remaining is not None:
+                size = min(size, remaining)
+                remaining -= size
+            batch = cursor.fetchmany(size)
+            if not batch:
+                break
+            yield batch
+
+    def _to_frame(self, rows: list, columns: list[str]) -> pd.DataFrame:
+        """
+        Build a typed DataFrame from rows.
+
+        Columns are typed by the Python values the driver returns for the
+        database column types, see _to_series. SQL NULL and config["na_values"]
+        become missing values, then config["dtype"] is applied on the columns
+        it defines. String dtypes are skipped, since text columns already
+        come as str and casting would turn NULL into "None".
+
+        Args:
+            rows (list): Row tuples.
+            columns (list[str]): Column names of the query result.
+
+        Return:
+            (pd.DataFrame) Typed rows.
+        """
+        if not rows:
+            return pd.DataFrame(columns=columns)
+        data = pd.DataFrame(
+            {
+                col: self._to_series(values)
+                for col, values in zip(columns, zip(*rows, strict=True), strict=True)
+            },
+            columns=columns,
+        )
+
+        na_values = self.config.get("na_values")
+        if na_values is not None:
+            if isinstance(na_values, dict):
+                for col, values in na_values.items():
+                    if col in data.columns:
+                        values = values if isinstance(values, list) else [values]
+                        data[col] = data[col].mask(data[col].isin(values))
+            else:
+                values = na_values if isinstance(na_values, list) else [na_values]
+                data = data.mask(data.isin(values))
+
+        dtype = {
+            col: col_dtype
+            for col, col_dtype in (self.config.get("dtype") or {}).items()
+            if col in data.columns and col_dtype is not str
+        }
+        return data.astype(dtype) if dtype else data
+
+    @staticmethod
+    def _to_series(values: tuple) -> pd.Series:
+        """
+        Type the values of one result column.
+
+        Integers with NULL become nullable Int64 instead of float64,
+        decimals become float64, dates and datetimes become datetime64,
+        other values are kept as object.
+
+        Args:
+            values (tuple): Column values, None for SQL NULL.
+
+        Return:
+            (pd.Series) Typed column.
+        """
+        series = pd.Series(values, dtype=object)
+        has_null = series.isna().any()
+        kind = pd.api.types.infer_dtype(series, skipna=True)
+        try:
+            if kind == "integer":
+                return series.astype("Int64" if has_null else "int64")
+            if kind in ("floating", "decimal", "mixed-integer-float"):
+                return series.astype("float64")
+            if kind == "boolean":
+                return series.astype("boolean" if has_null else "bool")
+            if kind in ("date", "datetime", "datetime64"):
+                return pd.to_datetime(series)
+        except (TypeError, ValueError, OverflowError):
+            pass
+        return series
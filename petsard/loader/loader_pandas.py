@@ -1,3 +1,10 @@
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
 import pandas as pd
 
 from petsard.exceptions import UnableToLoadError
@@ -28,39 +35,91 @@ class LoaderPandasCsv(LoaderBase):
             (pd.DataFrame)
                 Data in csv by pd.DataFrame format.
         """
-        # 1. set the filepath as first positional argument
         filepath = self.config["filepath"]
 
+        try:
+            return pd.read_csv(filepath, **self._build_pandas_config())
+        except Exception as e:
+            raise UnableToLoadError(
+                f"Failed to load CSV file: {filepath}",
+                filepath=filepath
+            ) from e
+
+    def load_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Load the data chunk by chunk
+
+        Return:
+            (Iterator[pd.DataFrame])
+                Data in csv by pd.DataFrame chunks of config["chunksize"] rows.
+        """
+        filepath = self.config["filepath"]
+
+        try:
+            with pd.read_csv(
+                filepath,
+                chunksize=self.config["chunksize"],
+                **self._build_pandas_config(),
+            ) as reader:
+                yield from reader
+        except Exception as e:
+            raise UnableToLoadError(
+                f"Failed to load CSV file: {filepath}",
+                filepath=filepath
+            ) from e
+
+    def _build_pandas_config(self) -> dict:
+        """
+        Build the keyword arguments of pandas.read_csv from config
+
+        Return:
+            (dict) keyword arguments of pandas.read_csv
+        """
         pandas_config = {}
 
-        # 2. If header_names is not None, setting custom header names
+        # 1. If header_names is not None, setting custom header names
         if self.config.get("header_names") is not None:
             pandas_config.update({"header": 0, "names": self.config["header_names"]})
         else:
             # Default header settings to match original behavior
             pandas_config.update({"header": "infer", "names": None})
 
-        # 3. assign dtype, na_values, and nrows
-        list_setting = ["dtype", "na_values", "nrows"]
+        # 2. assign dtype, na_values, nrows, usecols, compression and storage_options
+        #    compressed files are decompressed while streaming,
+        #    fsspec URLs are opened by pandas through fsspec
+        list_setting = [
+            "dtype",
+            "na_values",
+            "nrows",
+            "usecols",
+            "compression",
+            "storage_options",
+        ]
         pandas_config.update(
             {k: self.config[k] for k in list_setting if k in self.config}
         )
 
-        try:
-            return pd.read_csv(filepath, **pandas_config)
-        except Exception as e:
-            raise UnableToLoadError(
-                f"Failed to load CSV file: {filepath}",
-                filepath=filepath
-            ) from e
+        return pandas_config
 
 
 class LoaderPandasExcel(LoaderBase):
     """
     LoaderPandasExcel
         pandas.read_excel implementing of Loader
+
+        config["engine"] selects the pandas Excel engine, "auto" prefers
+        calamine (Rust-based, much faster than openpyxl) when installed.
+        With config["sidecar"], the sheet is converted once into a Parquet
+        sidecar file next to it, keyed by the file mtime, size and read options,
+        so later loads read the sidecar instead of parsing the workbook.
     """
 
+    ENGINES: tuple[str, ...] = ("auto", "calamine", "openpyxl", "odf", "pyxlsb", "xlrd")
+
+    # Prefix of sidecar files, hidden next to the Excel file
+    SIDECAR_PREFIX: str = "."
+    SIDECAR_SUFFIX: str = ".petsard.parquet"
+
     def __init__(self, config: dict):
         """
         Args:
@@ -79,17 +138,6 @@ class LoaderPandasExcel(LoaderBase):
             (pd.DataFrame)
                 Data in excel by pd.DataFrame format.
         """
-        # Check if openpyxl is installed
-        try:
-            import openpyxl  # noqa: F401
-        except ImportError as e:
-            from petsard.exceptions import ConfigError
-
-            raise ConfigError(
-                "openpyxl is required to read Excel files. "
-                "Please install it with: pip install petsard[xlsx]"
-            ) from e
-
         # 1. set the filepath as first positional argument
         filepath = self.config["filepath"]
 
@@ -99,19 +147,133 @@ class LoaderPandasExcel(LoaderBase):
         if self.config.get("header_names") is not None:
             pandas_config.update({"header": 0, "names": self.config["header_names"]})
         else:
-            # Default header settings to match original behavior
-            pandas_config.update({"header": "infer", "names": None})
+            # First row as header, read_excel does not accept "infer"
+            pandas_config.update({"header": 0, "names": None})
 
-        # 3. assign dtype, na_values, and nrows
-        list_setting = ["dtype", "na_values", "nrows"]
+        # 3. assign dtype, na_values, nrows, usecols and storage_options
+        list_setting = ["dtype", "na_values", "nrows", "usecols", "storage_options"]
         pandas_config.update(
             {k: self.config[k] for k in list_setting if k in self.config}
         )
 
+        sidecar_path = None
+        if self.config.get("sidecar"):
+            sidecar_path = self._sidecar_path(pandas_config)
+            if sidecar_path.exists():
+                try:
+                    return pd.read_parquet(sidecar_path)
+                except Exception as e:
+                    logging.getLogger(f"PETsARD.{self.__class__.__name__}").warning(
+                        f"Ignoring unreadable Excel sidecar {sidecar_path}: {e}"
+                    )
+
+        # 4. select the engine, openpyxl is the pandas default for .xlsx
+        engine = self._resolve_engine()
+        if engine is not None:
+            pandas_config["engine"] = engine
+        if engine in (None, "openpyxl"):
+            self._check_openpyxl()
+
         try:
-            return pd.read_excel(filepath, **pandas_config)
+            data = pd.read_excel(filepath, **pandas_config)
         except Exception as e:
             raise UnableToLoadError(
                 f"Failed to load Excel file: {filepath}",
                 filepath=filepath
             ) from e
+
+        if sidecar_path is not None:
+            self._write_sidecar(sidecar_path, data)
+        return data
+
+    def _resolve_engine(self) -> str | None:
+        """
+        Resolve config["engine"], "auto" picks calamine when installed
+
+        Return:
+            (str | None) pandas Excel engine, None for the pandas default
+        """
+        engine = self.config.get("engine")
+        if engine != "auto":
+            return engine
+        try:
+            import python_calamine  # noqa: F401
+        except ImportError:
+            return None
+        return "calamine"
+
+    @staticmethod
+    def _check_openpyxl() -> None:
+        """
+        Check if openpyxl is installed
+        """
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError as e:
+            from petsard.exceptions import ConfigError
+
+            raise ConfigError(
+                "openpyxl is required to read Excel files. "
+                "Please install it with: pip install petsard[xlsx]"
+            ) from e
+
+    def _sidecar_path(self, pandas_config: dict) -> Path:
+        """
+        Path of the Parquet sidecar for the file state and read options
+
+        The key covers the file mtime and size rather than its content hash,
+        so checking the sidecar never reads the workbook.
+
+        Args:
+            pandas_config (dict): keyword arguments of pandas.read_excel
+
+        Return:
+            (Path) Sidecar path, e.g. ".data.xlsx.<key>.petsard.parquet"
+        """
+        filepath = Path(self.config["filepath"])
+        stat = filepath.stat()
+        payload = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "pandas_version": pd.__version__,
+            "options": pandas_config,
+        }
+        key = hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        return filepath.with_name(
+            f"{self.SIDECAR_PREFIX}{filepath.name}.{key}{self.SIDECAR_SUFFIX}"
+        )
+
+    def _write_sidecar(self, sidecar_path: Path, data: pd.DataFrame) -> None:
+        """
+        Write the Parquet sidecar and remove stale ones of the same file
+
+        The sidecar is written to a temporary file and renamed into place,
+        so concurrent runs never read a partial file. Data that Arrow cannot
+        store (e.g. mixed-type object columns) is not converted.
+
+        Args:
+            sidecar_path (Path): Sidecar path from _sidecar_path().
+            data (pd.DataFrame): Data read from the Excel file.
+        """
+        from petsard.loader.loader_arrow import _import_pyarrow
+
+        _import_pyarrow()
+        logger = logging.getLogger(f"PETsARD.{self.__class__.__name__}")
+        tmp_path = sidecar_path.with_name(f"{sidecar_path.name}.{os.getpid()}.tmp")
+        try:
+            data.to_parquet(tmp_path)
+            os.replace(tmp_path, sidecar_path)
+        except Exception as e:
+            logger.warning(f"Unable to write Excel sidecar {sidecar_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        logger.info(f"Saved Excel sidecar: {sidecar_path}")
+
+        excel_name = Path(self.config["filepath"]).name
+        for stale_path in sidecar_path.parent.glob(
+            f"{self.SIDECAR_PREFIX}{excel_name}.*{self.SIDECAR_SUFFIX}"
+        ):
+            if stale_path != sidecar_path:
+                stale_path.unlink(missing_ok=True)
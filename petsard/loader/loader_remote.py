@@ -0,0 +1,124 @@
+import hashlib
+import re
+
+from petsard.exceptions import ConfigError
+from petsard.loader.loader_database import DATABASE_PROTOCOLS
+
+# URL protocols handled outside fsspec
+LOCAL_PROTOCOLS: tuple[str, ...] = ("benchmark", *DATABASE_PROTOCOLS)
+
+
+def _import_fsspec():
+    """
+    Import fsspec lazily, since it is an optional dependency.
+
+    Return:
+        (module) fsspec module
+    """
+    try:
+        import fsspec
+    except ImportError as e:
+        raise ConfigError(
+            "fsspec is required to read remote files (e.g. s3://, gs://). "
+            "Please install it with: pip install petsard[remote]"
+        ) from e
+    return fsspec
+
+
+def is_remote(filepath) -> bool:
+    """
+    Whether filepath is an fsspec URL, e.g. "s3://bucket/data.csv.gz".
+
+    Args:
+        filepath (str): File path or URL.
+
+    Return:
+        (bool) True for URLs with a protocol other than benchmark://
+            and database protocols.
+    """
+    match = re.match(r"^([a-zA-Z][a-zA-Z0-9+.\-]*)://", str(filepath))
+    if match is None:
+        return False
+    # Driver suffixes of database URLs, e.g. postgresql+psycopg://
+    return match.group(1).lower().split("+")[0] not in LOCAL_PROTOCOLS
+
+
+def url_to_fs(filepath: str, storage_options: dict | None = None) -> tuple:
+    """
+    Resolve an fsspec URL to its filesystem and path.
+
+    Args:
+        filepath (str): fsspec URL.
+        storage_options (dict, optional): Options of the filesystem,
+            e.g. credentials or endpoint.
+
+    Return:
+        (tuple) (fsspec.AbstractFileSystem, path inside the filesystem)
+    """
+    fsspec = _import_fsspec()
+    return fsspec.core.url_to_fs(filepath, **(storage_options or {}))
+
+
+def open_remote(filepath: str, storage_options: dict | None = None):
+    """
+    Open an fsspec URL as a binary file object.
+
+    Args:
+        filepath (str): fsspec URL.
+        storage_options (dict, optional): Options of the filesystem.
+
+    Return:
+        (fsspec.core.OpenFile) Context manager giving a seekable binary file.
+    """
+    fsspec = _import_fsspec()
+    return fsspec.open(filepath, "rb", **(storage_options or {}))
+
+
+def list_remote_partitions(
+    filepath: str, storage_options: dict | None = None, glob_chars: str = "*?["
+) -> list[str] | None:
+    """
+    List the partition files of a remote glob pattern or directory.
+
+    Files of a directory starting with "." or "_" (e.g. _SUCCESS markers)
+    are skipped.
+
+    Args:
+        filepath (str): fsspec URL of a glob pattern, directory or file.
+        storage_options (dict, optional): Options of the filesystem.
+        glob_chars (str): Characters marking filepath as a glob pattern.
+
+    Return:
+        (list[str] | None) Sorted partition URLs, None if filepath is a file.
+    """
+    fs, path = url_to_fs(filepath, storage_options)
+    if any(char in path for char in glob_chars):
+        paths = [p for p in fs.glob(path) if fs.isfile(p)]
+    elif fs.isdir(path):
+        paths = [
+            info["name"]
+            for info in fs.ls(path, detail=True)
+            if info["type"] == "file"
+            and not info["name"].rstrip("/").split("/")[-1].startswith((".", "_"))
+        ]
+    else:
+        return None
+    return sorted(fs.unstrip_protocol(p) for p in paths)
+
+
+def digest_remote_sha256(filepath: str, storage_options: dict | None = None) -> str:
+    """
+    Calculate SHA-256 value of a remote file. Load 128KB at one time.
+
+    Args:
+        filepath (str): fsspec URL.
+        storage_options (dict, optional): Options of the filesystem.
+
+    Return:
+        (str) SHA-256 value of file.
+    """
+    sha256hash = hashlib.sha256()
+    with open_remote(filepath, storage_options) as f:
+        for byte_block in iter(lambda: f.read(131072), b""):
+            sha256hash.update(byte_block)
+    return sha256hash.hexdigest()
@@ -1,11 +1,55 @@
-import random
+import hashlib
+from collections.abc import Iterator, Mapping
 
+import numpy as np
 import pandas as pd
 
 from petsard.exceptions import ConfigError
+from petsard.loader.splitter_cache import SplitterCache
 from petsard.metadater.metadata import Schema
 
 
+class SplitView(Mapping):
+    """
+    Lazy train / validation split of a parent DataFrame.
+
+    Only the parent frame and the row positions of each part are kept,
+    a part is materialized as a new DataFrame (with a fresh RangeIndex)
+    each time it is read. Many samples of one table therefore share
+    a single copy of the data until a consumer actually reads them.
+    The parent frame should not be modified while the view is in use.
+    """
+
+    def __init__(self, data: pd.DataFrame, index: dict[str, np.ndarray]):
+        """
+        Args:
+            data (pd.DataFrame): The parent dataset.
+            index (dict[str, np.ndarray]):
+                Row positions of each part, e.g. {train: array, validation: array}.
+
+        Attr:
+            data (pd.DataFrame): The parent dataset.
+            index (dict[str, np.ndarray]): Row positions of each part.
+        """
+        self.data: pd.DataFrame = data
+        self.index: dict[str, np.ndarray] = index
+
+    def __getitem__(self, key: str) -> pd.DataFrame:
+        return self.data.take(self.index[key]).reset_index(drop=True)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __repr__(self) -> str:
+        parts = ", ".join(
+            f"{key}={len(value)} rows" for key, value in self.index.items()
+        )
+        return f"{self.__class__.__name__}({parts})"
+
+
 class Splitter:
     """
     Splitter is an independent module for Executor use. Included:
@@ -14,6 +58,8 @@ class Splitter:
     c.) output their train/validation indexes (self.index_samples) and pd.DataFrame data (self.data)
     """
 
+    SPLIT_METHODS: tuple[str, ...] = ("bootstrap", "kfold")
+
     def __init__(
         self,
         num_samples: int | None = 1,
@@ -21,6 +67,10 @@ class Splitter:
         random_state: int | float | str | None = None,
         max_overlap_ratio: float | None = 1.0,
         max_attempts: int | None = 30,
+        split_method: str = "bootstrap",
+        stratify_column: str | None = None,
+        fold: int | None = None,
+        cache_dir: str | None = None,
     ):
         """
         Args:
@@ -36,11 +86,29 @@ class Splitter:
                 Default is 1.0 (100%). Set to 0.0 for no overlap.
             max_attempts (int, optional):
                 Maximum number of attempts for sampling. Default is 30.
+            split_method (str, optional):
+                "bootstrap" draws each sample at random, with overlap control.
+                "kfold" shuffles the rows once and cuts them into num_samples folds,
+                each sample validates on one fold and trains on the others,
+                train_split_ratio, max_overlap_ratio and max_attempts are ignored.
+                Default is "bootstrap".
+            stratify_column (str, optional):
+                Column whose classes keep their proportions in every train
+                and validation set. Default is None.
+            fold (int, optional):
+                Only return this fold (1-based) of "kfold", requires random_state
+                so every fold is cut from the same shuffle. Default is None.
+            cache_dir (str, optional):
+                Directory to persist split indices, keyed by the data content,
+                the options above and the existing train indices. A rerun on
+                the same data reuses the stored partitions instead of splitting
+                again, even without random_state. Default is None (no cache).
 
         Attr:
             config (dict):
                 The configuration of Splitter containing:
-                num_samples, train_split_ratio, random_state, max_overlap_ratio, max_attempts.
+                num_samples, train_split_ratio, random_state, max_overlap_ratio, max_attempts,
+                split_method, stratify_column, fold, cache_dir.
         """
         if not (0.0 <= train_split_ratio <= 1.0):
             raise ConfigError(
@@ -51,20 +119,46 @@ class Splitter:
                 "Splitter: max_overlap_ratio must be a float between 0 and 1."
             )
 
+        if split_method not in self.SPLIT_METHODS:
+            raise ConfigError(
+                f"Splitter: split_method must be one of {self.SPLIT_METHODS}."
+            )
+        if split_method == "kfold":
+            if num_samples is None or num_samples < 2:
+                raise ConfigError(
+                    "Splitter: num_samples (number of folds) must be at least 2 for kfold."
+                )
+            if fold is not None:
+                if not (1 <= fold <= num_samples):
+                    raise ConfigError(
+                        "Splitter: fold must be between 1 and num_samples."
+                    )
+                if random_state is None:
+                    raise ConfigError(
+                        "Splitter: random_state is required when fold is set, "
+                        "so every fold is cut from the same shuffle."
+                    )
+        elif fold is not None:
+            raise ConfigError("Splitter: fold is only supported by kfold.")
+
         self.config = {
             "num_samples": num_samples,
             "train_split_ratio": train_split_ratio,
             "random_state": random_state,
             "max_overlap_ratio": max_overlap_ratio,
             "max_attempts": max_attempts,
+            "split_method": split_method,
+            "stratify_column": stratify_column,
+            "fold": fold,
+            "cache_dir": cache_dir,
         }
 
     def split(
         self,
         data: pd.DataFrame,
         metadata: Schema,
-        exist_train_indices: list[set] = None,
-    ) -> tuple[dict, dict, list[set]]:
+        exist_train_indices: list[np.ndarray] = None,
+    ) -> tuple[dict, dict, list[np.ndarray]]:
         """
         Perform index bootstrapping on the Splitter-initialized data
             and split it into train and validation sets
@@ -73,14 +167,17 @@ class Splitter:
         Args:
             data (pd.DataFrame): The dataset which wait for split.
             metadata (Schema): The metadata of the dataset.
-            exist_train_indices (list[set], optional):
-                The existing train index sets we want to avoid overlapping with.
+            exist_train_indices (list[np.ndarray], optional):
+                The existing train index arrays we want to avoid overlapping
+                with. Sets of indices are also accepted.
 
         Returns:
-            tuple[dict, dict, list[set]]:
-                - Split data: {1: {train: pd.DataFrame, validation: pd.DataFrame}, 2: ...}
+            tuple[dict, dict, list[np.ndarray]]:
+                - Split data: {1: SplitView, 2: ...}, each SplitView maps
+                    train / validation to pd.DataFrame, materialized on access
                 - Metadata: {1: {train: Schema, validation: Schema}, 2: ...}
-                - Train indices: [{train_indices_set1}, {train_indices_set2}, ...]
+                - Train indices: [train_index_array1, train_index_array2, ...],
+                    sorted by row position.
         """
         if data is None:
             raise ConfigError("Data must be provided for splitting")
@@ -89,19 +186,50 @@ class Splitter:
 
         data.reset_index(drop=True, inplace=True)  # avoid unexpected index
 
-        index_result = self._bootstrapping(
-            index=data.index.tolist(), exist_train_indices=exist_train_indices
-        )
+        strata = None
+        if self.config["stratify_column"] is not None:
+            if self.config["stratify_column"] not in data.columns:
+                raise ConfigError(
+                    f"Splitter: stratify_column '{self.config['stratify_column']}' "
+                    f"not found in data."
+                )
+            # NA is kept as a class of its own
+            strata, _ = pd.factorize(
+                data[self.config["stratify_column"]], use_na_sentinel=False
+            )
+
+        cache = None
+        index_result = None
+        if self.config["cache_dir"] is not None:
+            cache = SplitterCache(self.config["cache_dir"])
+            cache_key = cache.make_key(
+                data,
+                {k: v for k, v in self.config.items() if k != "cache_dir"},
+                # kfold does not depend on existing train indices
+                exist_train_indices
+                if self.config["split_method"] == "bootstrap"
+                else None,
+            )
+            index_result = cache.get(cache_key)
+
+        if index_result is None:
+            if self.config["split_method"] == "kfold":
+                index_result = self._kfold(index=data.index, strata=strata)
+            else:
+                index_result = self._bootstrapping(
+                    index=data.index,
+                    exist_train_indices=exist_train_indices,
+                    strata=strata,
+                )
+            if cache is not None:
+                cache.put(cache_key, index_result)
 
         split_data = {}
         metadata_dict = {}
         train_indices_list = []
 
         for key, index in index_result.items():
-            split_data[key] = {
-                "train": data.iloc[index["train"]].reset_index(drop=True),
-                "validation": data.iloc[index["validation"]].reset_index(drop=True),
-            }
+            split_data[key] = SplitView(data, index)
 
             # Create metadata for both train and validation
             train_metadata = self._update_metadata_with_split_info(
@@ -120,20 +248,21 @@ class Splitter:
                 "validation": validation_metadata,
             }
 
-            train_indices_list.append(set(index["train"]))
+            train_indices_list.append(index["train"])
 
+        self._last_train_indices = train_indices_list
         return split_data, metadata_dict, train_indices_list
 
-    def get_train_indices(self) -> list[set]:
+    def get_train_indices(self) -> list[np.ndarray]:
         """
         Get training index list from last split, for backward compatibility.
 
         Returns:
-            list[set]: List of training index sets
+            list[np.ndarray]: List of training index arrays
         """
         # This method is mainly for backward compatibility, recommend using split() return value directly
         if hasattr(self, "_last_train_indices"):
-            return self._last_train_indices
+            return list(self._last_train_indices)
         return []
 
     def _update_metadata_with_split_info(
@@ -168,43 +297,68 @@ class Splitter:
         return updated_metadata
 
     def _bootstrapping(
-        self, index: list, exist_train_indices: list[set] = None
-    ) -> dict[int, dict[str, list[int]]]:
+        self,
+        index,
+        exist_train_indices: list[np.ndarray] = None,
+        strata: np.ndarray | None = None,
+    ) -> dict[int, dict[str, np.ndarray]]:
         """
         Generate random index samples for data splitting using bootstrap method.
 
+        Each train sample is drawn without replacement by a NumPy Generator
+        as a boolean mask over row positions. Samples are compared as packed
+        bitsets, so an overlap check is one AND and a popcount.
+
         Args:
-            index (list): Index list of dataset to be split
-            exist_train_indices (list[set]): List of existing training index sets to avoid overlap
-        """
-        if self.config["random_state"] is not None:
-            random.seed(self.config["random_state"])
+            index (array-like): Index of dataset to be split
+            exist_train_indices (list[np.ndarray]): List of existing training
+                index arrays (or index sets) to avoid overlap
+            strata (np.ndarray, optional): Class code of each row, each class
+                is sampled by train_split_ratio on its own
 
-        sample_size = round(len(index) * self.config["train_split_ratio"])
+        Returns:
+            dict[int, dict[str, np.ndarray]]:
+                {1: {train: index array, validation: index array}, 2: ...},
+                both sorted by row position.
+        """
+        index = pd.Index(index)
+        index_values = index.to_numpy()
+        n_rows = len(index)
+        rng = self._make_rng()
+        sample_size = round(n_rows * self.config["train_split_ratio"])
 
-        # Initialize existing training index set list
+        # Initialize existing training sets as (bitset, size)
         existing_train_sets = []
         if exist_train_indices:
-            existing_train_sets = [
-                set(idx_set) if not isinstance(idx_set, set) else idx_set
-                for idx_set in exist_train_indices
-            ]
+            for idx_set in exist_train_indices:
+                positions = index.get_indexer(
+                    idx_set if isinstance(idx_set, np.ndarray) else list(idx_set)
+                )
+                existing_mask = np.zeros(n_rows, dtype=bool)
+                existing_mask[positions[positions >= 0]] = True
+                existing_train_sets.append((np.packbits(existing_mask), len(idx_set)))
 
         sampled_index = {}
 
         for n in range(self.config["num_samples"]):
             attempts = 0
             while attempts < self.config["max_attempts"]:
-                sampled_indices = set(random.sample(index, sample_size))
+                if strata is None:
+                    train_mask = self._sample_mask(rng, n_rows, sample_size)
+                else:
+                    train_mask = self._stratified_mask(
+                        rng, strata, self.config["train_split_ratio"]
+                    )
+                train_sample = (np.packbits(train_mask), int(train_mask.sum()))
 
                 # Check if overlap with existing training sets is acceptable
-                if self._check_overlap_acceptable(sampled_indices, existing_train_sets):
+                if self._check_overlap_acceptable(train_sample, existing_train_sets):
                     # Add current sample to existing training set list for subsequent comparison
-                    existing_train_sets.append(sampled_indices)
+                    existing_train_sets.append(train_sample)
 
                     sampled_index[n + 1] = {
-                        "train": list(sampled_indices),
-                        "validation": list(set(index) - sampled_indices),
+                        "train": index_values[train_mask],
+                        "validation": index_values[~train_mask],
                     }
                     break
 
@@ -222,30 +376,170 @@ class Splitter:
                 )
         return sampled_index
 
+    def _kfold(
+        self, index, strata: np.ndarray | None = None
+    ) -> dict[int, dict[str, np.ndarray]]:
+        """
+        Generate k-fold index samples in one pass.
+
+        Rows are shuffled once and each class (or the whole data) is cut
+        into num_samples folds of sizes differing by at most one.
+        Sample n validates on fold n and trains on the other folds,
+        so validation sets are disjoint and cover every row once.
+
+        Args:
+            index (array-like): Index of dataset to be split
+            strata (np.ndarray, optional): Class code of each row,
+                each class is cut into folds on its own
+
+        Returns:
+            dict[int, dict[str, np.ndarray]]:
+                {1: {train: index array, validation: index array}, 2: ...},
+                both sorted by row position. Only {1: ...} of
+                config["fold"] if it is set.
+        """
+        index = pd.Index(index)
+        index_values = index.to_numpy()
+        n_rows = len(index)
+        n_folds = self.config["num_samples"]
+        rng = self._make_rng()
+
+        if strata is None:
+            strata = np.zeros(n_rows, dtype=np.int64)
+
+        # Rows grouped by class, in random order within each class
+        order = rng.permutation(n_rows)
+        order = order[np.argsort(strata[order], kind="stable")]
+        sorted_strata = strata[order]
+        class_sizes = np.bincount(sorted_strata)
+        class_starts = np.concatenate([[0], np.cumsum(class_sizes)[:-1]])
+        rank = np.arange(n_rows) - class_starts[sorted_strata]
+
+        # Rotate by class so fold sizes stay balanced across classes
+        fold_ids = np.empty(n_rows, dtype=np.int64)
+        fold_ids[order] = (
+            rank * n_folds // class_sizes[sorted_strata] + sorted_strata
+        ) % n_folds
+
+        folds = (
+            [self.config["fold"] - 1]
+            if self.config["fold"] is not None
+            else range(n_folds)
+        )
+        sampled_index = {}
+        for n, fold in enumerate(folds):
+            validation_mask = fold_ids == fold
+            sampled_index[n + 1] = {
+                "train": index_values[~validation_mask],
+                "validation": index_values[validation_mask],
+            }
+        return sampled_index
+
+    def _make_rng(self) -> np.random.Generator:
+        """
+        Create the random generator from config["random_state"].
+
+        Non-negative integers seed the generator directly, other values
+        (float, str, negative int) are hashed into a seed.
+
+        Returns:
+            np.random.Generator: The random generator.
+        """
+        random_state = self.config["random_state"]
+        if random_state is None:
+            return np.random.default_rng()
+        if isinstance(random_state, int) and random_state >= 0:
+            return np.random.default_rng(random_state)
+        digest = hashlib.sha256(str(random_state).encode("utf-8")).digest()
+        return np.random.default_rng(int.from_bytes(digest[:8], "little"))
+
+    @staticmethod
+    def _sample_mask(
+        rng: np.random.Generator, n_rows: int, sample_size: int
+    ) -> np.ndarray:
+        """
+        Draw sample_size of n_rows row positions without replacement.
+
+        Only the smaller side of the split is drawn, the other is its complement.
+
+        Args:
+            rng (np.random.Generator): The random generator.
+            n_rows (int): Number of rows.
+            sample_size (int): Number of rows to draw.
+
+        Returns:
+            np.ndarray: Boolean mask of the drawn rows.
+        """
+        draw_complement = sample_size > n_rows - sample_size
+        positions = rng.choice(
+            n_rows,
+            size=n_rows - sample_size if draw_complement else sample_size,
+            replace=False,
+            shuffle=False,
+        )
+        mask = np.full(n_rows, draw_complement)
+        mask[positions] = not draw_complement
+        return mask
+
+    @staticmethod
+    def _stratified_mask(
+        rng: np.random.Generator, strata: np.ndarray, ratio: float
+    ) -> np.ndarray:
+        """
+        Draw round(size * ratio) rows of every class without replacement.
+
+        Args:
+            rng (np.random.Generator): The random generator.
+            strata (np.ndarray): Class code of each row.
+            ratio (float): Ratio of each class to draw.
+
+        Returns:
+            np.ndarray: Boolean mask of the drawn rows.
+        """
+        class_sizes = np.bincount(strata)
+        class_starts = np.concatenate([[0], np.cumsum(class_sizes)[:-1]])
+        # Rows grouped by class, in random order within each class
+        order = np.lexsort((rng.random(len(strata)), strata))
+        sorted_strata = strata[order]
+        rank = np.arange(len(strata)) - class_starts[sorted_strata]
+
+        mask = np.zeros(len(strata), dtype=bool)
+        mask[order] = rank < np.round(class_sizes * ratio)[sorted_strata]
+        return mask
+
     def _check_overlap_acceptable(
-        self, new_train_sample: set, existing_train_sets: list[set]
+        self,
+        new_train_sample: tuple[np.ndarray, int],
+        existing_train_sets: list[tuple[np.ndarray, int]],
     ) -> bool:
         """
         Check if overlap between new training sample and existing training sets is acceptable.
 
         Args:
-            new_train_sample (set): New training sample index set
-            existing_train_sets (list[set]): List of existing training index sets
+            new_train_sample (tuple[np.ndarray, int]):
+                New training sample as (bitset, size)
+            existing_train_sets (list[tuple[np.ndarray, int]]):
+                List of existing training sets as (bitset, size)
 
         Returns:
             bool: Returns True if overlap is acceptable, False otherwise
         """
         max_overlap_ratio = self.config["max_overlap_ratio"]
+        new_bitset, sample_size = new_train_sample
 
-        for existing_train_set in existing_train_sets:
+        for existing_bitset, existing_size in existing_train_sets:
             # 1. Check if completely identical
-            if new_train_sample == existing_train_set:
+            if existing_size == sample_size and np.array_equal(
+                new_bitset, existing_bitset
+            ):
                 return False
 
             # 2. Check if overlap ratio exceeds limit
             if max_overlap_ratio < 1.0:  # Only check when not 100%
-                overlap_size = len(new_train_sample.intersection(existing_train_set))
-                overlap_ratio = overlap_size / len(new_train_sample)
+                overlap_size = np.count_nonzero(
+                    np.unpackbits(new_bitset & existing_bitset)
+                )
+                overlap_ratio = overlap_size / sample_size
 
                 if overlap_ratio > max_overlap_ratio:
                     return False
@@ -0,0 +1,149 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+class SplitterCache:
+    """
+    Content-addressed on-disk cache of split indices.
+
+    Each entry is a directory named by the cache key, holding one .npy file
+    per sample and part (e.g. 1_train.npy, 1_validation.npy), read back
+    memory-mapped. The key is the SHA-256 of the data content together with
+    the splitter options and the existing train indices to avoid, so reruns
+    and parallel workers reuse the exact same partitions of the same data.
+    """
+
+    # Bump when the stored layout or the splitting semantics change
+    CACHE_VERSION: int = 1
+
+    PARTS: tuple[str, ...] = ("train", "validation")
+
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir (str): Directory to store the cache entries.
+
+        Attr:
+            _logger (logging.Logger): The logger object.
+            cache_dir (Path): Directory to store the cache entries.
+        """
+        self._logger: logging.Logger = logging.getLogger(
+            f"PETsARD.{self.__class__.__name__}"
+        )
+        self.cache_dir: Path = Path(cache_dir)
+
+    def make_key(
+        self,
+        data: pd.DataFrame,
+        options: dict,
+        exist_train_indices: list[np.ndarray] | None = None,
+    ) -> str:
+        """
+        Build the cache key of a splitting request.
+
+        Args:
+            data (pd.DataFrame): Data to split.
+            options (dict): Splitter options affecting the split result.
+            exist_train_indices (list[np.ndarray], optional):
+                Existing train index arrays (or sets) the split avoids
+                overlapping with.
+
+        Return:
+            (str) SHA-256 hex digest used as the cache key.
+        """
+        data_hash = hashlib.sha256(
+            pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes()
+        )
+        data_hash.update(json.dumps(list(map(str, data.columns))).encode("utf-8"))
+
+        exist_hash = hashlib.sha256()
+        for idx_set in exist_train_indices or []:
+            # Arrays are hashed as is, sets hash the same as their sorted array
+            if isinstance(idx_set, np.ndarray):
+                idx_array = idx_set.astype(np.int64, copy=False)
+            else:
+                idx_array = np.fromiter(idx_set, dtype=np.int64)
+            exist_hash.update(np.sort(idx_array).tobytes())
+            exist_hash.update(b"|")
+
+        payload = {
+            "cache_version": self.CACHE_VERSION,
+            "numpy_version": np.__version__,
+            "data_sha256": data_hash.hexdigest(),
+            "exist_train_indices_sha256": exist_hash.hexdigest(),
+            "options": options,
+        }
+        serialized = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict[int, dict[str, np.ndarray]] | None:
+        """
+        Read a cache entry.
+
+        Args:
+            key (str): Cache key from make_key().
+
+        Return:
+            (dict[int, dict[str, np.ndarray]] | None)
+                {1: {train: index array, validation: index array}, 2: ...},
+                None if missing or unreadable.
+        """
+        entry_dir = self.cache_dir / key
+        if not entry_dir.is_dir():
+            self._logger.debug(f"Cache miss: {key}")
+            return None
+
+        try:
+            index_result = {}
+            for path in sorted(entry_dir.glob("*.npy")):
+                sample, part = path.stem.split("_", 1)
+                index_result.setdefault(int(sample), {})[part] = np.load(
+                    path, mmap_mode="r"
+                )
+            if not index_result or any(
+                set(index) != set(self.PARTS) for index in index_result.values()
+            ):
+                raise ValueError("incomplete entry")
+        except Exception as e:
+            self._logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+        self._logger.info(f"Loaded split indices from cache: {entry_dir}")
+        return dict(sorted(index_result.items()))
+
+    def put(self, key: str, index_result: dict[int, dict[str, np.ndarray]]) -> None:
+        """
+        Write a cache entry.
+
+        The entry is written into a temporary directory and renamed into place,
+        so concurrent runs never read a partial entry.
+
+        Args:
+            key (str): Cache key from make_key().
+            index_result (dict[int, dict[str, np.ndarray]]):
+                {1: {train: index array, validation: index array}, 2: ...}
+        """
+        entry_dir = self.cache_dir / key
+        if entry_dir.exists():
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=self.cache_dir))
+        try:
+            for sample, index in index_result.items():
+                for part in self.PARTS:
+                    np.save(tmp_dir / f"{sample}_{part}.npy", np.asarray(index[part]))
+            os.replace(tmp_dir, entry_dir)
+            self._logger.info(f"Saved split indices to cache: {entry_dir}")
+        except Exception as e:
+            self._logger.warning(f"Unable to cache split indices: {e}")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
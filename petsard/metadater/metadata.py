@@ -138,6 +138,7 @@ class Schema:
     enable_optimize_type: bool = True
     enable_null: bool = True
     enable_stats: bool = True  # Added: whether to calculate statistics
+    enable_approximate_stats: bool = False  # Quantiles by mergeable sketches
 
     # Statistics
     stats: TableStats | None = None
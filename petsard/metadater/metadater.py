@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
 from typing import Any
 
@@ -8,6 +9,7 @@ import yaml
 
 from petsard.exceptions import MetadataError
 from petsard.metadater.metadata import Attribute, Metadata, Schema
+from petsard.metadater.sketch import QuantileSketch
 from petsard.metadater.stats import DatasetsStats, FieldStats, TableStats
 
 
@@ -17,12 +19,16 @@ class AttributeMetadater:
     All methods are implemented here, Attribute is just configuration
     """
 
+    # Rows of a column converted to float64 at a time when sketching it
+    SKETCH_CHUNK_ROWS: int = 65_536
+
     @classmethod
     def from_data(
         cls,
         data: pd.Series,
         enable_stats: bool = True,
         base_attribute: Attribute = None,
+        sample: pd.Series | None = None,
         **kwargs,
     ) -> Attribute:
         """Create Attribute configuration from Series
@@ -31,6 +37,9 @@ class AttributeMetadater:
             data: Data Series
             enable_stats: Whether to calculate statistics
             base_attribute: Base Attribute (if any), precision not inferred if defined
+            sample: Row sample of data (if any), category, precision and logical type
+                are inferred from it instead of the whole Series.
+                Nullable and statistics are always exact.
             **kwargs: Other parameters
         """
         # With base_attribute: fully inherit attributes, do not re-infer from data
@@ -61,8 +70,14 @@ class AttributeMetadater:
                 "int16": "int",
                 "int32": "int",
                 "int64": "int",
+                "Int8": "int",
+                "Int16": "int",
+                "Int32": "int",
+                "Int64": "int",
                 "float32": "float",
                 "float64": "float",
+                "Float32": "float",
+                "Float64": "float",
                 "bool": "str",  # boolean treated as string category
                 "object": "str",
                 "datetime64[ns]": "datetime",
@@ -70,15 +85,18 @@ class AttributeMetadater:
 
             data_type = type_mapping.get(dtype_str, "str")
 
+            infer_data = data if sample is None else sample
+
             # Infer logical type
-            logical_type = cls._infer_logical_type(data)
+            logical_type = cls._infer_logical_type(infer_data)
 
             # Prepare type_attr
             type_attr = {}
 
             # Infer if it's categorical data
             is_category = dtype_str == "category" or (
-                data.dtype == "object" and len(data.unique()) / len(data) < 0.05
+                data.dtype == "object"
+                and cls._estimate_unique_count(data, sample) / len(data) < 0.05
                 if len(data) > 0
                 else False
             )
@@ -89,7 +107,7 @@ class AttributeMetadater:
 
             # Calculate precision for numeric fields (only on first inference and for float)
             if data_type == "float":
-                precision = cls._infer_precision(data)
+                precision = cls._infer_precision(infer_data)
                 if precision is not None:
                     type_attr["precision"] = precision
 
@@ -101,7 +119,10 @@ class AttributeMetadater:
             )
 
         # Detect constant columns (all values are the same)
-        is_constant = cls._detect_constant_column(data)
+        # A sample holding two distinct values already rules it out
+        is_constant = (
+            sample is None or sample.nunique() <= 1
+        ) and cls._detect_constant_column(data)
 
         return Attribute(
             name=data.name,
@@ -125,47 +146,101 @@ class AttributeMetadater:
         Returns:
             Precision (decimal places), None if cannot infer
         """
+        # Only handle float types
+        if not pd.api.types.is_float_dtype(data):
+            return None
+
+        return cls.infer_decimal_places(data.dropna().to_numpy(dtype="float64"))
+
+    @classmethod
+    def infer_decimal_places(
+        cls, values, max_precision: int | None = None
+    ) -> int | None:
+        """Infer the maximum decimal places of float values, vectorized
+
+        A value has k decimal places when k is the smallest power of ten such
+        that rint(value * 10**k) / 10**k gives back exactly the same float.
+        While both the scaled value (< 2**53) and 10**k (k <= 22) are exact,
+        the division is correctly rounded, so this matches the decimal places
+        of the shortest repr (as Decimal(str(value)) counts them).
+        The few values outside that range are checked with Decimal.
+
+        Args:
+            values: Float values (array-like), NaN and inf are skipped
+            max_precision: Stop early and return it once reached (if any)
+
+        Returns:
+            Maximum decimal places, None if no finite value
+        """
         from decimal import Decimal
 
         import numpy as np
 
-        # Only handle float types
-        if not pd.api.types.is_float_dtype(data):
+        remaining = np.asarray(values, dtype="float64")
+        remaining = remaining[np.isfinite(remaining)]
+        if remaining.size == 0:
             return None
 
-        # Remove NaN values
-        non_na_data = data.dropna()
-        if len(non_na_data) == 0:
-            return None
+        precision = 0
+        inexact = []
+        for k in range(23):
+            if max_precision is not None and k >= max_precision:
+                return max_precision
+
+            scale = 10.0**k
+            scaled = remaining * scale
+            in_range = np.abs(scaled) < 2**53
+            matched = in_range & (np.rint(scaled) / scale == remaining)
+            if matched.any():
+                precision = k
+
+            inexact.append(remaining[~in_range])
+            remaining = remaining[in_range & ~matched]
+            if remaining.size == 0:
+                break
+        inexact.append(remaining)
+
+        # Fallback for values not representable exactly after scaling.
+        # Their shortest repr has at most 17 significant digits, so
+        # 17 - floor(log10(|value|)) bounds their decimal places (one spare
+        # for log10 rounding), only values whose bound exceeds the current
+        # precision are checked with Decimal, largest bound first.
+        inexact = np.unique(np.concatenate(inexact))
+        bounds = 17 - np.floor(np.log10(np.abs(inexact))).astype(int)
+        for idx in np.argsort(-bounds, kind="stable"):
+            if bounds[idx] <= precision:
+                break
+            exponent = Decimal(str(inexact[idx])).normalize().as_tuple().exponent
+            if exponent < 0:
+                precision = max(precision, abs(exponent))
+
+        if max_precision is not None:
+            return min(precision, max_precision)
+        return precision
 
-        # Calculate decimal places for each value
-        precisions = []
-        for value in non_na_data:
-            if not np.isfinite(value):  # Skip inf and -inf
-                continue
+    @classmethod
+    def _estimate_unique_count(cls, data: pd.Series, sample: pd.Series | None) -> float:
+        """Estimate the number of distinct values of data
 
-            # Use Decimal for precise decimal place detection
-            # This correctly handles float precision, avoiding string formatting limitations
-            try:
-                # Convert float to Decimal to preserve full precision
-                decimal_value = Decimal(str(value))
-                # Normalize to remove trailing zeros
-                normalized = decimal_value.normalize()
-                # Calculate decimal places
-                sign, digits, exponent = normalized.as_tuple()
-                if exponent < 0:
-                    precisions.append(abs(exponent))
-                else:
-                    precisions.append(0)
-            except (ValueError, OverflowError):
-                # If conversion fails, skip this value
-                continue
+        Without a sample the exact count is returned. With a sample, the
+        bias-corrected Chao1 estimator extrapolates the distinct values
+        not seen in the sample from the values seen once (f1) and twice (f2).
 
-        if not precisions:
-            return None
+        Args:
+            data: Data Series
+            sample: Row sample of data, None for exact count
+
+        Returns:
+            Estimated number of distinct values (NA counted as one value)
+        """
+        if sample is None:
+            return len(data.unique())
 
-        # Return maximum precision in this field
-        return max(precisions)
+        counts = sample.value_counts(dropna=False)
+        f1 = int((counts == 1).sum())
+        f2 = int((counts == 2).sum())
+        estimate = len(counts) + f1 * (f1 - 1) / (2 * (f2 + 1))
+        return min(estimate, len(data))
 
     @classmethod
     def _infer_logical_type(cls, data: pd.Series) -> str | None:
@@ -214,6 +289,68 @@ class AttributeMetadater:
         """
         return cls.from_dict(config)
 
+    @classmethod
+    def merge(cls, attribute: Attribute, other: Attribute) -> Attribute:
+        """Merge two Attributes inferred from different parts of the same column
+
+        Used when a column is inferred piece by piece (e.g. chunked or
+        partitioned loading). Statistics are dropped since they cannot be
+        merged exactly; is_constant is kept only if both sides agree and
+        should be re-detected on the combined data.
+
+        Merge rules:
+        - type: identical types are kept, int + float becomes float,
+          any other mismatch falls back to str
+        - category / nullable: True if either side is True
+        - precision: maximum of both sides
+        - logical_type: kept only if both sides agree
+
+        Args:
+            attribute: Attribute inferred from the earlier part
+            other: Attribute inferred from the later part
+
+        Returns:
+            Merged Attribute
+        """
+        if attribute.type == other.type:
+            data_type = attribute.type
+        elif {attribute.type, other.type} == {"int", "float"}:
+            data_type = "float"
+        else:
+            data_type = "str"
+
+        left_attr = attribute.type_attr or {}
+        right_attr = other.type_attr or {}
+        type_attr = {**left_attr, **right_attr}
+        type_attr["category"] = bool(
+            left_attr.get("category", False) or right_attr.get("category", False)
+        )
+        type_attr["nullable"] = bool(
+            left_attr.get("nullable", True) or right_attr.get("nullable", True)
+        )
+
+        precisions = [
+            p
+            for p in (left_attr.get("precision"), right_attr.get("precision"))
+            if p is not None
+        ]
+        if data_type == "float" and precisions:
+            type_attr["precision"] = max(precisions)
+        else:
+            type_attr.pop("precision", None)
+
+        return Attribute(
+            name=attribute.name,
+            type=data_type,
+            type_attr=type_attr,
+            logical_type=attribute.logical_type
+            if attribute.logical_type == other.logical_type
+            else None,
+            enable_stats=attribute.enable_stats,
+            stats=None,
+            is_constant=attribute.is_constant and other.is_constant,
+        )
+
     @classmethod
     def diff(cls, attribute: Attribute, data: pd.Series) -> dict[str, Any]:
         """Compare differences between Attribute and Series"""
@@ -472,77 +609,346 @@ class AttributeMetadater:
 
         Statistical calculation logic implemented in Metadater class
         """
-        import pandas as pd
+        data = series.to_frame()
+        col = data.columns[0]
+        return cls._calculate_fields_stats(
+            data, {col: (data_type, is_category, logical_type)}
+        )[col]
 
-        row_count = len(series)
-        na_count = series.isna().sum()
-        na_percentage = (na_count / row_count) if row_count > 0 else 0.0
+    @classmethod
+    def _calculate_fields_stats(
+        cls,
+        data: pd.DataFrame,
+        field_specs: dict[str, tuple[str, bool, str | None]],
+        approximate: bool = False,
+    ) -> dict[str, FieldStats]:
+        """Calculate field statistics of many columns in batch
 
-        # unique_count: only calculated when category=True
-        unique_count = None
-        if is_category:
-            unique_count = series.nunique()
+        Numeric moments and quantiles of all numeric columns are computed on
+        one float64 matrix with a single sort, or column by column through
+        QuantileSketch when approximate. Each categorical column is counted
+        once with value_counts for unique count, mode and distribution.
 
-        # Numeric statistics: only calculated when type != 'str' and category=False
-        mean = None
-        std = None
-        min_val = None
-        max_val = None
-        median = None
-        q1 = None
-        q3 = None
+        Args:
+            data: Data DataFrame
+            field_specs: {column: (data_type, is_category, logical_type)}
+            approximate: Whether to approximate median and quartiles by
+                QuantileSketch instead of sorting
 
-        if (
-            data_type in ["int", "float", "date", "datetime"]
+        Returns:
+            {column: FieldStats}
+        """
+        import numpy as np
+
+        row_count = len(data)
+        na_counts = data[list(field_specs)].isna().sum()
+
+        # Numeric statistics: only calculated when type != 'str' and category=False
+        numeric_cols = [
+            col
+            for col, (data_type, is_category, _) in field_specs.items()
+            if data_type in ["int", "float", "date", "datetime"]
             and not is_category
-            and not series.empty
-        ):
-            non_na_series = series.dropna()
-            if len(non_na_series) > 0 and pd.api.types.is_numeric_dtype(non_na_series):
-                mean = float(non_na_series.mean())
-                std = float(non_na_series.std())
-                min_val = float(non_na_series.min())
-                max_val = float(non_na_series.max())
-                median = float(non_na_series.median())
-                q1 = float(non_na_series.quantile(0.25))
-                q3 = float(non_na_series.quantile(0.75))
-
-        # Category statistics: only calculated when category=True
-        mode = None
-        mode_frequency = None
-        category_distribution = None
-
-        if is_category and not series.empty:
-            mode_series = series.mode()
-            if not mode_series.empty:
-                mode = mode_series.iloc[0]
-                mode_frequency = int((series == mode).sum())
-
-            # Calculate category distribution
-            value_counts = series.value_counts()
-            # Limit to top 20 categories
-            top_categories = value_counts.head(20)
-            category_distribution = {str(k): int(v) for k, v in top_categories.items()}
-
-        return FieldStats(
-            row_count=row_count,
-            na_count=int(na_count),
-            na_percentage=round(na_percentage, 4),
-            unique_count=int(unique_count) if unique_count is not None else None,
-            mean=mean,
-            std=std,
-            min=min_val,
-            max=max_val,
-            median=median,
-            q1=q1,
-            q3=q3,
-            mode=mode,
-            mode_frequency=mode_frequency,
-            category_distribution=category_distribution,
-            detected_type=str(series.dtype),
-            actual_dtype=str(series.dtype),
-            logical_type=logical_type,
-        )
+            and pd.api.types.is_numeric_dtype(data[col])
+            and na_counts[col] < row_count
+        ]
+        numeric_stats = {}
+        if numeric_cols and approximate:
+            numeric_stats = {
+                col: cls._calculate_sketch_stats(data[col]) for col in numeric_cols
+            }
+        elif numeric_cols:
+            # One float64 matrix (a row per column), sorted once
+            # for min, max and quantiles (NaN sorted last)
+            matrix = np.vstack(
+                [
+                    data[col].to_numpy(dtype="float64", na_value=np.nan)
+                    for col in numeric_cols
+                ]
+            )
+            counts = (~np.isnan(matrix)).sum(axis=1)
+            mean = np.nansum(matrix, axis=1) / counts
+            with np.errstate(invalid="ignore", divide="ignore"):
+                std = np.sqrt(
+                    np.nansum((matrix - mean[:, None]) ** 2, axis=1) / (counts - 1)
+                )
+            order_stats = cls._calculate_order_stats(matrix, counts)
+
+            numeric_stats = {
+                col: {
+                    "mean": mean[i],
+                    "std": std[i],
+                    **{name: values[i] for name, values in order_stats.items()},
+                }
+                for i, col in enumerate(numeric_cols)
+            }
+
+        field_stats = {}
+        for col, (_, is_category, logical_type) in field_specs.items():
+            series = data[col]
+            values = {k: float(v) for k, v in numeric_stats.get(col, {}).items()}
+
+            # Category statistics: only calculated when category=True
+            unique_count = None
+            mode = None
+            mode_frequency = None
+            category_distribution = None
+            if is_category:
+                value_counts = series.value_counts()
+                observed = value_counts[value_counts > 0]
+                unique_count = len(observed)
+                if unique_count > 0:
+                    mode_frequency = int(observed.max())
+                    modes = observed.index[observed == mode_frequency]
+                    # Ties follow Series.mode() ordering
+                    mode = modes[0] if len(modes) == 1 else series.mode().iloc[0]
+                # Limit to top 20 categories
+                if row_count > 0:
+                    category_distribution = {
+                        str(k): int(v) for k, v in value_counts.head(20).items()
+                    }
+
+            na_count = int(na_counts[col])
+            field_stats[col] = FieldStats(
+                row_count=row_count,
+                na_count=na_count,
+                na_percentage=round(na_count / row_count, 4) if row_count > 0 else 0.0,
+                unique_count=unique_count,
+                mean=values.get("mean"),
+                std=values.get("std"),
+                min=values.get("min"),
+                max=values.get("max"),
+                median=values.get("median"),
+                q1=values.get("q1"),
+                q3=values.get("q3"),
+                mode=mode,
+                mode_frequency=mode_frequency,
+                category_distribution=category_distribution,
+                detected_type=str(series.dtype),
+                actual_dtype=str(series.dtype),
+                logical_type=logical_type,
+            )
+
+        return field_stats
+
+    @classmethod
+    def _calculate_sketch_stats(cls, series: pd.Series) -> dict[str, float]:
+        """Calculate moments, extremes and approximate quantiles of a column
+
+        The column is converted to float64 and fed to a QuantileSketch
+        SKETCH_CHUNK_ROWS rows at a time, so no full float64 copy of it
+        is made. Min, max, mean and std are exact, combined chunk by chunk;
+        median and quartiles are approximate.
+
+        Args:
+            series: Numeric column with at least one non-NA value
+
+        Returns:
+            {statistic name: value}
+        """
+        import math
+
+        import numpy as np
+
+        sketch = QuantileSketch()
+        n, mean, m2 = 0, 0.0, 0.0
+        low, high = math.inf, -math.inf
+        for start in range(0, len(series), cls.SKETCH_CHUNK_ROWS):
+            values = series.iloc[start : start + cls.SKETCH_CHUNK_ROWS].to_numpy(
+                dtype="float64", na_value=np.nan
+            )
+            values = values[~np.isnan(values)]
+            if values.size == 0:
+                continue
+            sketch.update(values)
+            # Parallel variance algorithm over chunks
+            n_chunk = values.size
+            mean_chunk = values.mean()
+            diff = mean_chunk - mean
+            total = n + n_chunk
+            mean += diff * n_chunk / total
+            m2 += ((values - mean_chunk) ** 2).sum() + diff**2 * n * n_chunk / total
+            n = total
+            low, high = min(low, values.min()), max(high, values.max())
+
+        return {
+            "mean": mean,
+            "std": math.sqrt(m2 / (n - 1)) if n > 1 else math.nan,
+            "min": low,
+            "max": high,
+            "median": sketch.quantile(0.5),
+            "q1": sketch.quantile(0.25),
+            "q3": sketch.quantile(0.75),
+        }
+
+    @classmethod
+    def _calculate_order_stats(cls, matrix, counts) -> dict[str, Any]:
+        """Calculate min, max, median and quartiles of a float64 matrix
+
+        Args:
+            matrix: float64 matrix, a row per column, NaN for NA.
+                Sorted in place
+            counts: Number of non-NA values of each row, all positive
+
+        Returns:
+            {statistic name: value of each row}
+        """
+        import numpy as np
+
+        # NaN sorted last
+        matrix.sort(axis=1)
+        row_idx = np.arange(len(matrix))
+
+        def quantile(q: float) -> np.ndarray:
+            # Linear interpolation, same as pandas default
+            position = q * (counts - 1)
+            lower = np.floor(position).astype(int)
+            upper = np.ceil(position).astype(int)
+            lower_value = matrix[row_idx, lower]
+            upper_value = matrix[row_idx, upper]
+            return lower_value + (upper_value - lower_value) * (position - lower)
+
+        return {
+            "min": matrix[row_idx, 0],
+            "max": matrix[row_idx, counts - 1],
+            "median": quantile(0.5),
+            "q1": quantile(0.25),
+            "q3": quantile(0.75),
+        }
+
+    @classmethod
+    def update_stats(
+        cls,
+        stats: FieldStats,
+        added: FieldStats | None = None,
+        removed: FieldStats | None = None,
+    ) -> FieldStats | None:
+        """Update field statistics by the statistics of added and removed rows
+
+        Additive statistics are combined without the data: row and NA counts,
+        mean and std (by the sums and sums of squares of the parallel variance
+        algorithm), and category counts of a complete category distribution.
+        Min and max are combined for added rows. Median and quartiles, and
+        min and max after removed rows, depend on the remaining values, so
+        they cannot be derived from the statistics and are returned stale:
+        the caller has to recalculate them from the data.
+
+        Args:
+            stats: Statistics of the current rows
+            added: Statistics of the added rows (if any)
+            removed: Statistics of the removed rows (if any), a subset of
+                the current rows
+
+        Returns:
+            Updated FieldStats, None if the category statistics
+                cannot be derived and the field must be recalculated
+        """
+        for delta, sign in ((added, 1), (removed, -1)):
+            if delta is None:
+                continue
+            if delta.actual_dtype != stats.actual_dtype:
+                return None
+            stats = cls._apply_stats_delta(stats, delta, sign)
+            if stats is None:
+                return None
+        return stats
+
+    @classmethod
+    def _apply_stats_delta(
+        cls, stats: FieldStats, delta: FieldStats, sign: int
+    ) -> FieldStats | None:
+        """Add (sign 1) or subtract (sign -1) the statistics of some rows"""
+        import math
+
+        row_count = stats.row_count + sign * delta.row_count
+        na_count = stats.na_count + sign * delta.na_count
+        if row_count < 0 or na_count < 0:
+            return None
+        updates = {
+            "row_count": row_count,
+            "na_count": na_count,
+            "na_percentage": round(na_count / row_count, 4) if row_count > 0 else 0.0,
+        }
+
+        # Numeric moments: n, mean and M2 (sum of squared deviations)
+        if stats.mean is not None or delta.mean is not None:
+            n_a = stats.row_count - stats.na_count
+            n_b = delta.row_count - delta.na_count
+            n = row_count - na_count
+            if n_b > 0 and n == 0:
+                updates.update(
+                    dict.fromkeys(["mean", "std", "min", "max", "median", "q1", "q3"])
+                )
+            elif n_b > 0:
+                mean_a = stats.mean if n_a > 0 else 0.0
+                m2_a = stats.std**2 * (n_a - 1) if n_a > 1 else 0.0
+                m2_b = delta.std**2 * (n_b - 1) if n_b > 1 else 0.0
+                if sign > 0:
+                    diff = delta.mean - mean_a
+                    mean = mean_a + diff * n_b / n
+                    m2 = m2_a + m2_b + diff**2 * n_a * n_b / n
+                else:
+                    mean = (n_a * mean_a - n_b * delta.mean) / n
+                    m2 = m2_a - m2_b - (delta.mean - mean) ** 2 * n * n_b / n_a
+                updates["mean"] = mean
+                updates["std"] = (
+                    math.sqrt(max(m2, 0.0) / (n - 1)) if n > 1 else math.nan
+                )
+                if sign > 0 and n_a > 0:
+                    updates["min"] = min(stats.min, delta.min)
+                    updates["max"] = max(stats.max, delta.max)
+                elif sign > 0:
+                    updates["min"], updates["max"] = delta.min, delta.max
+
+        # Category counts: only a complete distribution can be updated
+        if stats.category_distribution is not None or delta.category_distribution:
+            distribution = stats.category_distribution
+            delta_distribution = delta.category_distribution or {}
+            if distribution is None or any(
+                sum(d.values()) != s.row_count - s.na_count
+                for d, s in ((distribution, stats), (delta_distribution, delta))
+            ):
+                return None
+            counts = dict(distribution)
+            for key, value in delta_distribution.items():
+                counts[key] = counts.get(key, 0) + sign * value
+            if any(value < 0 for value in counts.values()):
+                return None
+            if stats.actual_dtype != "category":
+                # value_counts only keeps unused categories of a category dtype
+                counts = {key: value for key, value in counts.items() if value > 0}
+            if len(counts) > 20:
+                return None
+
+            mode = None
+            mode_frequency = None
+            observed = {key: value for key, value in counts.items() if value > 0}
+            if observed:
+                mode_frequency = max(observed.values())
+                modes = [
+                    key for key, value in observed.items() if value == mode_frequency
+                ]
+                if len(modes) > 1:
+                    # Ties follow Series.mode() ordering on the values
+                    return None
+                for candidate in (stats.mode, delta.mode):
+                    if candidate is not None and str(candidate) == modes[0]:
+                        mode = candidate
+                        break
+                else:
+                    return None
+            updates.update(
+                unique_count=len(observed),
+                mode=mode,
+                mode_frequency=mode_frequency,
+                category_distribution=(
+                    dict(sorted(counts.items(), key=lambda item: -item[1]))
+                    if row_count > 0
+                    else None
+                ),
+            )
+
+        return replace(stats, **updates)
 
     @classmethod
     def _detect_constant_column(cls, data: pd.Series) -> bool:
@@ -574,12 +980,17 @@ class SchemaMetadater:
     All methods are implemented here, Schema is just configuration
     """
 
+    # Seed of the row sample used by sample-based inference
+    INFER_SAMPLE_SEED: int = 0
+
     @classmethod
     def from_data(
         cls,
         data: pd.DataFrame,
         enable_stats: bool = False,
         base_schema: Schema = None,
+        infer_sample_size: int | None = None,
+        approximate_stats: bool | None = None,
         **kwargs,
     ) -> Schema:
         """Create Schema configuration from DataFrame
@@ -588,28 +999,55 @@ class SchemaMetadater:
             data: Data DataFrame
             enable_stats: Whether to calculate statistics
             base_schema: Base Schema (if any), precision not inferred if field has definition
+            infer_sample_size: Number of rows sampled for type inference (if any).
+                Category, precision and logical type are inferred from a seeded
+                uniform row sample, nullable and statistics stay exact.
+                None or a size not smaller than the data infers from all rows.
+            approximate_stats: Whether to approximate quantiles by sketches,
+                None follows base_schema (if any), otherwise exact
             **kwargs: Other parameters
         """
         attributes = {}
 
+        if approximate_stats is None:
+            approximate_stats = bool(
+                base_schema and base_schema.enable_approximate_stats
+            )
+
+        sample_df = cls._sample_rows(data, infer_sample_size)
+
         for col in data.columns:
             # Check if this field has definition in base_schema
             base_attribute = None
             if base_schema and base_schema.attributes and col in base_schema.attributes:
                 base_attribute = base_schema.attributes[col]
 
+            # Statistics are calculated below for all columns in batch
             attributes[col] = AttributeMetadater.from_data(
-                data[col], enable_stats=enable_stats, base_attribute=base_attribute
+                data[col],
+                enable_stats=False,
+                base_attribute=base_attribute,
+                sample=sample_df[col] if sample_df is not None else None,
             )
 
         # Calculate table statistics
         stats = None
         if enable_stats:
-            # Collect field stats
-            field_stats = {}
+            field_stats = AttributeMetadater._calculate_fields_stats(
+                data,
+                {
+                    col_name: (
+                        attr.type,
+                        attr.type_attr.get("category", False),
+                        attr.logical_type,
+                    )
+                    for col_name, attr in attributes.items()
+                },
+                approximate=approximate_stats,
+            )
             for col_name, attr in attributes.items():
-                if attr.stats:
-                    field_stats[col_name] = attr.stats
+                attr.enable_stats = True
+                attr.stats = field_stats[col_name]
             # Calculate table statistics
             stats = cls._calculate_table_stats(data, field_stats)
 
@@ -618,14 +1056,175 @@ class SchemaMetadater:
             name=kwargs.get("name", "Inferred Schema"),
             attributes=attributes,
             enable_stats=enable_stats,
+            enable_approximate_stats=approximate_stats,
             stats=stats,
             **{
                 k: v
                 for k, v in kwargs.items()
-                if k not in ["id", "name", "enable_stats", "stats"]
+                if k
+                not in [
+                    "id",
+                    "name",
+                    "enable_stats",
+                    "enable_approximate_stats",
+                    "stats",
+                ]
             },
         )
 
+    @classmethod
+    def _sample_rows(
+        cls, data: pd.DataFrame, sample_size: int | None
+    ) -> pd.DataFrame | None:
+        """Draw a seeded uniform row sample, keeping the original row order
+
+        Args:
+            data: Data DataFrame
+            sample_size: Number of rows to sample
+
+        Returns:
+            Sampled DataFrame, None if no sampling is needed
+        """
+        import numpy as np
+
+        if sample_size is None or sample_size >= len(data):
+            return None
+
+        rng = np.random.default_rng(cls.INFER_SAMPLE_SEED)
+        positions = np.sort(rng.choice(len(data), size=sample_size, replace=False))
+        return data.iloc[positions]
+
+    @classmethod
+    def update_stats(
+        cls,
+        schema: Schema,
+        data: pd.DataFrame,
+        added: pd.DataFrame | None = None,
+        removed: pd.DataFrame | None = None,
+    ) -> Schema:
+        """Update statistics of a Schema after rows are added or removed
+
+        Only the added and removed rows are scanned for the deltas combined by
+        AttributeMetadater.update_stats: row and NA counts, mean and std,
+        category counts, and min / max on additions. Duplicated rows and
+        memory usage are combined from the row hash counts and object column
+        sizes kept in the table statistics (see _update_table_stats).
+
+        The rest is not incremental and still reads the full data:
+        - median, quartiles (and min / max after removals) of every numeric
+            field whose values changed are recalculated by sorting the
+            whole column (or by QuantileSketch with approximate statistics),
+        - fields whose category statistics cannot be combined are
+            recalculated in batch,
+        - duplicated columns are compared again on data.
+        The result equals from_data() on the changed data.
+
+        Args:
+            schema: Schema whose statistics describe the rows before the change
+            data: Data after the change
+            added: Rows added (if any)
+            removed: Rows removed (if any)
+
+        Returns:
+            Copy of the Schema with updated statistics. Statistics are
+                recalculated from data if the Schema has no statistics
+                or its row count does not match the change
+        """
+        import numpy as np
+
+        added_rows = len(added) if added is not None else 0
+        removed_rows = len(removed) if removed is not None else 0
+        if (
+            schema.stats is None
+            or schema.stats.row_count + added_rows - removed_rows != len(data)
+            or any(
+                col not in schema.attributes or schema.attributes[col].stats is None
+                for col in data.columns
+            )
+        ):
+            return cls.from_data(
+                data=data,
+                enable_stats=True,
+                base_schema=schema,
+                id=schema.id,
+                name=schema.name,
+                description=schema.description,
+            )
+
+        field_specs = {
+            col: (
+                schema.attributes[col].type,
+                schema.attributes[col].type_attr.get("category", False),
+                schema.attributes[col].logical_type,
+            )
+            for col in data.columns
+        }
+        deltas = {
+            key: AttributeMetadater._calculate_fields_stats(
+                rows, field_specs, approximate=schema.enable_approximate_stats
+            )
+            for key, rows in (("added", added), ("removed", removed))
+            if rows is not None
+        }
+
+        field_stats = {}
+        recalculate = []
+        order_stale = []
+        for col in data.columns:
+            col_deltas = {key: delta[col] for key, delta in deltas.items()}
+            updated = AttributeMetadater.update_stats(
+                schema.attributes[col].stats, **col_deltas
+            )
+            if updated is None:
+                recalculate.append(col)
+                continue
+            field_stats[col] = updated
+            if updated.mean is not None and any(
+                delta.mean is not None for delta in col_deltas.values()
+            ):
+                order_stale.append(col)
+
+        if recalculate:
+            field_stats.update(
+                AttributeMetadater._calculate_fields_stats(
+                    data[recalculate],
+                    {col: field_specs[col] for col in recalculate},
+                    approximate=schema.enable_approximate_stats,
+                )
+            )
+        order_names = ("min", "max", "median", "q1", "q3")
+        if order_stale and schema.enable_approximate_stats:
+            for col in order_stale:
+                sketch_stats = AttributeMetadater._calculate_sketch_stats(data[col])
+                field_stats[col] = replace(
+                    field_stats[col],
+                    **{name: float(sketch_stats[name]) for name in order_names},
+                )
+        elif order_stale:
+            matrix = np.vstack(
+                [
+                    data[col].to_numpy(dtype="float64", na_value=np.nan)
+                    for col in order_stale
+                ]
+            )
+            counts = (~np.isnan(matrix)).sum(axis=1)
+            order_stats = AttributeMetadater._calculate_order_stats(matrix, counts)
+            for i, col in enumerate(order_stale):
+                field_stats[col] = replace(
+                    field_stats[col],
+                    **{name: float(values[i]) for name, values in order_stats.items()},
+                )
+
+        field_stats = {col: field_stats[col] for col in data.columns}
+        updated_schema = cls.from_metadata(schema)
+        for col, attr in updated_schema.attributes.items():
+            if col in field_stats:
+                attr.stats = field_stats[col]
+        updated_schema.stats = cls._update_table_stats(
+            schema.stats, data, field_stats, added=added, removed=removed
+        )
+        return updated_schema
+
     @classmethod
     def from_metadata(cls, schema: Schema) -> Schema:
         """Copy Schema configuration"""
@@ -956,6 +1555,39 @@ class SchemaMetadater:
             }
         )
 
+    @classmethod
+    def merge(cls, schema: Schema, other: Schema) -> Schema:
+        """Merge two Schemas inferred from different parts of the same table
+
+        Attributes present on both sides are merged by AttributeMetadater.merge,
+        attributes present on one side only are kept as they are.
+        Table statistics are dropped and should be recalculated on the combined data.
+
+        Args:
+            schema: Schema inferred from the earlier part
+            other: Schema inferred from the later part
+
+        Returns:
+            Merged Schema, keeping the identity (id, name, ...) of `schema`
+        """
+        new_attributes = dict(schema.attributes)
+        for name, attribute in other.attributes.items():
+            if name in new_attributes:
+                new_attributes[name] = AttributeMetadater.merge(
+                    new_attributes[name], attribute
+                )
+            else:
+                new_attributes[name] = attribute
+
+        return Schema(
+            **{
+                **schema.__dict__,
+                "attributes": new_attributes,
+                "stats": None,
+                "updated_at": datetime.now(),
+            }
+        )
+
     @classmethod
     def diff(cls, schema: Schema, data: pd.DataFrame) -> dict[str, Any]:
         """Compare differences between Schema and DataFrame"""
@@ -1022,13 +1654,179 @@ class SchemaMetadater:
 
         return aligned_df
 
+    @staticmethod
+    def _is_deep_memory(dtype) -> bool:
+        """Whether the memory usage of a dtype needs a scan of every value
+
+        Only object values (e.g. Python str) are sized one by one, numeric and
+        category columns are sized from their buffers.
+        """
+        return dtype.kind == "O" and not isinstance(dtype, pd.CategoricalDtype)
+
+    @classmethod
+    def _shallow_memory_usage(cls, df: pd.DataFrame) -> int:
+        """Memory usage of the index and the columns not needing a deep scan"""
+        index_bytes = df.index.memory_usage(deep=cls._is_deep_memory(df.index.dtype))
+        return int(index_bytes) + sum(
+            int(df[col].memory_usage(index=False, deep=False))
+            for col in df.columns
+            if not cls._is_deep_memory(df[col].dtype)
+        )
+
+    @classmethod
+    def _object_memory_usage(cls, df: pd.DataFrame) -> dict[str, int]:
+        """Deep memory usage of each object column, additive over rows"""
+        return {
+            col: int(df[col].memory_usage(index=False, deep=True))
+            for col in df.columns
+            if cls._is_deep_memory(df[col].dtype)
+        }
+
+    @staticmethod
+    def _row_hashes(df: pd.DataFrame):
+        """Content hash of every row, object values hashed by their string form"""
+        import numpy as np
+
+        if len(df.columns) == 0:
+            return np.zeros(0, dtype=np.uint64)
+        return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+    @classmethod
+    def _count_row_hashes(cls, df: pd.DataFrame) -> tuple:
+        """Sorted unique row hashes of df and their counts"""
+        import numpy as np
+
+        return np.unique(cls._row_hashes(df), return_counts=True)
+
+    @classmethod
+    def _update_row_hash_counts(
+        cls,
+        row_hash_counts: tuple,
+        added: pd.DataFrame | None = None,
+        removed: pd.DataFrame | None = None,
+    ) -> tuple | None:
+        """Combine row hash counts with the hashes of added and removed rows
+
+        Args:
+            row_hash_counts: Sorted unique row hashes and counts before the change
+            added: Rows added (if any)
+            removed: Rows removed (if any)
+
+        Returns:
+            Sorted unique row hashes and counts after the change,
+                None if a removed row was not counted before
+        """
+        import numpy as np
+
+        hashes, counts = row_hash_counts
+        counts = counts.copy()
+        if removed is not None and len(removed) > 0:
+            removed_hashes, removed_counts = cls._count_row_hashes(removed)
+            positions = np.searchsorted(hashes, removed_hashes)
+            if len(hashes) == 0 or (positions >= len(hashes)).any():
+                return None
+            if (hashes[positions] != removed_hashes).any() or (
+                counts[positions] < removed_counts
+            ).any():
+                return None
+            counts[positions] -= removed_counts
+        if added is not None and len(added) > 0:
+            added_hashes, added_counts = cls._count_row_hashes(added)
+            positions = np.searchsorted(hashes, added_hashes)
+            found = positions < len(hashes)
+            found[found] = hashes[positions[found]] == added_hashes[found]
+            counts[positions[found]] += added_counts[found]
+            if not found.all():
+                hashes = np.concatenate([hashes, added_hashes[~found]])
+                counts = np.concatenate([counts, added_counts[~found]])
+                order = np.argsort(hashes, kind="stable")
+                hashes, counts = hashes[order], counts[order]
+        kept = counts > 0
+        return hashes[kept], counts[kept]
+
+    @classmethod
+    def _update_table_stats(
+        cls,
+        stats: TableStats,
+        data: pd.DataFrame,
+        field_stats: dict[str, FieldStats],
+        added: pd.DataFrame | None = None,
+        removed: pd.DataFrame | None = None,
+    ) -> TableStats:
+        """Update table statistics after rows are added or removed
+
+        Row hash counts and object column memory usage of stats are combined
+        with those of the added and removed rows, so only the changed rows
+        are hashed and sized. Either is calculated from data when stats has
+        none or the columns do not match.
+
+        Args:
+            stats: Table statistics describing the rows before the change
+            data: Data after the change
+            field_stats: Updated statistics of every field of data
+            added: Rows added (if any)
+            removed: Rows removed (if any)
+        """
+        columns = list(data.columns)
+        changes = {"added": added, "removed": removed}
+        if any(
+            rows is not None and list(rows.columns) != columns
+            for rows in changes.values()
+        ):
+            return cls._calculate_table_stats(data, field_stats)
+
+        row_hash_counts = None
+        if stats.row_hash_counts is not None:
+            row_hash_counts = cls._update_row_hash_counts(
+                stats.row_hash_counts, added=added, removed=removed
+            )
+
+        object_memory_usage = None
+        deep_columns = [col for col in columns if cls._is_deep_memory(data[col].dtype)]
+        if stats.object_memory_usage is not None and set(deep_columns) == set(
+            stats.object_memory_usage
+        ):
+            object_memory_usage = dict(stats.object_memory_usage)
+            for key, rows in changes.items():
+                if rows is None:
+                    continue
+                sign = 1 if key == "added" else -1
+                for col in deep_columns:
+                    object_memory_usage[col] += sign * int(
+                        rows[col].memory_usage(index=False, deep=True)
+                    )
+
+        return cls._calculate_table_stats(
+            data,
+            field_stats,
+            row_hash_counts=row_hash_counts,
+            object_memory_usage=object_memory_usage,
+        )
+
     @classmethod
     def _calculate_table_stats(
-        cls, df: pd.DataFrame, field_stats: dict[str, FieldStats]
+        cls,
+        df: pd.DataFrame,
+        field_stats: dict[str, FieldStats],
+        row_hash_counts: tuple | None = None,
+        object_memory_usage: dict[str, int] | None = None,
     ) -> TableStats:
         """Calculate table statistics
 
         Statistical calculation logic implemented in SchemaMetadater class
+
+        Duplicated rows are counted from the row content hashes, memory usage
+        scans values of object columns only. Both are kept in the TableStats,
+        so update_stats() can pass them combined with the added and removed
+        rows instead of scanning df again.
+
+        Args:
+            df: Data to describe
+            field_stats: Statistics of every field of df
+            row_hash_counts: Sorted unique row hashes and counts of df,
+                calculated from df if None
+            object_memory_usage: Deep memory usage of object columns of df,
+                calculated from df if None
         """
         row_count = len(df)
         column_count = len(df.columns)
@@ -1039,17 +1837,37 @@ class SchemaMetadater:
         total_na_percentage = (total_na_count / total_cells) if total_cells > 0 else 0.0
 
         # Memory usage
-        memory_usage_bytes = int(df.memory_usage(deep=True).sum())
+        if object_memory_usage is None:
+            object_memory_usage = cls._object_memory_usage(df)
+        memory_usage_bytes = cls._shallow_memory_usage(df) + sum(
+            object_memory_usage.values()
+        )
 
         # Duplicate data check
-        duplicated_rows = int(df.duplicated().sum())
+        if row_hash_counts is None:
+            row_hash_counts = cls._count_row_hashes(df)
+        duplicated_rows = row_count - len(row_hash_counts[0]) if column_count > 0 else 0
 
         # Check identical fields
-        duplicated_columns = []
+        # Only columns of the same dtype and content hash are compared,
+        # object columns are not hashed since equal values may differ in type
         columns = list(df.columns)
+        fingerprints = []
+        for col in columns:
+            content_hash = None
+            if df[col].dtype != "object":
+                content_hash = hash(
+                    pd.util.hash_pandas_object(df[col], index=False)
+                    .to_numpy()
+                    .tobytes()
+                )
+            fingerprints.append((str(df[col].dtype), content_hash))
+        duplicated_columns = []
         for i in range(len(columns)):
             for j in range(i + 1, len(columns)):
-                if df[columns[i]].equals(df[columns[j]]):
+                if fingerprints[i] == fingerprints[j] and df[columns[i]].equals(
+                    df[columns[j]]
+                ):
                     duplicated_columns.append(f"{columns[i]}=={columns[j]}")
 
         return TableStats(
@@ -1061,6 +1879,8 @@ class SchemaMetadater:
             duplicated_rows=duplicated_rows,
             duplicated_columns=duplicated_columns[:10],  # Limit to max 10 pairs
             field_stats=field_stats,
+            row_hash_counts=row_hash_counts,
+            object_memory_usage=object_memory_usage,
         )
 
 
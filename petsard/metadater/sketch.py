@@ -0,0 +1,128 @@
+"""
+Mergeable sketches for approximate statistics
+
+Sketches summarize a column in bounded memory, can be updated chunk by chunk
+and merged with each other, so approximate quantiles of a large table
+can be computed chunk by chunk or combined across partitions.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch (KLL-style compactors)
+
+    Items are kept in levels, an item at level h stands for 2**h input values.
+    Whenever a level holds more than 2 * capacity items, full blocks of
+    2 * capacity items are sorted and every other item (random offset)
+    is promoted to the next level. All blocks of a level are compacted in one
+    vectorized sort, so updating never sorts the whole input.
+
+    The rank error is about log2(n / capacity) / capacity of n, e.g. below 1%
+    for capacity 2048 up to a billion values.
+    """
+
+    def __init__(self, capacity: int = 2048, seed: int | None = 0):
+        """
+        Args:
+            capacity: Half block size of a compaction, larger is more accurate
+            seed: Seed of the random compaction offsets
+
+        Attr:
+            capacity (int): Half block size of a compaction
+            count (int): Number of values summarized
+            levels (list[np.ndarray]): Kept items of each level
+        """
+        self.capacity: int = capacity
+        self.count: int = 0
+        self.levels: list[np.ndarray] = []
+        self._rng: np.random.Generator = np.random.default_rng(seed)
+
+    def update(self, values) -> QuantileSketch:
+        """Add values to the sketch, NaN skipped
+
+        Args:
+            values: Array-like of numeric values
+
+        Returns:
+            The sketch itself
+        """
+        values = np.asarray(values, dtype="float64")
+        values = values[~np.isnan(values)]
+        self.count += values.size
+        self._add(0, values)
+        self._compact()
+        return self
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """Merge another sketch into this one
+
+        Args:
+            other: Sketch to merge
+
+        Returns:
+            The sketch itself
+        """
+        self.count += other.count
+        for level, items in enumerate(other.levels):
+            self._add(level, items)
+        self._compact()
+        return self
+
+    def quantile(self, q: float) -> float | None:
+        """Approximate quantile
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Approximate value at quantile q, None if the sketch is empty
+        """
+        if self.count == 0:
+            return None
+        if len(self.levels) == 1:
+            # Nothing compacted yet, exact linear interpolation
+            return float(np.quantile(self.levels[0], q))
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level_items), 2**level)
+                for level, level_items in enumerate(self.levels)
+            ]
+        )
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        target = q * (cumulative[-1] - 1)
+        position = min(
+            np.searchsorted(cumulative, target, side="right"), len(items) - 1
+        )
+        return float(items[order][position])
+
+    def _add(self, level: int, items: np.ndarray) -> None:
+        """Append items to a level"""
+        while len(self.levels) <= level:
+            self.levels.append(np.empty(0, dtype="float64"))
+        self.levels[level] = np.concatenate([self.levels[level], items])
+
+    def _compact(self) -> None:
+        """Promote full blocks of every overflowing level"""
+        block_size = 2 * self.capacity
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            n_blocks = len(items) // block_size
+            if len(items) > block_size and n_blocks > 0:
+                blocks = np.sort(
+                    items[: n_blocks * block_size].reshape(n_blocks, block_size),
+                    axis=1,
+                )
+                offsets = self._rng.integers(0, 2, size=n_blocks)
+                promoted = np.where(
+                    offsets[:, None] == 0, blocks[:, 0::2], blocks[:, 1::2]
+                ).ravel()
+                self.levels[level] = items[n_blocks * block_size :]
+                self._add(level + 1, promoted)
+            level += 1
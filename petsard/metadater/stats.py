@@ -67,6 +67,16 @@ class TableStats:
     # Field statistics
     field_stats: dict[str, FieldStats] = field(default_factory=dict)
 
+    # State for incremental updates, not part of the reported statistics
+    # (sorted unique row hashes, their counts)
+    row_hash_counts: tuple[Any, Any] | None = field(
+        default=None, repr=False, compare=False
+    )
+    # Deep memory usage of each object column
+    object_memory_usage: dict[str, int] | None = field(
+        default=None, repr=False, compare=False
+    )
+
 
 @dataclass(frozen=True)
 class DatasetsStats:
@@ -1,6 +1,11 @@
 import logging
+import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from copy import deepcopy
+from dataclasses import dataclass
+from itertools import repeat
 from types import NoneType
 
 import numpy as np
@@ -117,6 +122,82 @@ class ProcessorClassMap:
         return subprocessor_class
 
 
+def _apply_column(obj, method: str, data: pd.Series | pd.DataFrame) -> tuple:
+    """
+    Call a method of a column processor, e.g. obj.fit(data).
+    Module-level so that it can be pickled for process pools.
+
+    Args:
+        obj: The column processor.
+        method (str): 'fit', 'transform' or 'inverse_transform'.
+        data (pd.Series | pd.DataFrame): The data passed to the method.
+
+    Return:
+        (tuple) The processor with its updated state, the method result,
+            and the seconds taken by the method.
+    """
+    start = time.perf_counter()
+    result = getattr(obj, method)(data)
+    return obj, result, time.perf_counter() - start
+
+
+@dataclass(frozen=True)
+class ColumnRun:
+    """
+    Columns of one processing step dispatched together.
+
+    Attributes:
+        columns (tuple[str, ...]): The column names in config order.
+        whole_frame (bool): The processor reads and writes the whole DataFrame
+            (EncoderDateDiff), so the run holds its own column only.
+    """
+
+    columns: tuple[str, ...]
+    whole_frame: bool = False
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    """
+    One step of a ProcessorPlan: the column runs of a processor,
+        or a mediator working on the whole DataFrame.
+
+    Attributes:
+        processor (str | Mediator): The processing step name, or the mediator.
+        runs (tuple[ColumnRun, ...]): The column runs, empty for mediators.
+        round_columns (tuple[str, ...]): Columns rounded to int
+            before inverse transformation.
+        label_columns (tuple[str, ...]): EncoderLabel columns rounded to int
+            before inverse transformation if they are float.
+    """
+
+    processor: str | Mediator
+    runs: tuple[ColumnRun, ...] = ()
+    round_columns: tuple[str, ...] = ()
+    label_columns: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class ProcessorPlan:
+    """
+    Execution plan of a fitted Processor, compiled from its config
+        and sequence, so that repeated transform() and inverse_transform()
+        calls skip the planning.
+
+    Attributes:
+        transform_steps (tuple[PlanStep, ...]): Steps of transform(),
+            aligned with the fitting sequence.
+        inverse_steps (tuple[PlanStep, ...]): Steps of inverse_transform().
+        na_percentages (tuple[tuple[str, float], ...]):
+            NA percentage of each missing handler column,
+            adjusted by the global NA percentage.
+    """
+
+    transform_steps: tuple[PlanStep, ...]
+    inverse_steps: tuple[PlanStep, ...]
+    na_percentages: tuple[tuple[str, float], ...]
+
+
 class MediatorMap:  # pragma: no cover
     """
     Mapping of mediator classes to their corresponding processors.
@@ -159,11 +240,33 @@ class Processor:
 
     MAX_SEQUENCE_LENGTH: int = 4  # Maximum number of procedures allowed in sequence
     DEFAULT_SEQUENCE: list[str] = ["missing", "outlier", "encoder", "scaler"]
+    PROFILE_COLUMNS: list[str] = [
+        "call",
+        "method",
+        "step",
+        "column",
+        "processor",
+        "seconds",
+        "rows",
+        "mean_before",
+        "std_before",
+        "na_count_before",
+        "mean_after",
+        "std_after",
+        "na_count_after",
+    ]
+    EXECUTORS: dict[str, type] = {
+        "thread": ThreadPoolExecutor,
+        "process": ProcessPoolExecutor,
+    }
 
     def __init__(
         self,
         metadata: Schema,
         config: dict = None,
+        max_workers: int = 1,
+        executor: str = "thread",
+        profile: bool = False,
     ) -> None:
         """
         Args:
@@ -189,6 +292,19 @@ class Processor:
                         }
                     }
             config (dict): The user-defined config.
+            max_workers (int): Number of workers running the column operations
+                of one processing step in parallel. Default is 1 (serial).
+                Mediators and EncoderDateDiff, which work on the whole data,
+                always run alone.
+            executor (str): Pool of the workers, 'thread' or 'process'.
+                Default is 'thread'. 'process' copies every column and
+                processor to the workers, paying off for CPU-bound processors
+                on wide data only.
+            profile (bool): Record the seconds and the statistics
+                (mean, std, NA count) of every column before and after
+                each step of transform() and inverse_transform(),
+                see get_profile(). Default is False, which skips the
+                statistics entirely.
 
         Attr.
             logger (logging.Logger): The logger for the processor.
@@ -202,6 +318,14 @@ class Processor:
             _na_percentage_global (float): The global NA percentage.
             _rng (np.random.Generator): The random number generator for NA imputation.
             _schema_history (list): History of schema states at each processing step.
+            _max_workers (int): Number of workers for column operations.
+            _executor (str): Pool type of the workers.
+            _pool (Executor): The worker pool, only set while processing.
+            _plan (ProcessorPlan): The execution plan compiled after fitting.
+            _is_recorded (bool): Whether transform() has recorded the schema
+                changes since fitting.
+            _profile (list[dict]): The profile records, None if not profiling.
+            _profile_call (int): Number of profiled calls since fitting.
         """
 
         # Setup logging
@@ -233,6 +357,8 @@ class Processor:
 
         # Initialize processing state
         self._is_fitted: bool = False
+        self._plan: ProcessorPlan = None  # Will be set in _compile_plan()
+        self._is_recorded: bool = False
         self._config: dict = {}  # Will be set in _generate_config()
         self._working_config: dict = {}  # Temporary config for in-process columns
 
@@ -248,6 +374,24 @@ class Processor:
         self._na_percentage_global: float = self._get_global_na_percentage()
         self._rng = np.random.default_rng()  # Random number generator for NA imputation
 
+        # Setup column parallelism
+        if not isinstance(max_workers, int) or isinstance(max_workers, bool):
+            raise ConfigError(f"max_workers should be an integer, got {max_workers}")
+        if max_workers < 1:
+            raise ConfigError(f"max_workers should be at least 1, got {max_workers}")
+        if executor not in self.EXECUTORS:
+            raise ConfigError(
+                f"Invalid executor: {executor}, "
+                f"should be one of {list(self.EXECUTORS.keys())}"
+            )
+        self._max_workers: int = max_workers
+        self._executor: str = executor
+        self._pool = None
+
+        # Setup profiling
+        self._profile: list[dict] = [] if profile else None
+        self._profile_call: int = 0
+
         self._generate_config()
 
         if config is not None:
@@ -352,9 +496,7 @@ class Processor:
             self.logger.debug(f"Column '{col}': inferred type {infer_dtype}")
             for processor, obj in DefaultProcessorMap.PROCESSOR_MAP.items():
                 processor_class = obj[infer_dtype]
-                self.logger.debug(
-                    f"  {processor}: {processor_class.__name__}"
-                )
+                self.logger.debug(f"  {processor}: {processor_class.__name__}")
                 self._config[processor][col] = processor_class()
 
         self.logger.debug(f"Config generation completed for {len(field_names)} columns")
@@ -485,48 +627,62 @@ class Processor:
                             f"Removed constant column '{col_name}' from {processor_type} config"
                         )
 
-        for processor in self._fitting_sequence:
-            if isinstance(processor, str):
-                for col, obj in self._config[processor].items():
-                    # Skip constant columns (removed by ConstantProcessor)
-                    if col not in data.columns:
+        with self._column_pool():
+            for processor in self._fitting_sequence:
+                if isinstance(processor, str):
+                    items: list[tuple] = []
+                    for col, obj in self._config[processor].items():
+                        # Skip constant columns (removed by ConstantProcessor)
+                        if col not in data.columns:
+                            self.logger.debug(
+                                f"Skipping {processor} for constant column '{col}'"
+                            )
+                            continue
+
                         self.logger.debug(
-                            f"Skipping {processor} for constant column '{col}'"
+                            f"{processor}: {type(obj).__name__} from {col} start processing."
                         )
-                        continue
 
-                    self.logger.debug(
-                        f"{processor}: {type(obj).__name__} from {col} start processing."
-                    )
+                        if obj is None:
+                            continue
 
-                    if obj is None:
-                        continue
+                        if processor not in obj.PROC_TYPE:
+                            raise ValueError(
+                                f"Invalid processor from {col} in {processor}"
+                            )
 
-                    if processor not in obj.PROC_TYPE:
-                        raise ValueError(f"Invalid processor from {col} in {processor}")
+                        items.append((col, obj))
 
-                    # Special handling for EncoderDateDiff which needs the full DataFrame
-                    if isinstance(obj, EncoderDateDiff):
-                        obj.fit(data)
-                    else:
-                        obj.fit(data[col])
+                    for run in self._column_runs(items):
+                        # Special handling for EncoderDateDiff which needs the full DataFrame
+                        if run.whole_frame:
+                            self._config[processor][run.columns[0]].fit(data)
+                        else:
+                            self._apply_columns(processor, "fit", run.columns, data)
 
-                self.logger.info(f"Completed {processor} fitting")
-            else:
-                # if the processor is not a string,
-                # it should be a mediator, which could be fitted directly.
+                    self.logger.info(f"Completed {processor} fitting")
+                else:
+                    # if the processor is not a string,
+                    # it should be a mediator, which could be fitted directly.
 
-                # Skip fit() for MediatorScaler
-                if not isinstance(processor, MediatorScaler):
-                    self.logger.debug(
-                        f"mediator: {type(processor).__name__} start processing."
-                    )
-                    processor.fit(data)
-                    self.logger.info(f"Completed {type(processor).__name__} fitting")
+                    # Skip fit() for MediatorScaler
+                    if not isinstance(processor, MediatorScaler):
+                        self.logger.debug(
+                            f"mediator: {type(processor).__name__} start processing."
+                        )
+                        processor.fit(data)
+                        self.logger.info(
+                            f"Completed {type(processor).__name__} fitting"
+                        )
 
         # it is a shallow copy
         self._working_config = self._config.copy()
 
+        self._plan = self._compile_plan()
+        self._is_recorded = False
+        if self._profile is not None:
+            self._profile = []
+            self._profile_call = 0
         self._is_fitted = True
 
     def _check_sequence_valid(self, sequence: list) -> None:
@@ -631,6 +787,208 @@ class Processor:
             for col, _ in self._config["outlier"].items():
                 self._config["outlier"][col] = replaced_class()
 
+    @contextmanager
+    def _column_pool(self):
+        """
+        Open the worker pool for column operations while processing.
+        Nothing is opened when max_workers is 1.
+        """
+        if self._max_workers == 1:
+            yield
+            return
+
+        self._pool = self.EXECUTORS[self._executor](max_workers=self._max_workers)
+        try:
+            yield
+        finally:
+            self._pool.shutdown()
+            self._pool = None
+
+    @staticmethod
+    def _column_runs(items: list[tuple]) -> tuple[ColumnRun, ...]:
+        """
+        Split the column operations of one processing step into runs
+            of independent operations, which can be dispatched together.
+        EncoderDateDiff reads and writes other columns,
+            so it is a barrier forming a run by itself.
+
+        Args:
+            items (list[tuple]): (column name, processor) pairs in config order.
+
+        Return:
+            (tuple[ColumnRun, ...]) The runs in execution order.
+        """
+        runs: list[ColumnRun] = []
+        columns: list[str] = []
+        for col, obj in items:
+            if isinstance(obj, EncoderDateDiff):
+                if columns:
+                    runs.append(ColumnRun(columns=tuple(columns)))
+                    columns = []
+                runs.append(ColumnRun(columns=(col,), whole_frame=True))
+            else:
+                columns.append(col)
+        if columns:
+            runs.append(ColumnRun(columns=tuple(columns)))
+        return tuple(runs)
+
+    def _compile_plan(self) -> ProcessorPlan:
+        """
+        Compile the execution plan of transform() and inverse_transform()
+            from the fitted config and sequence.
+
+        It is compiled again when a mediator adds new columns to the config
+            of the later steps, see _adjust_working_config().
+
+        Return:
+            (ProcessorPlan) The execution plan.
+        """
+        transform_steps: list[PlanStep] = []
+        for processor in self._fitting_sequence:
+            if isinstance(processor, str):
+                items = [
+                    (col, obj)
+                    for col, obj in self._config[processor].items()
+                    if obj is not None
+                ]
+                transform_steps.append(
+                    PlanStep(processor=processor, runs=self._column_runs(items))
+                )
+            else:
+                transform_steps.append(PlanStep(processor=processor))
+
+        # there is no method for restoring outliers
+        self._inverse_sequence = self._sequence.copy()
+        self._inverse_sequence.reverse()
+        if "outlier" in self._inverse_sequence:
+            self._inverse_sequence.remove("outlier")
+
+        if "encoder" in self._inverse_sequence:
+            # if encoder is in the procedure,
+            # MediatorEncoder should be in the queue
+            # right after the encoder
+            self._inverse_sequence.insert(
+                self._inverse_sequence.index("encoder"), self._mediator["encoder"]
+            )
+
+        if "scaler" in self._inverse_sequence:
+            # if scaler is in the procedure,
+            # MediatorScaler should be in the queue
+            # right after the scaler
+            self._inverse_sequence.insert(
+                self._inverse_sequence.index("scaler"), self._mediator["scaler"]
+            )
+
+        inverse_steps: list[PlanStep] = []
+        for processor in self._inverse_sequence:
+            if not isinstance(processor, str):
+                inverse_steps.append(PlanStep(processor=processor))
+                continue
+
+            items = [
+                (col, obj)
+                for col, obj in self._config[processor].items()
+                if obj is not None
+            ]
+            # Some of Synthesizer will produce float type data
+            #   (e.g. PAC-Synth, DPCTGAN),
+            #   which will cause EncoderLabel in discretizing error.
+            # Here we figure out if we are
+            #    in discretizing inverse transform process,
+            #   and object PROC_TYPE is ('encoder', 'discretizing'),
+            #   then we will force convert the data type to int.
+            # (See #440, also #550 for Encoder sequence error.)
+            inverse_steps.append(
+                PlanStep(
+                    processor=processor,
+                    runs=self._column_runs(items),
+                    round_columns=tuple(
+                        col
+                        for col, obj in items
+                        if processor == "discretizing"
+                        and obj.PROC_TYPE == ("encoder", "discretizing")
+                    ),
+                    label_columns=tuple(
+                        col
+                        for col, obj in items
+                        if processor == "encoder" and isinstance(obj, EncoderLabel)
+                    ),
+                )
+            )
+
+        na_percentages: list[tuple[str, float]] = []
+        for col, obj in self._config.get("missing", {}).items():
+            if obj is None:
+                continue
+            try:
+                with warnings.catch_warnings():
+                    # ignore the known warning about RuntimeWarning:
+                    # invalid value encountered in scalar divide
+                    warnings.simplefilter("ignore")
+                    # the NA percentage taking global NA percentage
+                    # into consideration
+                    field_na_percentage = self._get_field_na_percentage(col)
+                    adjusted_na_percentage: float = (
+                        field_na_percentage / self._na_percentage_global
+                    )
+                    # Ensure adjusted_na_percentage is within valid range [0.0, 1.0]
+                    adjusted_na_percentage = max(0.0, min(1.0, adjusted_na_percentage))
+            # if there is no NA in the original data
+            except ZeroDivisionError:
+                adjusted_na_percentage: float = 0.0
+            na_percentages.append((col, adjusted_na_percentage))
+
+        self.logger.debug("Execution plan compiled.")
+
+        return ProcessorPlan(
+            transform_steps=tuple(transform_steps),
+            inverse_steps=tuple(inverse_steps),
+            na_percentages=tuple(na_percentages),
+        )
+
+    def _apply_columns(
+        self,
+        processor: str,
+        method: str,
+        columns: tuple[str, ...],
+        data: pd.DataFrame,
+        seconds: dict = None,
+    ) -> list:
+        """
+        Call a method of the column processors on their own columns,
+            in the worker pool if there is one.
+
+        Processors sent to a process pool are copies,
+            so the returned ones replace them in the config,
+            keeping the state fitted or transformed in the workers,
+            which mediators read later.
+
+        Args:
+            processor (str): The processing step, e.g. 'missing'.
+            method (str): 'fit', 'transform' or 'inverse_transform'.
+            columns (tuple[str, ...]): Independent columns of the step.
+            data (pd.DataFrame): The data holding the columns.
+            seconds (dict, optional): Filled with the seconds taken
+                by each column, if given.
+
+        Return:
+            (list) The method results in the order of columns.
+        """
+        series = [data[col] for col in columns]
+        objs = [self._config[processor][col] for col in columns]
+        if self._pool is None or len(columns) == 1:
+            outputs = map(_apply_column, objs, repeat(method), series)
+        else:
+            outputs = self._pool.map(_apply_column, objs, repeat(method), series)
+
+        results: list = []
+        for col, (obj, result, elapsed) in zip(columns, outputs, strict=True):
+            self._config[processor][col] = obj
+            results.append(result)
+            if seconds is not None:
+                seconds[col] = elapsed
+        return results
+
     def transform(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Transform the data through a series of procedures.
@@ -646,97 +1004,37 @@ class Processor:
 
         self.logger.debug(f"Starting data transformation, input shape: {data.shape}")
 
-        self.transformed: pd.DataFrame = data.copy()
+        # Schema changes are the same for every call,
+        #   so they are recorded by the first transform() after fit() only
+        record: bool = not self._is_recorded
+        if self._profile is not None:
+            self._profile_call += 1
 
-        # Apply ConstantProcessor first (remove constant columns)
-        self.transformed = self._constant_processor.transform(self.transformed)
+        # Apply ConstantProcessor first (remove constant columns),
+        #   which copies the data into the buffer transformed in place
+        self.transformed: pd.DataFrame = self._constant_processor.transform(data)
         self.logger.debug(
             f"Data shape after ConstantProcessor.transform: {self.transformed.shape}"
         )
 
         # Record schema before transformation
-        self._record_schema_snapshot(
-            "before_transform", self._metadata, self.transformed
-        )
-
-        for processor in self._fitting_sequence:
-            if isinstance(processor, str):
-                self.logger.debug(f"Executing {processor} processing")
-
-                for col, obj in self._config[processor].items():
-                    # Skip constant columns (removed by ConstantProcessor)
-                    if col not in self.transformed.columns:
-                        self.logger.debug(f"  > Skipping constant column '{col}'")
-                        continue
-
-                    self.logger.debug(
-                        f"{processor}: {type(obj).__name__} from {col} start transforming."
-                    )
-
-                    if obj is None:
-                        self.logger.debug(
-                            f"  > Skipping column '{col}': no processing needed"
-                        )
-                        continue
-
-                    # Log pre-transformation statistics
-                    if self.transformed[col].dtype.kind in "biufc":  # numeric columns
-                        self.logger.debug(
-                            f"  > Pre-transform stats: "
-                            f"mean={self.transformed[col].mean():.4f}, "
-                            f"std={self.transformed[col].std():.4f}, "
-                            f"na_cnt={self.transformed[col].isna().sum()}"
-                        )
-
-                    # Special handling for EncoderDateDiff which needs the full DataFrame
-                    if isinstance(obj, EncoderDateDiff):
-                        self.transformed = obj.transform(self.transformed)
-                    else:
-                        self.transformed[col] = obj.transform(self.transformed[col])
-
-                    # Update metadata based on processor's SCHEMA_TRANSFORM
-                    self._update_metadata_after_transform(col, obj, processor)
-
-                    infer_dtype = self._get_field_infer_dtype(col)
-                    if infer_dtype == "datetime":
-                        # it is fine to re-adjust mulitple times
-                        #   for get the final dtype,
-                        # and it is impossible for re-adjust under current logic
-                        if isinstance(
-                            obj,
-                            (
-                                EncoderLabel,
-                                EncoderOneHot,
-                                EncoderUniform,
-                                EncoderDateDiff,
-                                ScalerLog,
-                                ScalerLog1p,
-                                ScalerMinMax,
-                                ScalerStandard,
-                                ScalerZeroCenter,
-                            ),
-                        ):
-                            pass
-
-                    # Log post-transformation statistics
-                    if self.transformed[col].dtype.kind in "biufc":
-                        self.logger.debug(
-                            f"  > Post-transform stats: "
-                            f"mean={self.transformed[col].mean():.4f}, "
-                            f"std={self.transformed[col].std():.4f}, "
-                            f"na_cnt={self.transformed[col].isna().sum()}"
-                        )
+        if record:
+            self._record_schema_snapshot(
+                "before_transform", self._metadata, self.transformed
+            )
 
-                self.logger.info(f"Completed {processor} transformation")
+        with self._column_pool():
+            # _adjust_working_config() may compile the plan again,
+            #   so the step is read from the current plan
+            for index in range(len(self._plan.transform_steps)):
+                step: PlanStep = self._plan.transform_steps[index]
+                processor = step.processor
+                if isinstance(processor, str):
+                    self._transform_step(step, record)
+                    continue
 
-                # Record schema after each processor step
-                self._record_schema_snapshot(
-                    f"after_{processor}", self._metadata, self.transformed
-                )
-            else:
                 # if the processor is not a string,
                 # it should be a mediator, which transforms the data directly.
-
                 self.logger.debug(
                     f"mediator: {type(processor).__name__} start transforming."
                 )
@@ -744,11 +1042,21 @@ class Processor:
                     f"before transformation: data shape: {self.transformed.shape}"
                 )
 
+                start = time.perf_counter()
                 # MediatorScaler for TimeAnchor should use Encoder transformed results sometimes.\
                 if isinstance(processor, MediatorScaler):
                     processor.fit(self.transformed)
 
                 self.transformed = processor.transform(self.transformed)
+                if self._profile is not None:
+                    self._record_profile(
+                        "transform",
+                        type(processor).__name__,
+                        None,
+                        processor,
+                        time.perf_counter() - start,
+                        self.transformed,
+                    )
                 if isinstance(processor, MediatorEncoder) or isinstance(
                     processor, MediatorScaler
                 ):
@@ -761,7 +1069,8 @@ class Processor:
                     #     original_metadata=self._metadata,
                     # )
                     pass
-                self._adjust_working_config(processor, self._fitting_sequence)
+                if self._adjust_working_config(processor, self._fitting_sequence):
+                    self._plan = self._compile_plan()
 
                 self.logger.debug(
                     f"after transformation: data shape: {self.transformed.shape}"
@@ -769,21 +1078,96 @@ class Processor:
                 self.logger.info(f"Completed {type(processor).__name__} transformation")
 
                 # Record schema after mediator
-                mediator_name = type(processor).__name__
-                self._record_schema_snapshot(
-                    f"after_{mediator_name}", self._metadata, self.transformed
-                )
+                if record:
+                    mediator_name = type(processor).__name__
+                    self._record_schema_snapshot(
+                        f"after_{mediator_name}", self._metadata, self.transformed
+                    )
+
+        self._is_recorded = True
 
         # Update global row count after preprocessing
         # Note: SchemaMetadata doesn't have mutable global stats like old Metadata
         # This information can be tracked separately if needed
         pass
 
-        transformed: pd.DataFrame = self.transformed.copy()
+        # The buffer is owned by this call, so it is returned without a copy
+        transformed: pd.DataFrame = self.transformed
         delattr(self, "transformed")
 
         return transformed
 
+    def _transform_step(self, step: PlanStep, record: bool) -> None:
+        """
+        Transform self.transformed through the column runs of one step.
+
+        Args:
+            step (PlanStep): The plan step of a processor, e.g. 'missing'.
+            record (bool): Whether to record the schema changes of the step.
+        """
+        processor: str = step.processor
+        self.logger.debug(f"Executing {processor} processing")
+        profiling: bool = self._profile is not None
+
+        for run in step.runs:
+            # Skip constant columns (removed by ConstantProcessor)
+            columns = tuple(col for col in run.columns if col in self.transformed)
+            if len(columns) < len(run.columns):
+                self.logger.debug(
+                    f"  > Skipping columns not in data: "
+                    f"{[col for col in run.columns if col not in columns]}"
+                )
+            if not columns:
+                continue
+
+            # Statistics are full-column passes, computed when profiling only
+            before: dict = (
+                {col: self._column_stats(self.transformed[col]) for col in columns}
+                if profiling
+                else None
+            )
+            seconds: dict = {} if profiling else None
+
+            # Special handling for EncoderDateDiff which needs the full DataFrame
+            if run.whole_frame:
+                obj = self._config[processor][columns[0]]
+                start = time.perf_counter()
+                self.transformed = obj.transform(self.transformed)
+                if profiling:
+                    seconds[columns[0]] = time.perf_counter() - start
+            else:
+                results = self._apply_columns(
+                    processor, "transform", columns, self.transformed, seconds
+                )
+                for col, result in zip(columns, results, strict=True):
+                    self.transformed[col] = result
+
+            for col in columns:
+                # Update metadata based on processor's SCHEMA_TRANSFORM
+                if record:
+                    self._update_metadata_after_transform(
+                        col, self._config[processor][col], processor
+                    )
+
+                if profiling:
+                    self._record_profile(
+                        "transform",
+                        processor,
+                        col,
+                        self._config[processor][col],
+                        seconds[col],
+                        self.transformed,
+                        before[col],
+                    )
+
+        self.logger.info(f"Completed {processor} transformation")
+
+        # Record schema after each processor step
+        if record:
+            self._record_schema_snapshot(
+                f"after_{processor}", self._metadata, self.transformed
+            )
+
     def inverse_transform(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Inverse transform the data through a series of procedures.
@@ -806,134 +1190,212 @@ class Processor:
             ).ravel()
         )
 
-        for col, obj in self._config["missing"].items():
-            if obj is None:
-                continue
-            obj.set_imputation_index(index_list)
-
-            try:
-                with warnings.catch_warnings():
-                    # ignore the known warning about RuntimeWarning:
-                    # invalid value encountered in scalar divide
-                    warnings.simplefilter("ignore")
-                    # the NA percentage taking global NA percentage
-                    # into consideration
-                    field_na_percentage = self._get_field_na_percentage(col)
-                    adjusted_na_percentage: float = (
-                        field_na_percentage / self._na_percentage_global
-                    )
-                    # Ensure adjusted_na_percentage is within valid range [0.0, 1.0]
-                    adjusted_na_percentage = max(0.0, min(1.0, adjusted_na_percentage))
-            # if there is no NA in the original data
-            except ZeroDivisionError:
-                adjusted_na_percentage: float = 0.0
+        profiling: bool = self._profile is not None
+        if profiling:
+            self._profile_call += 1
 
+        for col, adjusted_na_percentage in self._plan.na_percentages:
+            obj = self._config["missing"][col]
+            obj.set_imputation_index(index_list)
             obj.set_na_percentage(adjusted_na_percentage)
 
-        # there is no method for restoring outliers
-        self._inverse_sequence = self._sequence.copy()
-        self._inverse_sequence.reverse()
-        if "outlier" in self._inverse_sequence:
-            self._inverse_sequence.remove("outlier")
-
-        if "encoder" in self._inverse_sequence:
-            # if encoder is in the procedure,
-            # MediatorEncoder should be in the queue
-            # right after the encoder
-            self._inverse_sequence.insert(
-                self._inverse_sequence.index("encoder"), self._mediator["encoder"]
-            )
-            self.logger.debug("MediatorEncoder created for inverse transform")
-
         if "discretizing" in self._inverse_sequence:
             # if discretizing is in the procedure,
             # remove all of NA values in the data
             # See #440
-            data = data.dropna()
-
-        if "scaler" in self._inverse_sequence:
-            # if scaler is in the procedure,
-            # MediatorScaler should be in the queue
-            # right after the scaler
-            self._inverse_sequence.insert(
-                self._inverse_sequence.index("scaler"), self._mediator["scaler"]
-            )
-            self.logger.debug("MediatorScaler created for inverse transform")
-
-        self.logger.debug("Inverse sequence generation completed.")
-
-        transformed: pd.DataFrame = data.copy()
-
-        for processor in self._inverse_sequence:
-            if isinstance(processor, str):
-                for col, obj in self._config[processor].items():
+            transformed: pd.DataFrame = data.dropna()
+        else:
+            transformed: pd.DataFrame = data.copy()
+
+        with self._column_pool():
+            for step in self._plan.inverse_steps:
+                processor = step.processor
+                if not isinstance(processor, str):
+                    # if the processor is not a string,
+                    # it should be a mediator, which transforms the data directly.
                     self.logger.debug(
-                        f"{processor}: {type(obj).__name__} from {col} start"
-                        + " inverse transforming."
+                        f"mediator: {type(processor).__name__} start inverse transforming."
                     )
+                    self.logger.debug(
+                        f"before transformation: data shape: {transformed.shape}"
+                    )
+                    start = time.perf_counter()
+                    transformed = processor.inverse_transform(transformed)
+                    if profiling:
+                        self._record_profile(
+                            "inverse_transform",
+                            type(processor).__name__,
+                            None,
+                            processor,
+                            time.perf_counter() - start,
+                            transformed,
+                        )
+                    self.logger.debug(
+                        f"after transformation: data shape: {transformed.shape}"
+                    )
+                    self.logger.info(
+                        f"Completed {type(processor).__name__} transformation"
+                    )
+                    continue
 
-                    if obj is None:
-                        continue
-
-                    # Some of Synthesizer will produce float type data
-                    #   (e.g. PAC-Synth, DPCTGAN),
-                    #   which will cause EncoderLabel in discretizing error.
-                    # Here we figure out if we are
-                    #    in discretizing inverse transform process,
-                    #   and object PROC_TYPE is ('encoder', 'discretizing'),
-                    #   then we will force convert the data type to int.
-                    # (See #440, also #550 for Encoder sequence error.)
-                    if (
-                        processor == "discretizing"
-                        and obj.PROC_TYPE == ("encoder", "discretizing")
-                    ) or (
-                        processor == "encoder"
-                        and isinstance(obj, EncoderLabel)
-                        and str(transformed[col].dtype).startswith("float")
-                    ):
+                # See _compile_plan() for the float outputs of Synthesizer
+                for col in step.round_columns:
+                    transformed[col] = transformed[col].round().astype(int)
+                for col in step.label_columns:
+                    if str(transformed[col].dtype).startswith("float"):
                         transformed[col] = transformed[col].round().astype(int)
 
+                for run in step.runs:
+                    # Statistics are full-column passes, computed when profiling only
+                    before: dict = (
+                        {
+                            col: self._column_stats(transformed[col])
+                            for col in run.columns
+                        }
+                        if profiling
+                        else None
+                    )
+                    seconds: dict = {} if profiling else None
+
                     # Special handling for EncoderDateDiff which needs the full DataFrame
-                    if isinstance(obj, EncoderDateDiff):
+                    if run.whole_frame:
+                        obj = self._config[processor][run.columns[0]]
+                        start = time.perf_counter()
                         transformed = obj.inverse_transform(transformed)
+                        if profiling:
+                            seconds[run.columns[0]] = time.perf_counter() - start
                     else:
-                        transformed[col] = obj.inverse_transform(transformed[col])
-
-                    # For Datetime after Scaler but not the target of ScalerAnchor (even reference will be affect)
-                    if (
-                        not is_datetime64_any_dtype(transformed[col])
-                        and self._get_field_infer_dtype(col) == "datetime"
-                    ):
-                        # TODO: here we assume every datetime should output as date...
-                        # It should be control on meteadata level
-                        transformed[col] = pd.to_datetime(transformed[col]).dt.date
+                        results = self._apply_columns(
+                            processor,
+                            "inverse_transform",
+                            run.columns,
+                            transformed,
+                            seconds,
+                        )
+                        for col, result in zip(run.columns, results, strict=True):
+                            transformed[col] = result
+
+                    for col in run.columns:
+                        # For Datetime after Scaler but not the target of ScalerAnchor (even reference will be affect)
+                        if (
+                            not is_datetime64_any_dtype(transformed[col])
+                            and self._get_field_infer_dtype(col) == "datetime"
+                        ):
+                            # TODO: here we assume every datetime should output as date...
+                            # It should be control on meteadata level
+                            transformed[col] = pd.to_datetime(transformed[col]).dt.date
+
+                        if profiling:
+                            self._record_profile(
+                                "inverse_transform",
+                                processor,
+                                col,
+                                self._config[processor][col],
+                                seconds[col],
+                                transformed,
+                                before[col],
+                            )
 
                 self.logger.info(
                     f"Completed {type(processor).__name__} inverse transformation"
                 )
-            else:
-                # if the processor is not a string,
-                # it should be a mediator, which transforms the data directly.
-                self.logger.debug(
-                    f"mediator: {type(processor).__name__} start inverse transforming."
-                )
-                self.logger.debug(
-                    f"before transformation: data shape: {transformed.shape}"
-                )
-                transformed = processor.inverse_transform(transformed)
-                self.logger.debug(
-                    f"after transformation: data shape: {transformed.shape}"
-                )
-                self.logger.info(f"Completed {type(processor).__name__} transformation")
 
         # Apply ConstantProcessor last (restore constant columns)
-        transformed = self._constant_processor.inverse_transform(transformed)
+        #   without copying the buffer owned by this call
+        transformed = self._constant_processor.inverse_transform(
+            transformed, copy=False
+        )
         self.logger.debug(
             f"Data shape after ConstantProcessor.inverse_transform: {transformed.shape}"
         )
 
         return self._align_dtypes(transformed)  # transformed
 
+    @staticmethod
+    def _column_stats(data: pd.Series) -> dict:
+        """
+        Statistics of a column for the profile.
+
+        Args:
+            data (pd.Series): The column.
+
+        Return:
+            (dict) mean and std (NaN for non-numeric columns), and na_count.
+        """
+        stats: dict = {
+            "mean": np.nan,
+            "std": np.nan,
+            "na_count": int(data.isna().sum()),
+        }
+        if data.dtype.kind in "biuf":  # numeric columns
+            for name in ("mean", "std"):
+                value = getattr(data, name)()
+                # nullable dtypes give pd.NA for all-NA columns
+                stats[name] = np.nan if pd.isna(value) else float(value)
+        return stats
+
+    def _record_profile(
+        self,
+        method: str,
+        step: str,
+        col: str | None,
+        obj: object,
+        seconds: float,
+        data: pd.DataFrame,
+        before: dict = None,
+    ) -> None:
+        """
+        Append a record to the profile.
+
+        Args:
+            method (str): 'transform' or 'inverse_transform'.
+            step (str): The processing step, or the mediator class name.
+            col (str | None): The column, None for mediators.
+            obj (object): The processor or mediator.
+            seconds (float): The seconds taken.
+            data (pd.DataFrame): The data after the operation.
+            before (dict, optional): Column statistics before the operation.
+        """
+        record: dict = {
+            "call": self._profile_call,
+            "method": method,
+            "step": step,
+            "column": col,
+            "processor": type(obj).__name__,
+            "seconds": seconds,
+            "rows": data.shape[0],
+        }
+        after: dict = (
+            self._column_stats(data[col])
+            if col is not None and col in data.columns
+            else {}
+        )
+        for stage, stats in (("before", before or {}), ("after", after)):
+            for name in ("mean", "std", "na_count"):
+                record[f"{name}_{stage}"] = stats.get(name, np.nan)
+        self._profile.append(record)
+
+        if col is not None:
+            self.logger.debug(
+                f"  > {method} {step} {col}: {seconds:.6f}s, "
+                f"mean={record['mean_before']:.4f}→{record['mean_after']:.4f}, "
+                f"std={record['std_before']:.4f}→{record['std_after']:.4f}, "
+                f"na_cnt={record['na_count_before']}→{record['na_count_after']}"
+            )
+
+    def get_profile(self) -> pd.DataFrame:
+        """
+        Get the profile of transform() and inverse_transform() since fitting,
+            one row per column operation or mediator of each call.
+
+        Return:
+            (pd.DataFrame) The profile with columns
+                call, method, step, column, processor, seconds, rows,
+                and mean, std, na_count before and after the operation.
+                Empty if the Processor is not created with profile=True.
+        """
+        return pd.DataFrame(self._profile or [], columns=self.PROFILE_COLUMNS)
+
     # determine whether the processors are not default settings
     def get_changes(self) -> dict:
         """
@@ -963,7 +1425,7 @@ class Processor:
 
         return pd.DataFrame(changes_dict)
 
-    def _adjust_working_config(self, mediator: Mediator, sequence: list) -> None:
+    def _adjust_working_config(self, mediator: Mediator, sequence: list) -> bool:
         """
         Adjust the working config for the downstream tasks.
 
@@ -983,8 +1445,10 @@ class Processor:
                 of the adjustment.
 
         Return:
-            None: It will adjust the working config directly.
+            (bool): Whether new columns are added to the working config,
+                which outdates the execution plan.
         """
+        is_added: bool = False
         if len(mediator.map) == 0:
             pass
         else:
@@ -1000,10 +1464,14 @@ class Processor:
 
                     for ori_col, new_col in mediator.map.items():
                         for col in new_col:
+                            if col not in self._working_config[processor]:
+                                is_added = True
                             self._working_config[processor][col] = deepcopy(
                                 self._config[processor][ori_col]
                             )
 
+        return is_added
+
     def _update_metadata_after_transform(
         self, col: str, obj: object, processor_type: str
     ) -> None:
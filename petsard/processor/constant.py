@@ -68,11 +68,13 @@ class ConstantProcessor:
 
         return data.copy()
 
-    def inverse_transform(self, data: pd.DataFrame) -> pd.DataFrame:
+    def inverse_transform(self, data: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """Inverse transform the data (restore constant columns)
 
         Args:
             data: Data to inverse transform
+            copy: Whether to copy the data before restoring,
+                False modifies data in place
 
         Returns:
             Data after restoring constant columns
@@ -84,7 +86,7 @@ class ConstantProcessor:
 
         # Restore constant columns
         if self._constant_columns:
-            result = data.copy()
+            result = data.copy() if copy else data
 
             # Add constant columns back
             for col_name, const_value in self._constant_columns.items():
@@ -101,7 +103,7 @@ class ConstantProcessor:
 
             return result
 
-        return data.copy()
+        return data.copy() if copy else data
 
     @property
     def is_fitted(self) -> bool:
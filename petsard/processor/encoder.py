@@ -192,25 +192,55 @@ class EncoderUniform(SchemaTransformMixin, Encoder):
             For example, a column with two categories (e.g., 'Male', 'Female')
                   can be mapped to [0.0, 0.5) and [0.5, 1], respectively.
 
+        Each value is mapped to the position of its label once,
+            then all values are drawn in one uniform(lower, upper) call.
+
         Args:
             data (pd.Series): The categorical data needed to be transformed.
 
         Return:
             (np.ndarray): The transformed data.
         """
+        codes = self._label_codes(data)
+        if (codes < 0).any():
+            raise ValueError(
+                "The data contains missing values that the object hasn't seen",
+                " in the fitting process.",
+                " Please check the data again.",
+            )
+
+        return self._rgenerator.uniform(
+            self.lower_values[codes], self.upper_values[codes]
+        )
+
+    def _label_codes(self, data: pd.Series) -> np.ndarray:
+        """
+        Map values to the positions of their labels in self.labels.
+
+        Args:
+            data (pd.Series): The categorical data.
+
+        Return:
+            (np.ndarray): Label positions, -1 for values without a label.
+        """
+        # NA keys are matched by pd.isna, as dict_get_na does
+        na_positions = [i for i, label in enumerate(self.labels) if pd.isna(label)]
+        na_position = na_positions[0] if na_positions else -1
+        label_positions = [i for i, label in enumerate(self.labels) if pd.notna(label)]
+        label_index = pd.Index([self.labels[i] for i in label_positions], dtype=object)
+        label_positions = np.append(np.array(label_positions, dtype=np.intp), -1)
 
         if isinstance(data.dtype, pd.api.types.CategoricalDtype):
-            data_obj = data.astype(object)
-        else:
-            data_obj = data.copy()
-
-        return data_obj.map(
-            lambda x: self._rgenerator.uniform(
-                dict_get_na(self.cat_to_val, x)[0],
-                dict_get_na(self.cat_to_val, x)[1],
-                size=1,
-            )[0]
-        ).values
+            # Match the categories only, then gather by category codes
+            category_codes = label_positions[
+                label_index.get_indexer(data.cat.categories.astype(object))
+            ]
+            category_codes = np.append(category_codes, na_position)
+            return category_codes[data.cat.codes.to_numpy()]
+
+        codes = label_positions[label_index.get_indexer(data.astype(object))]
+        codes[data.isna().to_numpy()] = na_position
+        return codes
 
     def _inverse_transform(self, data: pd.Series) -> pd.Series:
         """
@@ -436,6 +466,14 @@ class EncoderDateDiff(Encoder):
         absolute_value (bool): Whether to return absolute differences
     """
 
+    # Days per diff_unit, months and years are approximate
+    UNIT_DAYS: dict[str, float] = {
+        "days": 1,
+        "weeks": 7,
+        "months": 30.44,
+        "years": 365.25,
+    }
+
     def __init__(
         self,
         baseline_date: str,
@@ -469,86 +507,53 @@ class EncoderDateDiff(Encoder):
         self._original_dtypes = {}
         self.is_fitted = False
 
-    def _calc_date_diff(self, baseline_date, compare_date) -> float | None:
+    def _calc_date_diff(
+        self, baseline_date: pd.Series, compare_date: pd.Series
+    ) -> pd.Series:
         """
-        Calculate the difference between two dates.
+        Calculate the differences between two datetime columns.
+
+        Differences are whole days (floored, as Timedelta.days) converted to
+        the specified unit in bulk.
 
         Args:
-            baseline_date: The baseline date
-            compare_date: The date to compare with the baseline
+            baseline_date: The baseline dates, datetime64
+            compare_date: The dates to compare with the baseline, datetime64
 
         Returns:
-            Difference between dates in the specified unit, or None if inputs are invalid
+            Differences in the specified unit, NaN where either date is NaT
         """
-        if pd.isna(baseline_date) or pd.isna(compare_date):
-            return None
-
-        # Convert to pandas Timestamp if not already
-        if not isinstance(baseline_date, pd.Timestamp):
-            try:
-                baseline_date = pd.to_datetime(baseline_date)
-            except Exception:
-                return None
-
-        if not isinstance(compare_date, pd.Timestamp):
-            try:
-                compare_date = pd.to_datetime(compare_date)
-            except Exception:
-                return None
-
-        # Calculate difference in days
-        diff_days = (compare_date - baseline_date).days
+        diff_days = (compare_date - baseline_date).dt.days
 
         # Apply absolute value if needed
         if self.absolute_value:
-            diff_days = abs(diff_days)
+            diff_days = diff_days.abs()
 
-        # Convert to requested unit
+        # Convert to requested unit, months and years are approximate
         if self.diff_unit == "days":
             return diff_days
-        elif self.diff_unit == "weeks":
-            return diff_days / 7
-        elif self.diff_unit == "months":
-            # Approximate months calculation
-            return diff_days / 30.44
-        elif self.diff_unit == "years":
-            # Approximate years calculation
-            return diff_days / 365.25
-        else:
-            return diff_days  # Default to days
+        return diff_days / self.UNIT_DAYS[self.diff_unit]
 
-    def _calc_date_from_diff(self, baseline_date, diff_value) -> pd.Timestamp | None:
+    def _calc_date_from_diff(
+        self, baseline_date: pd.Series, diff_value: pd.Series
+    ) -> pd.Series:
         """
-        Calculate a date from a baseline date and a difference value.
+        Calculate dates from baseline dates and difference values.
 
         Args:
-            baseline_date: The baseline date
-            diff_value: The difference value in the specified unit
+            baseline_date: The baseline dates, datetime64
+            diff_value: The difference values in the specified unit
 
         Returns:
-            Calculated date, or None if inputs are invalid
+            Calculated dates, NaT where the baseline or the difference is missing
         """
-        if pd.isna(baseline_date) or pd.isna(diff_value):
-            return None
-
-        # Convert to pandas Timestamp if not already
-        if not isinstance(baseline_date, pd.Timestamp):
-            try:
-                baseline_date = pd.to_datetime(baseline_date)
-            except Exception:
-                return None
-
         # Convert diff_value to days based on the unit
-        days = diff_value
-        if self.diff_unit == "weeks":
-            days = diff_value * 7
-        elif self.diff_unit == "months":
-            days = diff_value * 30.44  # Approximate
-        elif self.diff_unit == "years":
-            days = diff_value * 365.25  # Approximate
+        days = pd.to_numeric(diff_value, errors="coerce").astype("float64")
+        if self.diff_unit != "days":
+            days = days * self.UNIT_DAYS[self.diff_unit]
 
-        # Calculate the date
-        return baseline_date + pd.Timedelta(days=days)
+        # Calculate the dates
+        return baseline_date + pd.to_timedelta(days, unit="D")
 
     def fit(self, data: pd.DataFrame) -> None:
         """
@@ -649,12 +654,8 @@ class EncoderDateDiff(Encoder):
             if not pd.api.types.is_datetime64_any_dtype(result[col]):
                 result[col] = pd.to_datetime(result[col], errors="coerce")
 
-            # Calculate difference
-            # Capture loop variable to avoid B023
-            def calc_diff(row, column=col):
-                return self._calc_date_diff(row[self.baseline_date], row[column])
-
-            result[col] = result.apply(calc_diff, axis=1)
+            # Calculate difference on the whole columns
+            result[col] = self._calc_date_diff(result[self.baseline_date], result[col])
 
         return result
 
@@ -682,14 +683,10 @@ class EncoderDateDiff(Encoder):
         # Calculate dates from differences
         for col in self.related_date_list:
             if col in result.columns:
-                # Calculate date from difference
-                # Capture loop variable to avoid B023
-                def calc_date(row, column=col):
-                    return self._calc_date_from_diff(
-                        row[self.baseline_date], row[column]
-                    )
-
-                result[col] = result.apply(calc_date, axis=1)
+                # Calculate date from difference on the whole columns
+                result[col] = self._calc_date_from_diff(
+                    result[self.baseline_date], result[col]
+                )
 
                 # Convert back to original dtype if possible
                 if col in self._original_dtypes:
@@ -5,9 +5,11 @@ ReporterSaveSchema - Output schema yaml files used by specified source modules
 import logging
 from typing import Any
 
+import numpy as np
 import yaml
 
 from petsard.exceptions import ConfigError
+from petsard.metadater import AttributeMetadater
 from petsard.reporter.reporter_base import BaseReporter, RegexPatterns
 
 
@@ -555,16 +557,13 @@ class ReporterSaveSchema(BaseReporter):
         if len(non_null) == 0:
             return 2  # default 2 decimal places
 
-        decimal_places = 0
-        # Only check first max_check values for efficiency
-        for val in non_null.head(max_check):
-            # Convert to string and check decimal places
-            val_str = f"{val:.10f}".rstrip("0").rstrip(".")
-            if "." in val_str:
-                decimal_places = max(decimal_places, len(val_str.split(".")[1]))
-
+        # Only check first max_check values, rounded to 10 places to drop float noise
         # Limit to max 6 decimal places
-        return min(decimal_places, 6) if decimal_places > 0 else 2
+        decimal_places = AttributeMetadater.infer_decimal_places(
+            np.round(non_null.head(max_check).to_numpy(dtype="float64"), 10),
+            max_precision=6,
+        )
+        return decimal_places if decimal_places else 2
 
     def _save_schema_to_yaml(self, schema_dict: dict, filename: str) -> None:
         """
@@ -5,6 +5,7 @@ from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from petsard.adapter import BaseAdapter
@@ -85,7 +86,7 @@ class TimingLogHandler(logging.Handler):
         super().__init__()
         self.status = status_instance
         self._timing_pattern = re.compile(
-            r"TIMING_(\w+)\|([^|]+)\|([^|]+)\|([^|]+)(?:\|([^|]+))?"
+            r"TIMING_(\w+)\|([^|]+)\|([^|]+)\|([^|]+)(?:\|([^|]+))?(?:\|(.+))?"
         )
 
     def emit(self, record):
@@ -99,9 +100,14 @@ class TimingLogHandler(logging.Handler):
             if not match:
                 return
 
-            timing_type, module_name, step_name, timestamp_str, duration_str = (
-                match.groups()
-            )
+            (
+                timing_type,
+                module_name,
+                step_name,
+                timestamp_str,
+                duration_str,
+                extra_str,
+            ) = match.groups()
             timestamp = float(timestamp_str)
             duration = float(duration_str) if duration_str else None
 
@@ -113,6 +119,8 @@ class TimingLogHandler(logging.Handler):
                 )
             elif timing_type in ["END", "ERROR"]:
                 context = {"status": "error" if timing_type == "ERROR" else "completed"}
+                if timing_type == "END" and extra_str:
+                    context.update(self._parse_context(extra_str))
                 self.status._handle_timing_end(
                     module_name, expt_name, step_name, timestamp, duration, context
                 )
@@ -120,6 +128,23 @@ class TimingLogHandler(logging.Handler):
         except (ValueError, TypeError, AttributeError):
             pass  # Silently ignore parsing errors
 
+    @staticmethod
+    def _parse_context(extra_str: str) -> dict[str, Any]:
+        """Parse "key=value,key=value" measurements appended to a TIMING_END"""
+        context: dict[str, Any] = {}
+        for item in extra_str.split(","):
+            key, sep, value = item.partition("=")
+            if not sep:
+                continue
+            try:
+                context[key.strip()] = int(value)
+            except ValueError:
+                try:
+                    context[key.strip()] = float(value)
+                except ValueError:
+                    context[key.strip()] = value.strip()
+        return context
+
 
 class Status:
     """
@@ -185,7 +210,7 @@ class Status:
 
         # Compatibility support for original features
         if "Splitter" in self.sequence:
-            self.exist_train_indices: list[set] = []
+            self.exist_train_indices: list[np.ndarray] = []
         if "Reporter" in self.sequence:
             self.report: dict = {}
 
@@ -685,16 +710,16 @@ class Status:
                 for seq_module in sub_sequence
             }
 
-    def get_exist_train_indices(self) -> list[set]:
-        """Get the list of unique training index sets generated by the Splitter module"""
+    def get_exist_train_indices(self) -> list[np.ndarray]:
+        """Get the list of training index arrays generated by the Splitter module"""
         return self.exist_train_indices
 
-    def update_exist_train_indices(self, new_indices: list[set]) -> None:
+    def update_exist_train_indices(self, new_indices: list[np.ndarray]) -> None:
         """
-        Update exist_train_indices by adding new training indices to the set list
+        Update exist_train_indices by adding new training indices to the array list
 
         Args:
-            new_indices: New training index set list[set]
+            new_indices: New training index array list[np.ndarray]
         """
         if not hasattr(self, "exist_train_indices"):
             self.exist_train_indices = []
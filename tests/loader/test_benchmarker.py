@@ -2,6 +2,8 @@ import hashlib
 import os
 import shutil
 import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
@@ -102,9 +104,19 @@ class TestBenchmarker:
         with patch("builtins.open", mock_open()) as _:  # mock_file
             with patch.object(BenchmarkerRequests, "_verify_file") as mock_verify:
                 benchmarker = BenchmarkerRequests(sample_config)
-                with patch("os.makedirs", side_effect=None):
+                with (
+                    patch("os.makedirs", side_effect=None),
+                    patch("os.replace") as mock_replace,
+                ):
                     benchmarker.download()
                     mock_verify.assert_called_once_with(already_exist=False)
+                    mock_replace.assert_called_once_with(
+                        "benchmark/test.csv.part", "benchmark/test.csv"
+                    )
+                assert (
+                    benchmarker._download_sha256
+                    == hashlib.sha256(b"test_content").hexdigest()
+                )
 
     def test_verify_file_mismatch_error(self, sample_config):
         """Test verification of file with mismatched SHA256 - should raise BenchmarkDatasetsError
@@ -313,3 +325,125 @@ class TestBenchmarker:
 
             # Check error message
             assert "SHA-256 verification FAILED" in str(exc_info.value)
+
+
+class _RangeRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler serving one payload with Range support, optionally cut short
+    支援 Range 並可中斷傳輸的 HTTP 處理器
+    """
+
+    payload: bytes = b""
+    cut_at: int | None = None
+    requests_seen: list = []
+
+    def do_GET(self):
+        """Serve the payload, or the requested range of it
+        回傳內容或指定範圍
+        """
+        range_header = self.headers.get("Range")
+        self.requests_seen.append(range_header)
+        start = int(range_header[6:-1]) if range_header else 0
+        if start >= len(self.payload):
+            self.send_response(416)
+            self.end_headers()
+            return
+        body = self.payload[start:]
+        self.send_response(206 if range_header else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.cut_at is not None and not range_header:
+            # Drop the connection in the middle of the body
+            self.wfile.write(body[: self.cut_at])
+            self.wfile.flush()
+            self.connection.close()
+            return
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Silence request logs
+        關閉請求日誌
+        """
+
+
+class TestBenchmarkerResumableDownload:
+    """Test cases for resumable verified downloads and the shared manifest
+    可續傳且驗證的下載與共享 manifest 的測試案例
+    """
+
+    @pytest.fixture
+    def server(self):
+        """Local HTTP server standing in for the benchmark bucket
+        以本機 HTTP 伺服器替代 benchmark bucket
+        """
+        _RangeRequestHandler.payload = os.urandom(300_000)
+        _RangeRequestHandler.cut_at = None
+        _RangeRequestHandler.requests_seen = []
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), _RangeRequestHandler)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{httpd.server_address[1]}/data.csv"
+        httpd.shutdown()
+        httpd.server_close()
+
+    def _config(self, url, tmp_path):
+        """Benchmarker config pointing to the local server
+        指向本機伺服器的 benchmarker 配置
+        """
+        return {
+            "filepath": str(tmp_path / "data.csv"),
+            "benchmark_bucket_name": "local",
+            "benchmark_filename": "data.csv",
+            "benchmark_sha256": hashlib.sha256(
+                _RangeRequestHandler.payload
+            ).hexdigest(),
+            "benchmark_url": url,
+        }
+
+    def test_download_hashes_while_streaming(self, server, tmp_path):
+        """Test a download is verified without reading the file again
+        測試下載時即計算雜湊，不再重新讀取檔案
+        """
+        benchmarker = BenchmarkerRequests(self._config(server, tmp_path))
+        with patch("petsard.loader.benchmarker.digest_sha256") as mock_digest:
+            benchmarker.download()
+            mock_digest.assert_not_called()
+
+        assert benchmarker.config["benchmark_already_exist"]
+        assert (tmp_path / "data.csv").read_bytes() == _RangeRequestHandler.payload
+        assert not (tmp_path / "data.csv.part").exists()
+
+    def test_download_resumes_partial_file(self, server, tmp_path):
+        """Test an interrupted download keeps its partial file and resumes it
+        測試中斷的下載保留部分檔案並續傳
+        """
+        _RangeRequestHandler.cut_at = 200_000
+        benchmarker = BenchmarkerRequests(self._config(server, tmp_path))
+        with pytest.raises(BenchmarkDatasetsError):
+            benchmarker.download()
+        # Only the chunks received completely are kept
+        partial_size = (tmp_path / "data.csv.part").stat().st_size
+        assert 0 < partial_size <= 200_000
+
+        _RangeRequestHandler.cut_at = None
+        benchmarker = BenchmarkerRequests(self._config(server, tmp_path))
+        benchmarker.download()
+
+        assert _RangeRequestHandler.requests_seen[-1] == f"bytes={partial_size}-"
+        assert (tmp_path / "data.csv").read_bytes() == _RangeRequestHandler.payload
+
+    def test_manifest_skips_rehash(self, server, tmp_path):
+        """Test a verified file recorded in the manifest is not hashed again
+        測試 manifest 中已驗證的檔案不再重新計算雜湊
+        """
+        BenchmarkerRequests(self._config(server, tmp_path)).download()
+        assert (tmp_path / "manifest.json").exists()
+
+        with patch("petsard.loader.benchmarker.digest_sha256") as mock_digest:
+            benchmarker = BenchmarkerRequests(self._config(server, tmp_path))
+            mock_digest.assert_not_called()
+        assert benchmarker.config["benchmark_already_exist"]
+
+        # A modified file no longer matches its manifest entry
+        (tmp_path / "data.csv").write_bytes(b"modified")
+        with pytest.raises(BenchmarkDatasetsError):
+            BenchmarkerRequests(self._config(server, tmp_path))
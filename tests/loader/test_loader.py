@@ -60,6 +60,9 @@ class TestLoaderConfig:
             ("path/to/file.xls", ".xls", LoaderFileExt.EXCELTYPE),
             ("path/to/file.CSV", ".csv", LoaderFileExt.CSVTYPE),
             ("path/to/file.XLSX", ".xlsx", LoaderFileExt.EXCELTYPE),
+            ("path/to/file.parquet", ".parquet", LoaderFileExt.PARQUETTYPE),
+            ("path/to/file.feather", ".feather", LoaderFileExt.ARROWTYPE),
+            ("path/to/file.arrow", ".arrow", LoaderFileExt.ARROWTYPE),
         ],
     )
     def test_file_extension_handling(self, filepath, expected_ext, expected_code):
@@ -160,6 +163,35 @@ class TestBenchmarkerConfig:
             assert benchmarker_config["benchmark_sha256"] == "test-hash"
             assert str(benchmarker_config["filepath"]).endswith("benchmark/adult.csv")
 
+    def test_benchmarker_config_shared_benchmark_dir(self, monkeypatch, tmp_path):
+        """Test the benchmark directory can be shared through an environment variable
+        測試可透過環境變數指定共享的 benchmark 目錄
+        """
+        monkeypatch.setenv(BenchmarkerConfig.BENCHMARK_DIR_ENV, str(tmp_path))
+        with patch.object(
+            BenchmarkerConfig, "_load_benchmark_config"
+        ) as mock_load_config:
+            mock_load_config.return_value = {
+                "adult-income": {
+                    "filename": "adult.csv",
+                    "access": "public",
+                    "region_name": "us-west-2",
+                    "bucket_name": "test-bucket",
+                    "sha256": "test-hash",
+                }
+            }
+
+            config = BenchmarkerConfig(benchmark_name="adult-income")
+            assert config.benchmark_dir == str(tmp_path)
+            assert config.get_benchmarker_config()["filepath"] == tmp_path / "adult.csv"
+
+            config = BenchmarkerConfig(
+                benchmark_name="adult-income", benchmark_dir="other"
+            )
+            assert str(config.get_benchmarker_config()["filepath"]).endswith(
+                "other/adult.csv"
+            )
+
     def test_benchmarker_config_unsupported_benchmark(self):
         """Test unsupported benchmark raises error
         測試不支援的基準資料集會引發錯誤
@@ -931,6 +963,10 @@ class TestLoaderFileExt:
             (".xlsb", LoaderFileExt.EXCELTYPE),
             (".ods", LoaderFileExt.EXCELTYPE),
             (".odt", LoaderFileExt.EXCELTYPE),
+            (".parquet", LoaderFileExt.PARQUETTYPE),
+            (".PARQUET", LoaderFileExt.PARQUETTYPE),
+            (".feather", LoaderFileExt.ARROWTYPE),
+            (".arrow", LoaderFileExt.ARROWTYPE),
         ],
     )
     def test_get_file_ext_code(self, file_ext, expected_code):
@@ -946,6 +982,23 @@ class TestLoaderFileExt:
         with pytest.raises(KeyError):
             LoaderFileExt.get(".unsupported")
 
+    @pytest.mark.parametrize(
+        "file_name,expected",
+        [
+            ("data.csv", (".csv", None)),
+            ("data.csv.gz", (".csv", "gzip")),
+            ("data.CSV.BZ2", (".csv", "bz2")),
+            ("data.csv.zst", (".csv", "zstd")),
+            ("data.parquet.xz", (".parquet", "xz")),
+            ("data.tar.gz", (".tar", "gzip")),
+        ],
+    )
+    def test_split_compression(self, file_name, expected):
+        """Test splitting the compression suffix off file names
+        測試從檔名分離壓縮副檔名
+        """
+        assert LoaderFileExt.split_compression(file_name) == expected
+
 
 class TestLoaderSchemaParameters:
     """Test cases for schema parameter functionality in Loader
@@ -1291,3 +1344,1105 @@ class TestLoaderSchemaEdgeCases:
                 column_types={"category": ["col1"]},  # This conflicts with schema
                 schema=schema_config,
             )
+
+
+class TestLoaderChunksize:
+    """Test cases for chunked streaming load
+    分塊串流載入的測試案例
+    """
+
+    @pytest.fixture
+    def large_csv_path(self, tmp_path):
+        """Create a CSV file spanning several chunks
+        創建跨越多個分塊的 CSV 檔案
+        """
+        row_count = 1000
+        data = pd.DataFrame(
+            {
+                "id": [f"id_{i}" for i in range(row_count)],
+                "age": [20 + i % 50 for i in range(row_count)],
+                "score": [None if i % 7 == 0 else i / 8 for i in range(row_count)],
+                "grade": [["A", "B", "C"][i % 3] for i in range(row_count)],
+            }
+        )
+        csv_file = tmp_path / "large.csv"
+        data.to_csv(csv_file, index=False)
+        return str(csv_file)
+
+    def test_chunksize_validation(self):
+        """Test chunksize must be a positive integer on supported files
+        測試 chunksize 必須為正整數且僅支援可串流的檔案
+        """
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", chunksize=0)
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", chunksize="100")
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.xlsx", chunksize=100)
+
+        config = LoaderConfig(filepath="path/to/file.csv", chunksize=100)
+        assert config.chunksize == 100
+
+    def test_chunked_load_matches_full_load(self, large_csv_path):
+        """Test chunked load returns the same values and schema as full load
+        測試分塊載入與完整載入的資料及 schema 一致
+        """
+        full_data, full_schema = Loader(filepath=large_csv_path).load()
+        chunk_data, chunk_schema = Loader(filepath=large_csv_path, chunksize=128).load()
+
+        assert chunk_data.shape == full_data.shape
+        assert list(chunk_data.columns) == list(full_data.columns)
+        pd.testing.assert_frame_equal(
+            chunk_data.astype(object), full_data.astype(object)
+        )
+
+        for col in full_data.columns:
+            full_attr = full_schema.attributes[col]
+            chunk_attr = chunk_schema.attributes[col]
+            assert chunk_attr.type == full_attr.type
+            assert chunk_attr.type_attr == full_attr.type_attr
+
+    def test_chunked_load_compacts_dtypes(self, large_csv_path):
+        """Test chunked load downcasts integers and keeps categories compact
+        測試分塊載入會縮減整數型別並以類別儲存
+        """
+        data, schema = Loader(filepath=large_csv_path, chunksize=128).load()
+
+        assert data["age"].dtype == "int8"
+        assert isinstance(data["grade"].dtype, pd.CategoricalDtype)
+        assert schema.attributes["grade"].type_attr["category"] is True
+        # High-cardinality strings are not categorical
+        assert data["id"].dtype == "object"
+        assert schema.attributes["id"].type_attr["category"] is False
+
+    def test_chunked_load_with_schema(self, large_csv_path):
+        """Test chunked load keeps attributes defined in schema
+        測試分塊載入保留 schema 中定義的欄位屬性
+        """
+        schema_config = {
+            "id": "chunk_schema",
+            "attributes": {"score": {"type": "float", "precision": 1}},
+        }
+
+        data, schema = Loader(
+            filepath=large_csv_path, chunksize=128, schema=schema_config
+        ).load()
+
+        assert schema.id == "chunk_schema"
+        assert schema.attributes["score"].type_attr["precision"] == 1
+        assert set(schema.attributes) == set(data.columns)
+
+
+class TestLoaderArrow:
+    """Test cases for Parquet / Feather / Arrow loading
+    Parquet / Feather / Arrow 載入的測試案例
+    """
+
+    @pytest.fixture
+    def sample_data(self):
+        """Sample data with numeric, categorical and nullable columns
+        包含數值、類別與可為空欄位的範例資料
+        """
+        return pd.DataFrame(
+            {
+                "age": [25, 30, 35, 40, 45, 50],
+                "income": [1000.5, None, 2000.25, 3000.0, 1500.75, 2500.5],
+                "gender": ["M", "F", "M", "F", "M", "F"],
+                "note": ["a", "b", "c", "d", "e", "f"],
+            }
+        )
+
+    @pytest.mark.parametrize("file_ext", [".parquet", ".feather"])
+    def test_load_matches_csv(self, tmp_path, sample_data, file_ext):
+        """Test columnar files load the same data and schema as CSV
+        測試欄式檔案載入的資料與 schema 與 CSV 一致
+        """
+        pytest.importorskip("pyarrow")
+        csv_path = tmp_path / "data.csv"
+        arrow_path = tmp_path / f"data{file_ext}"
+        sample_data.to_csv(csv_path, index=False)
+        if file_ext == ".parquet":
+            sample_data.to_parquet(arrow_path)
+        else:
+            sample_data.to_feather(arrow_path)
+
+        csv_data, csv_schema = Loader(filepath=str(csv_path)).load()
+        arrow_data, arrow_schema = Loader(filepath=str(arrow_path)).load()
+
+        pd.testing.assert_frame_equal(arrow_data, csv_data)
+        for col in csv_data.columns:
+            assert arrow_schema.attributes[col].type == csv_schema.attributes[col].type
+
+    def test_schema_types_and_projection(self, tmp_path, sample_data):
+        """Test usecols: schema projects columns and maps types onto Arrow
+        測試 usecols: schema 投影欄位並映射 Arrow 型別
+        """
+        pytest.importorskip("pyarrow")
+        parquet_path = tmp_path / "data.parquet"
+        sample_data.to_parquet(parquet_path)
+
+        schema_config = {
+            "id": "arrow_schema",
+            "attributes": {
+                "gender": {"type": "str", "category": True},
+                "age": {"type": "float"},
+            },
+        }
+        data, schema = Loader(
+            filepath=str(parquet_path), schema=schema_config, usecols="schema"
+        ).load()
+
+        assert list(data.columns) == ["gender", "age"]
+        assert isinstance(data["gender"].dtype, pd.CategoricalDtype)
+        assert data["age"].dtype == "float64"
+        assert set(schema.attributes) == {"gender", "age"}
+
+    def test_parquet_nrows_and_chunksize(self, tmp_path, sample_data):
+        """Test nrows and chunksize on Parquet files
+        測試 Parquet 檔案的 nrows 與 chunksize
+        """
+        pytest.importorskip("pyarrow")
+        parquet_path = tmp_path / "data.parquet"
+        sample_data.to_parquet(parquet_path, row_group_size=2)
+
+        data, _ = Loader(filepath=str(parquet_path), nrows=3).load()
+        assert len(data) == 3
+
+        data, _ = Loader(
+            filepath=str(parquet_path), nrows=5, chunksize=2, usecols=["age"]
+        ).load()
+        assert list(data.columns) == ["age"]
+        assert data["age"].tolist() == [25, 30, 35, 40, 45]
+
+    def test_usecols_validation(self):
+        """Test usecols must be a list of names or 'schema' with a schema
+        測試 usecols 必須為欄位名稱列表或搭配 schema 的 'schema'
+        """
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", usecols="all")
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", usecols="schema")
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", usecols=[1, 2])
+
+    def test_csv_usecols(self, sample_csv_path):
+        """Test usecols is pushed down to the CSV reader
+        測試 usecols 傳遞給 CSV 讀取器
+        """
+        data, schema = Loader(filepath=sample_csv_path, usecols=["B"]).load()
+
+        assert list(data.columns) == ["B"]
+        assert list(schema.attributes) == ["B"]
+
+    @pytest.fixture
+    def sample_csv_path(self, tmp_path):
+        """Create a temporary CSV file for testing
+        創建臨時 CSV 檔案用於測試
+        """
+        csv_file = tmp_path / "test.csv"
+        pd.DataFrame({"A": [1, 2, 3], "B": ["x", "y", "z"]}).to_csv(
+            csv_file, index=False
+        )
+        return str(csv_file)
+
+
+class TestLoaderDtypePushdown:
+    """Test cases for schema-driven dtype pushdown to the reader
+    schema 驅動的讀取器型別下推測試案例
+    """
+
+    @pytest.fixture
+    def typed_csv_path(self, tmp_path):
+        """Create a CSV file with nullable integer and categorical columns
+        創建包含可為空整數與類別欄位的 CSV 檔案
+        """
+        csv_file = tmp_path / "typed.csv"
+        pd.DataFrame(
+            {
+                "count": [1, 2, None, 4],
+                "level": ["low", "high", "low", None],
+                "ratio": [1.5, 2.5, 3.5, 4.5],
+            }
+        ).to_csv(csv_file, index=False)
+        return str(csv_file)
+
+    def test_category_and_nullable_int_pushdown(self, typed_csv_path):
+        """Test category and nullable integer dtypes are read directly
+        測試類別與可為空整數型別直接由讀取器產生
+        """
+        schema_config = {
+            "id": "typed_schema",
+            "attributes": {
+                "count": {"type": "int"},
+                "level": {"type": "str", "category": True},
+            },
+        }
+        with patch("pandas.read_csv", wraps=pd.read_csv) as mock_read_csv:
+            data, _ = Loader(filepath=typed_csv_path, schema=schema_config).load()
+
+        dtype_arg = mock_read_csv.call_args.kwargs["dtype"]
+        assert dtype_arg["count"] == "Int64"
+        assert dtype_arg["level"] == "category"
+        assert data["count"].dtype == "Int64"
+        assert data["count"].isna().sum() == 1
+        assert isinstance(data["level"].dtype, pd.CategoricalDtype)
+
+    def test_int_pushdown_fallback(self, typed_csv_path):
+        """Test decimals in an int column fall back to reading without int dtype
+        測試整數欄位含小數時回退為不下推整數型別
+        """
+        schema_config = {
+            "id": "typed_schema",
+            "attributes": {"ratio": {"type": "int"}},
+        }
+
+        data, schema = Loader(filepath=typed_csv_path, schema=schema_config).load()
+
+        assert len(data) == 4
+        assert schema.attributes["ratio"].type == "int"
+
+
+class TestLoaderCache:
+    """Test cases for the content-addressed loader cache
+    載入器內容定址快取測試案例
+    """
+
+    @pytest.fixture
+    def cache_csv_path(self, tmp_path):
+        """Create a CSV file for cache testing
+        創建快取測試用的 CSV 檔案
+        """
+        pytest.importorskip("pyarrow")
+        csv_file = tmp_path / "cached.csv"
+        pd.DataFrame(
+            {
+                "id": range(20),
+                "level": ["low", "high", None, "mid"] * 5,
+                "score": [0.5, 1.25, None, 3.0] * 5,
+            }
+        ).to_csv(csv_file, index=False)
+        return str(csv_file)
+
+    def test_cache_hit_matches_load(self, cache_csv_path, tmp_path):
+        """Test a cache hit returns the same data and schema without reading the file
+        測試快取命中時不讀取檔案且回傳相同資料與 schema
+        """
+        cache_dir = str(tmp_path / "cache")
+        data, schema = Loader(filepath=cache_csv_path, cache_dir=cache_dir).load()
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+        with patch("pandas.read_csv") as mock_read_csv:
+            cached_data, cached_schema = Loader(
+                filepath=cache_csv_path, cache_dir=cache_dir
+            ).load()
+            mock_read_csv.assert_not_called()
+
+        pd.testing.assert_frame_equal(cached_data, data)
+        assert cached_schema.attributes == schema.attributes
+
+    def test_cache_invalidation(self, cache_csv_path, tmp_path):
+        """Test changed options or file content miss the cache
+        測試選項或檔案內容變更時不使用快取
+        """
+        cache_dir = tmp_path / "cache"
+        Loader(filepath=cache_csv_path, cache_dir=str(cache_dir)).load()
+
+        data, _ = Loader(
+            filepath=cache_csv_path, cache_dir=str(cache_dir), nrows=5
+        ).load()
+        assert len(data) == 5
+        assert len(list(cache_dir.iterdir())) == 2
+
+        pd.DataFrame({"id": [1], "level": ["low"], "score": [0.5]}).to_csv(
+            cache_csv_path, index=False
+        )
+        data, _ = Loader(filepath=cache_csv_path, cache_dir=str(cache_dir)).load()
+        assert len(data) == 1
+        assert len(list(cache_dir.iterdir())) == 3
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"chunksize": 7},
+            {"schema": {"attributes": {"when": {"type": "datetime"}}}},
+            {"schema": {"attributes": {"level": {"type": "str", "category": True}}}},
+        ],
+        ids=["chunked", "datetime_object", "category"],
+    )
+    def test_cache_round_trip_dtypes(self, tmp_path, options):
+        """Test a cache hit returns the loaded data with the same dtypes and missing values
+        測試快取命中時回傳相同型別與缺失值的資料
+        """
+        csv_file = tmp_path / "typed.csv"
+        pd.DataFrame(
+            {
+                "id": range(20),
+                "level": ["low", "high", None, "mid"] * 5,
+                "when": ["2020-01-01", "2020-02-03", None, "2021-01-01"] * 5,
+            }
+        ).to_csv(csv_file, index=False)
+        cache_dir = str(tmp_path / "cache")
+
+        cold, _ = Loader(filepath=str(csv_file), cache_dir=cache_dir, **options).load()
+        with patch("pandas.read_csv") as mock_read_csv:
+            warm, _ = Loader(
+                filepath=str(csv_file), cache_dir=cache_dir, **options
+            ).load()
+            mock_read_csv.assert_not_called()
+
+        pd.testing.assert_frame_equal(cold, warm, check_dtype=True)
+        assert cold.dtypes.to_dict() == warm.dtypes.to_dict()
+        for col in cold.columns:
+            assert [type(value) for value in cold[col]] == [
+                type(value) for value in warm[col]
+            ]
+
+    def test_cache_key_chunksize(self, cache_csv_path, tmp_path):
+        """Test chunked and unchunked loads are cached separately
+        測試分塊與非分塊載入分別快取
+        """
+        cache_dir = tmp_path / "cache"
+        Loader(filepath=cache_csv_path, cache_dir=str(cache_dir), chunksize=7).load()
+
+        data, _ = Loader(filepath=cache_csv_path, cache_dir=str(cache_dir)).load()
+        assert len(list(cache_dir.iterdir())) == 2
+        pd.testing.assert_frame_equal(data, Loader(filepath=cache_csv_path).load()[0])
+
+    def test_cache_skips_data_not_round_tripping(self, tmp_path):
+        """Test data that does not read back unchanged is not cached
+        測試無法原樣讀回的資料不寫入快取
+        """
+        from petsard.loader.loader_cache import LoaderCache
+
+        pytest.importorskip("pyarrow")
+        cache = LoaderCache(str(tmp_path / "cache"))
+        data = pd.DataFrame({"name": pd.Series(["a", None, pd.NA], dtype=object)})
+
+        cache.put("mixed", data, SchemaMetadater.from_data(data))
+
+        assert cache.get("mixed") is None
+        assert not (tmp_path / "cache" / "mixed").exists()
+
+    def test_cache_key_unseeded_sampling(self, cache_csv_path, tmp_path):
+        """Test unseeded sampling has no cache key and is never cached
+        測試未指定種子的抽樣沒有快取鍵且不寫入快取
+        """
+        from petsard.loader.loader_cache import LoaderCache
+
+        cache_dir = tmp_path / "cache"
+        cache = LoaderCache(str(cache_dir))
+        for sampling in ({"sample_size": 5}, {"sample_fraction": 0.5}):
+            assert (
+                cache.make_key(cache_csv_path, {**sampling, "random_state": None})
+                is None
+            )
+            assert cache.make_key(cache_csv_path, {**sampling, "random_state": 1})
+
+        # LoaderConfig rejects this combination, the cache still guards the key
+        loader = Loader(
+            filepath=cache_csv_path,
+            cache_dir=str(cache_dir),
+            sample_size=5,
+            random_state=1,
+        )
+        loader.config.random_state = None
+        loader.load()
+        assert not cache_dir.exists()
+
+
+class TestLoaderInferSampleSize:
+    """Test cases for sample-based schema inference in Loader
+    Loader 抽樣推斷 schema 測試案例
+    """
+
+    def test_infer_sample_size_validation(self):
+        """Test infer_sample_size must be a positive integer
+        測試 infer_sample_size 必須為正整數
+        """
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", infer_sample_size=0)
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", infer_sample_size=True)
+
+        config = LoaderConfig(filepath="path/to/file.csv", infer_sample_size=1000)
+        assert config.infer_sample_size == 1000
+
+    def test_infer_sample_size_load(self, tmp_path):
+        """Test sampled inference returns the same schema types as full inference
+        測試抽樣推斷與全量推斷得到相同型別
+        """
+        csv_file = tmp_path / "sampled.csv"
+        pd.DataFrame(
+            {
+                "id": range(2000),
+                "level": ["low", "high"] * 1000,
+                "score": [0.5, 1.25] * 1000,
+            }
+        ).to_csv(csv_file, index=False)
+
+        data, schema = Loader(filepath=str(csv_file)).load()
+        sampled_data, sampled_schema = Loader(
+            filepath=str(csv_file), infer_sample_size=100
+        ).load()
+
+        pd.testing.assert_frame_equal(sampled_data, data)
+        for col in data.columns:
+            assert sampled_schema.attributes[col].type == schema.attributes[col].type
+            assert (
+                sampled_schema.attributes[col].type_attr
+                == schema.attributes[col].type_attr
+            )
+
+
+class TestLoaderPartitions:
+    """Test cases for loading a glob pattern or directory of partitions
+    以 glob 樣式或資料夾載入分區檔案的測試案例
+    """
+
+    @pytest.fixture
+    def partition_data(self):
+        """Sample data split into three partitions
+        分成三個分區的範例資料
+        """
+        row_count = 900
+        data = pd.DataFrame(
+            {
+                "id": range(row_count),
+                "grade": [["A", "B", "C"][i % 3] for i in range(row_count)],
+                "score": [None if i % 7 == 0 else i / 8 for i in range(row_count)],
+            }
+        )
+        return [data.iloc[i : i + 300].reset_index(drop=True) for i in (0, 300, 600)]
+
+    def test_glob_csv_partitions(self, partition_data, tmp_path):
+        """Test glob partitions load as one dataset with consistent categories
+        測試 glob 分區載入為單一資料集且類別一致
+        """
+        # Partition 2 lacks "C", categories still have to be merged
+        partition_data[1] = partition_data[1][partition_data[1]["grade"] != "C"]
+        for i, part in enumerate(partition_data):
+            part.to_csv(tmp_path / f"part_{i}.csv", index=False)
+        full_data = pd.concat(partition_data, ignore_index=True)
+
+        data, schema = Loader(
+            filepath=str(tmp_path / "part_*.csv"), max_workers=2
+        ).load()
+
+        assert len(data) == len(full_data)
+        assert data["id"].tolist() == full_data["id"].tolist()
+        assert isinstance(data["grade"].dtype, pd.CategoricalDtype)
+        assert set(data["grade"].cat.categories) == {"A", "B", "C"}
+        assert data["grade"].astype(str).tolist() == full_data["grade"].tolist()
+        assert schema.attributes["grade"].type_attr["category"] is True
+
+    def test_directory_partitions(self, partition_data, tmp_path):
+        """Test a directory loads its partitions in order, skipping marker files
+        測試資料夾依序載入分區並略過標記檔案
+        """
+        pytest.importorskip("pyarrow")
+        for i, part in enumerate(partition_data):
+            part.to_parquet(tmp_path / f"part_{i}.parquet", index=False)
+        (tmp_path / "_SUCCESS").touch()
+
+        loader = Loader(filepath=str(tmp_path))
+        assert len(loader.config.filepaths) == 3
+        assert loader.config.file_name == tmp_path.name
+
+        data, _ = loader.load()
+        assert data["id"].tolist() == list(range(900))
+
+        data, _ = Loader(filepath=str(tmp_path), nrows=400).load()
+        assert data["id"].tolist() == list(range(400))
+
+    def test_partitions_with_mismatched_columns(self, partition_data, tmp_path):
+        """Test partitions with different columns raise an error
+        測試欄位不一致的分區會拋出錯誤
+        """
+        from petsard.exceptions import UnableToFollowMetadataError
+
+        partition_data[0].to_csv(tmp_path / "part_0.csv", index=False)
+        partition_data[1].drop(columns=["score"]).to_csv(
+            tmp_path / "part_1.csv", index=False
+        )
+
+        with pytest.raises(UnableToFollowMetadataError):
+            Loader(filepath=str(tmp_path / "*.csv")).load()
+
+    def test_partition_config_validation(self, tmp_path):
+        """Test invalid partition patterns and max_workers raise errors
+        測試無效的分區樣式與 max_workers 會拋出錯誤
+        """
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath=str(tmp_path / "*.csv"))
+
+        (tmp_path / "a.csv").touch()
+        (tmp_path / "b.parquet").touch()
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath=str(tmp_path))
+
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", max_workers=0)
+        config = LoaderConfig(filepath=str(tmp_path / "*.csv"), max_workers=4)
+        assert config.max_workers == 4
+        assert config.filepaths == [str(tmp_path / "a.csv")]
+
+
+class TestLoaderRowSampling:
+    """Test cases for streaming reservoir / Bernoulli row sampling
+    串流蓄水池抽樣與伯努利抽樣的測試案例
+    """
+
+    @pytest.fixture
+    def sorted_csv_path(self, tmp_path):
+        """Create a CSV file sorted by region, so its head is biased
+        創建依地區排序的 CSV 檔案，使開頭資料有偏差
+        """
+        row_count = 2000
+        csv_file = tmp_path / "sorted.csv"
+        pd.DataFrame(
+            {
+                "id": range(row_count),
+                "region": ["north"] * (row_count // 2) + ["south"] * (row_count // 2),
+            }
+        ).to_csv(csv_file, index=False)
+        return str(csv_file)
+
+    def test_sampling_validation(self):
+        """Test sampling parameters are validated and mutually exclusive
+        測試抽樣參數驗證且彼此互斥
+        """
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", sample_size=0)
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", sample_fraction=1.5)
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", sample_size=10, nrows=10)
+        with pytest.raises(ConfigError):
+            LoaderConfig(
+                filepath="path/to/file.csv", sample_size=10, sample_fraction=0.1
+            )
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", random_state="seed")
+
+        config = LoaderConfig(
+            filepath="path/to/file.csv", sample_fraction=0.01, random_state=42
+        )
+        assert config.sample_fraction == 0.01
+
+    @pytest.mark.parametrize(
+        "sampling", [{"sample_size": 5}, {"sample_fraction": 0.01}]
+    )
+    def test_sampling_cache_requires_random_state(
+        self, sorted_csv_path, tmp_path, sampling
+    ):
+        """Test unseeded sampling is rejected with cache_dir, seeded sampling is cached
+        測試未指定種子的抽樣不可搭配 cache_dir，指定種子時可快取
+        """
+        cache_dir = str(tmp_path / "cache")
+        with pytest.raises(ConfigError, match="random_state"):
+            Loader(filepath=sorted_csv_path, cache_dir=cache_dir, **sampling)
+
+        # Unseeded sampling without cache still differs between loads
+        samples = [
+            Loader(filepath=sorted_csv_path, sample_size=5).load()[0]["id"].tolist()
+            for _ in range(3)
+        ]
+        assert len({tuple(sample) for sample in samples}) > 1
+
+        first, _ = Loader(
+            filepath=sorted_csv_path, cache_dir=cache_dir, random_state=42, **sampling
+        ).load()
+        second, _ = Loader(
+            filepath=sorted_csv_path, cache_dir=cache_dir, random_state=42, **sampling
+        ).load()
+        assert second["id"].tolist() == first["id"].tolist()
+
+    def test_reservoir_sampling(self, sorted_csv_path):
+        """Test reservoir sampling keeps N uniform rows in file order, reproducibly
+        測試蓄水池抽樣保留 N 筆均勻且依檔案順序的資料，並可重現
+        """
+        data, schema = Loader(
+            filepath=sorted_csv_path, sample_size=200, chunksize=128, random_state=42
+        ).load()
+
+        assert len(data) == 200
+        assert data["id"].is_unique
+        assert data["id"].is_monotonic_increasing
+        # Both halves of the sorted file are represented, unlike nrows
+        assert set(data["region"]) == {"north", "south"}
+        assert set(schema.attributes) == {"id", "region"}
+
+        same_data, _ = Loader(
+            filepath=sorted_csv_path, sample_size=200, random_state=42
+        ).load()
+        assert same_data["id"].tolist() == data["id"].tolist()
+
+        # Asking for more rows than the file has keeps the whole file
+        data, _ = Loader(filepath=sorted_csv_path, sample_size=5000).load()
+        assert data["id"].tolist() == list(range(2000))
+
+    def test_fraction_sampling(self, sorted_csv_path):
+        """Test Bernoulli sampling keeps about the requested fraction
+        測試伯努利抽樣保留約指定比例的資料
+        """
+        data, _ = Loader(
+            filepath=sorted_csv_path, sample_fraction=0.1, random_state=7
+        ).load()
+
+        assert 100 < len(data) < 300
+        assert data["id"].is_monotonic_increasing
+        assert set(data["region"]) == {"north", "south"}
+
+
+class TestLoaderCompressedRemote:
+    """Test cases for compressed files and fsspec URLs
+    壓縮檔案與 fsspec URL 的測試案例
+    """
+
+    @pytest.fixture
+    def sample_data(self):
+        """Sample data with integer and categorical columns
+        包含整數與類別欄位的範例資料
+        """
+        return pd.DataFrame({"id": range(500), "grade": ["A", "B"] * 250})
+
+    @pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz", ".zip"])
+    def test_compressed_csv(self, sample_data, tmp_path, suffix):
+        """Test compressed CSV files load like plain CSV, also in chunks
+        測試壓縮 CSV 檔案與一般 CSV 載入結果一致，分塊載入亦同
+        """
+        csv_file = tmp_path / f"data.csv{suffix}"
+        sample_data.to_csv(csv_file, index=False)
+
+        loader = Loader(filepath=str(csv_file))
+        assert loader.config.file_ext == ".csv"
+        assert loader.config.file_name == "data"
+        data, _ = loader.load()
+        assert data["id"].tolist() == sample_data["id"].tolist()
+
+        data, _ = Loader(filepath=str(csv_file), chunksize=128).load()
+        assert data["grade"].astype(str).tolist() == sample_data["grade"].tolist()
+
+    @pytest.mark.parametrize("compression", ["gzip", "zstd"])
+    def test_compressed_parquet(self, sample_data, tmp_path, compression):
+        """Test compressed Parquet files are decompressed while reading
+        測試壓縮 Parquet 檔案於讀取時解壓縮
+        """
+        pa = pytest.importorskip("pyarrow")
+        parquet_file = tmp_path / "data.parquet"
+        sample_data.to_parquet(parquet_file, index=False)
+        suffix = {"gzip": ".gz", "zstd": ".zst"}[compression]
+        with pa.output_stream(
+            str(parquet_file) + suffix, compression=compression
+        ) as stream:
+            stream.write(parquet_file.read_bytes())
+
+        data, _ = Loader(filepath=str(parquet_file) + suffix, chunksize=128).load()
+        assert data["id"].tolist() == sample_data["id"].tolist()
+
+    def test_unsupported_compression(self):
+        """Test compressions a file type cannot read raise an error
+        測試檔案類型不支援的壓縮格式會拋出錯誤
+        """
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.xlsx.gz")
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.parquet.zip")
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", storage_options={"anon": True})
+
+    def test_fsspec_url(self, sample_data, tmp_path):
+        """Test fsspec URLs load files and partitions, with a local directory stand-in
+        測試以本機資料夾替身透過 fsspec URL 載入檔案與分區
+        """
+        pytest.importorskip("fsspec")
+        sample_data.to_csv(tmp_path / "data.csv.gz", index=False)
+        (tmp_path / "parts").mkdir()
+        for i in range(2):
+            sample_data.iloc[i * 250 : (i + 1) * 250].to_csv(
+                tmp_path / "parts" / f"part_{i}.csv", index=False
+            )
+        storage_options = {"path": str(tmp_path), "target_protocol": "file"}
+
+        data, _ = Loader(
+            filepath="dir://data.csv.gz", storage_options=storage_options
+        ).load()
+        assert data["id"].tolist() == sample_data["id"].tolist()
+
+        loader = Loader(filepath="dir://parts", storage_options=storage_options)
+        assert loader.config.filepaths == [
+            "dir://parts/part_0.csv",
+            "dir://parts/part_1.csv",
+        ]
+        data, _ = loader.load()
+        assert data["id"].tolist() == sample_data["id"].tolist()
+
+    def test_fsspec_url_parquet_cache(self, sample_data, tmp_path):
+        """Test Parquet through fsspec URLs and its cache key
+        測試透過 fsspec URL 載入 Parquet 及其快取
+        """
+        pytest.importorskip("fsspec")
+        pytest.importorskip("pyarrow")
+        sample_data.to_parquet(tmp_path / "data.parquet", index=False)
+        storage_options = {"path": str(tmp_path), "target_protocol": "file"}
+        cache_dir = tmp_path / "cache"
+
+        for _ in range(2):
+            data, _ = Loader(
+                filepath="dir://data.parquet",
+                storage_options=storage_options,
+                cache_dir=str(cache_dir),
+                chunksize=128,
+            ).load()
+            assert data["id"].tolist() == sample_data["id"].tolist()
+        assert len(list(cache_dir.iterdir())) == 1
+
+
+class TestLoaderExcelFastPath:
+    """Test cases for the Excel engine option and Parquet sidecar
+    Excel 引擎選項與 Parquet 附屬檔的測試案例
+    """
+
+    @pytest.fixture
+    def excel_path(self, tmp_path):
+        """Create an Excel file
+        創建 Excel 檔案
+        """
+        pytest.importorskip("openpyxl")
+        excel_file = tmp_path / "data.xlsx"
+        pd.DataFrame(
+            {
+                "id": range(50),
+                "grade": ["A", "B"] * 25,
+                "score": [0.5, None] * 25,
+            }
+        ).to_excel(excel_file, index=False)
+        return excel_file
+
+    def test_excel_options_validation(self):
+        """Test Excel options are validated and only allowed on Excel files
+        測試 Excel 選項驗證且僅允許用於 Excel 檔案
+        """
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.xlsx", excel_engine="unknown")
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", excel_sidecar=True)
+
+        config = LoaderConfig(filepath="path/to/file.xlsx", excel_engine="auto")
+        assert config.excel_engine == "auto"
+
+    def test_auto_engine_fallback(self):
+        """Test auto engine falls back to the pandas default without calamine
+        測試未安裝 calamine 時 auto 引擎使用 pandas 預設引擎
+        """
+        from petsard.loader.loader_pandas import LoaderPandasExcel
+
+        loader = LoaderPandasExcel({"filepath": "data.xlsx", "engine": "auto"})
+        with patch.dict("sys.modules", {"python_calamine": None}):
+            assert loader._resolve_engine() is None
+
+    def test_excel_sidecar(self, excel_path):
+        """Test the sidecar is written once, reused, and refreshed on file change
+        測試附屬檔僅寫入一次並重複使用，檔案變更時重新產生
+        """
+        pytest.importorskip("pyarrow")
+        data, schema = Loader(filepath=str(excel_path), excel_sidecar=True).load()
+        sidecars = list(excel_path.parent.glob(".data.xlsx.*.petsard.parquet"))
+        assert len(sidecars) == 1
+
+        with patch("pandas.read_excel") as mock_read_excel:
+            sidecar_data, sidecar_schema = Loader(
+                filepath=str(excel_path), excel_sidecar=True
+            ).load()
+            mock_read_excel.assert_not_called()
+        pd.testing.assert_frame_equal(sidecar_data, data)
+        for col in data.columns:
+            assert sidecar_schema.attributes[col].type == schema.attributes[col].type
+
+        pd.DataFrame({"id": [1], "grade": ["A"], "score": [0.5]}).to_excel(
+            excel_path, index=False
+        )
+        data, _ = Loader(filepath=str(excel_path), excel_sidecar=True).load()
+        assert len(data) == 1
+        new_sidecars = list(excel_path.parent.glob(".data.xlsx.*.petsard.parquet"))
+        assert len(new_sidecars) == 1
+        assert new_sidecars != sidecars
+
+
+class TestLoaderMemoryMode:
+    """Test cases for the compact memory mode
+    精簡記憶體模式的測試案例
+    """
+
+    @pytest.fixture
+    def wide_csv_path(self, tmp_path):
+        """Create a CSV file with wide default dtypes
+        創建使用寬預設型別的 CSV 檔案
+        """
+        row_count = 1000
+        csv_file = tmp_path / "wide.csv"
+        pd.DataFrame(
+            {
+                "age": [20 + i % 60 for i in range(row_count)],
+                "visits": [None if i % 10 == 0 else i for i in range(row_count)],
+                "price": [round(i * 0.25, 2) for i in range(row_count)],
+                "ratio": [i / 3 for i in range(row_count)],
+                "grade": ["A", "B", "C", "D"] * (row_count // 4),
+                "note": [f"note {i}" for i in range(row_count)],
+            }
+        ).to_csv(csv_file, index=False)
+        return str(csv_file)
+
+    def test_memory_mode_validation(self):
+        """Test memory_mode only accepts known modes
+        測試 memory_mode 僅接受已知模式
+        """
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", memory_mode="tiny")
+
+        config = LoaderConfig(filepath="path/to/file.csv", memory_mode="compact")
+        assert config.memory_mode == "compact"
+
+    def test_compact_dtypes(self, wide_csv_path):
+        """Test compaction shrinks dtypes without changing values
+        測試精簡模式縮小型別且不改變資料值
+        """
+        schema = {
+            "attributes": {
+                "visits": {"type": "int"},
+                "price": {"type": "float", "precision": 2},
+                "ratio": {"type": "float"},
+            }
+        }
+        data, _ = Loader(filepath=wide_csv_path, schema=schema).load()
+        loader = Loader(filepath=wide_csv_path, schema=schema, memory_mode="compact")
+        compact_data, _ = loader.load()
+
+        assert compact_data["age"].dtype == "int8"
+        assert compact_data["visits"].dtype == "Int16"
+        assert compact_data["price"].dtype == "float32"
+        # No precision in schema keeps float64
+        assert compact_data["ratio"].dtype == "float64"
+        assert isinstance(compact_data["grade"].dtype, pd.CategoricalDtype)
+        # High cardinality strings are not categorical
+        assert not isinstance(compact_data["note"].dtype, pd.CategoricalDtype)
+
+        for col in ["age", "visits", "grade", "note"]:
+            assert compact_data[col].astype(object).tolist() == (
+                data[col].astype(object).tolist()
+            )
+        assert (compact_data["price"].astype("float64").round(2) == data["price"]).all()
+
+        assert loader.memory_usage["memory_bytes_before"] == int(
+            data.memory_usage(deep=True).sum()
+        )
+        assert (
+            loader.memory_usage["memory_bytes_after"]
+            < loader.memory_usage["memory_bytes_before"]
+        )
+
+    def test_compact_timing_record(self, wide_csv_path):
+        """Test compaction logs a timing record with bytes before and after
+        測試精簡模式記錄包含前後位元組數的計時訊息
+        """
+        loader = Loader(filepath=wide_csv_path, memory_mode="compact")
+        with patch.object(loader, "_logger") as mock_logger:
+            loader.load()
+
+        messages = [call.args[0] for call in mock_logger.info.call_args_list]
+        assert any(m.startswith("TIMING_START|Loader|compact|") for m in messages)
+        end_message = next(
+            m for m in messages if m.startswith("TIMING_END|Loader|compact|")
+        )
+        assert end_message.endswith(
+            f"memory_bytes_before={loader.memory_usage['memory_bytes_before']},"
+            f"memory_bytes_after={loader.memory_usage['memory_bytes_after']}"
+        )
+
+    def test_default_mode_keeps_dtypes(self, wide_csv_path):
+        """Test the default mode does not compact
+        測試預設模式不進行精簡
+        """
+        loader = Loader(filepath=wide_csv_path)
+        data, _ = loader.load()
+
+        assert data["age"].dtype == "int64"
+        assert loader.memory_usage is None
+
+
+class TestLoaderDatabase:
+    """Test cases for loading DB-API query results
+    DB-API 查詢結果載入的測試案例
+    """
+
+    @pytest.fixture
+    def sqlite_path(self, tmp_path):
+        """Create a SQLite database with a people table
+        創建含 people 資料表的 SQLite 資料庫
+        """
+        import sqlite3
+
+        db_file = tmp_path / "people.db"
+        with sqlite3.connect(db_file) as connection:
+            connection.execute(
+                "CREATE TABLE people "
+                "(id INTEGER, age INTEGER, name TEXT, score REAL, grade TEXT)"
+            )
+            connection.executemany(
+                "INSERT INTO people VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        i,
+                        None if i % 7 == 0 else 20 + i % 50,
+                        f"n{i}",
+                        i / 2,
+                        "AB"[i % 2],
+                    )
+                    for i in range(1000)
+                ],
+            )
+        connection.close()
+        return db_file
+
+    def test_database_validation(self, sqlite_path):
+        """Test database options are validated
+        測試資料庫選項驗證
+        """
+        url = f"sqlite:///{sqlite_path}"
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath=url)
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath=url, table="people", query="SELECT 1")
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", table="people")
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="postgresql://host/db", table="people")
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath=url, table="people", cache_dir="cache")
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath=url, table="people", params="A")
+        with pytest.raises(ConfigError):
+            LoaderConfig(filepath="path/to/file.csv", params=[1])
+
+        config = LoaderConfig(filepath=url, table="people")
+        assert config.file_ext_code == LoaderFileExt.DATABASETYPE
+
+    def test_load_table_with_pushdown(self, sqlite_path):
+        """Test usecols and where are pushed into the SQL query, with typed columns
+        測試 usecols 與 where 下推至 SQL 查詢，並保留欄位型別
+        """
+        from petsard.loader.loader_database import LoaderDatabase
+
+        assert (
+            LoaderDatabase(
+                {"table": "people", "usecols": ["id", "grade"], "where": "id >= 500"}
+            ).build_query()
+            == 'SELECT "id", "grade" FROM "people" WHERE id >= 500'
+        )
+
+        data, schema = Loader(
+            filepath=f"sqlite:///{sqlite_path}",
+            table="people",
+            usecols=["id", "age", "grade"],
+            where="id >= 500",
+        ).load()
+        assert list(data.columns) == ["id", "age", "grade"]
+        assert len(data) == 500
+        assert data["id"].min() == 500
+        # Integers with NULL stay integers
+        assert data["age"].dtype == "Int64"
+        assert schema.attributes["age"].type == "int"
+        assert schema.attributes["age"].type_attr["nullable"]
+        assert schema.attributes["grade"].type_attr["category"]
+
+    def test_load_query_in_batches(self, sqlite_path):
+        """Test a query is streamed in batches and stops after nrows
+        測試查詢以批次串流讀取，並於 nrows 筆後停止
+        """
+        from petsard.loader.loader_database import LoaderDatabase
+
+        batches = list(
+            LoaderDatabase(
+                {
+                    "filepath": f"sqlite:///{sqlite_path}",
+                    "query": "SELECT id, score FROM people ORDER BY id DESC;",
+                    "chunksize": 100,
+                    "nrows": 250,
+                }
+            ).load_chunks()
+        )
+        assert [len(batch) for batch in batches] == [100, 100, 50]
+        assert batches[0]["id"].iloc[0] == 999
+
+        data, _ = Loader(
+            filepath=f"sqlite:///{sqlite_path}",
+            query="SELECT * FROM people",
+            chunksize=128,
+            schema={"attributes": {"score": {"type": "float"}}},
+        ).load()
+        assert len(data) == 1000
+        assert data["score"].dtype == "float64"
+
+    def test_load_with_params(self, sqlite_path):
+        """Test values are bound to placeholders instead of pasted into the SQL
+        測試數值綁定至佔位符，而非直接貼入 SQL
+        """
+        from petsard.loader.loader_database import LoaderDatabase
+
+        # where is trusted SQL, inserted as is
+        loader = LoaderDatabase(
+            {
+                "query": "SELECT * FROM people WHERE grade = :grade",
+                "where": "id >= :min_id",
+                "params": {"grade": "A", "min_id": 500},
+            }
+        )
+        # The subquery alias has no AS, which Oracle rejects
+        assert loader.build_query() == (
+            "SELECT * FROM (SELECT * FROM people WHERE grade = :grade) "
+            "petsard_source WHERE id >= :min_id"
+        )
+
+        data, _ = Loader(
+            filepath=f"sqlite:///{sqlite_path}",
+            table="people",
+            where="name = ?",
+            params=["n1' OR '1'='1"],
+        ).load()
+        assert len(data) == 0
+
+        data, _ = Loader(
+            filepath=f"sqlite:///{sqlite_path}",
+            query="SELECT id, grade FROM people WHERE grade = :grade",
+            where="id >= :min_id",
+            params={"grade": "A", "min_id": 500},
+        ).load()
+        assert len(data) == 250
+        assert set(data["grade"]) == {"A"}
+        assert data["id"].min() >= 500
+
+    def test_load_with_connection(self, sqlite_path):
+        """Test other databases are read through a DB-API connection or factory
+        測試其他資料庫透過 DB-API 連線或其工廠函式讀取
+        """
+        import sqlite3
+
+        connection = sqlite3.connect(sqlite_path)
+        data, _ = Loader(
+            filepath="postgresql://host/db",
+            table="people",
+            where="grade = 'A'",
+            connection=connection,
+        ).load()
+        assert len(data) == 500
+        # Connections passed as objects are left open
+        assert connection.execute("SELECT COUNT(*) FROM people").fetchone()[0] == 1000
+        connection.close()
+
+        data, _ = Loader(
+            filepath="mysql://host/db",
+            table="people",
+            nrows=10,
+            connection=lambda: sqlite3.connect(sqlite_path),
+        ).load()
+        assert len(data) == 10
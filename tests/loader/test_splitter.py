@@ -1,8 +1,10 @@
+import numpy as np
 import pandas as pd
 import pytest
 
 from petsard.exceptions import ConfigError
 from petsard.loader import Splitter
+from petsard.loader.splitter import SplitView
 from petsard.metadater import Schema
 
 
@@ -97,11 +99,14 @@ class TestSplitter:
         assert "validation" in metadata[1]
         assert isinstance(metadata[1]["train"], Schema)
 
-        # Check train_indices - 現在是 list[set] 格式
+        # Check train_indices - 現在是 list[np.ndarray] 格式
         assert isinstance(train_indices, list)
         assert len(train_indices) == 1
-        assert isinstance(train_indices[0], set)
+        assert isinstance(train_indices[0], np.ndarray)
         assert len(train_indices[0]) == train_size
+        # get_train_indices() 同樣回傳索引陣列，不轉為集合
+        assert isinstance(splitter.get_train_indices()[0], np.ndarray)
+        np.testing.assert_array_equal(splitter.get_train_indices()[0], train_indices[0])
 
     def test_split_normal_method_no_data(self):
         """Test normal splitting method without providing data
@@ -141,10 +146,10 @@ class TestSplitter:
             assert "train" in split_data[i]
             assert "validation" in split_data[i]
 
-        # Check train_indices - 現在是 list[set] 格式
+        # Check train_indices - 現在是 list[np.ndarray] 格式
         assert len(train_indices) == 3
         for i in range(3):
-            assert isinstance(train_indices[i], set)
+            assert isinstance(train_indices[i], np.ndarray)
 
     def test_split_basic_functionality(self, sample_data):
         """Test basic splitting functionality
@@ -272,10 +277,10 @@ class TestSplitter:
         assert len(split_data) == 2
         assert len(train_indices) == 2
 
-        # Check overlap between samples - train_indices 現在是 list[set]
+        # Check overlap between samples - train_indices 現在是 list[np.ndarray]
         for i in range(len(train_indices)):
             for j in range(i + 1, len(train_indices)):
-                overlap = len(train_indices[i].intersection(train_indices[j]))
+                overlap = len(np.intersect1d(train_indices[i], train_indices[j]))
                 overlap_percentage = overlap / len(train_indices[i])
                 assert overlap_percentage <= 0.2, (
                     f"Overlap {overlap_percentage:.2%} exceeds limit"
@@ -306,11 +311,225 @@ class TestSplitter:
         )
 
         # Check that new samples respect overlap constraints with existing ones
-        # train_indices 現在是 list[set] 格式
-        for sample_set in train_indices:
+        # train_indices 現在是 list[np.ndarray] 格式
+        for sample_index in train_indices:
+            sample_set = set(sample_index.tolist())
             for existing_set in existing_indices:
                 overlap = len(sample_set.intersection(existing_set))
                 overlap_percentage = overlap / len(sample_set)
                 assert overlap_percentage <= 0.5, (
                     f"Overlap {overlap_percentage:.2%} exceeds limit"
                 )
+
+    def test_bootstrapping_index_arrays(self):
+        """Test bootstrapping returns disjoint, sorted index arrays
+        測試自助抽樣回傳互斥且排序的索引陣列
+        """
+        splitter = Splitter(num_samples=3, train_split_ratio=0.7, random_state=42)
+
+        index_result = splitter._bootstrapping(index=pd.RangeIndex(1000))
+
+        assert len(index_result) == 3
+        for index in index_result.values():
+            assert isinstance(index["train"], np.ndarray)
+            assert isinstance(index["validation"], np.ndarray)
+            assert len(index["train"]) == 700
+            assert len(index["validation"]) == 300
+            assert np.all(np.diff(index["train"]) > 0)
+            assert np.all(np.diff(index["validation"]) > 0)
+            combined = np.concatenate([index["train"], index["validation"]])
+            assert np.array_equal(np.sort(combined), np.arange(1000))
+
+    def test_bootstrapping_reproducible(self):
+        """Test bootstrapping is reproducible for int and str random_state
+        測試整數與字串 random_state 的自助抽樣可重現
+        """
+        for random_state in [42, "petsard"]:
+            first = Splitter(num_samples=2, random_state=random_state)._bootstrapping(
+                index=pd.RangeIndex(100)
+            )
+            second = Splitter(num_samples=2, random_state=random_state)._bootstrapping(
+                index=pd.RangeIndex(100)
+            )
+            for key in first:
+                assert np.array_equal(first[key]["train"], second[key]["train"])
+
+    def test_split_returns_lazy_views(self, sample_data):
+        """Test split results are lazy views sharing the parent data
+        測試分割結果為共用原始資料的延遲視圖
+        """
+        splitter = Splitter(num_samples=3, train_split_ratio=0.6, random_state=42)
+        test_schema = Schema(id="test", name="Test Schema", attributes={})
+
+        split_data, _, train_indices = splitter.split(
+            data=sample_data, metadata=test_schema
+        )
+
+        for key, view in split_data.items():
+            assert isinstance(view, SplitView)
+            assert view.data is sample_data
+            assert set(view) == {"train", "validation"}
+
+            train = view["train"]
+            assert isinstance(train, pd.DataFrame)
+            assert train.index.equals(pd.RangeIndex(6))
+            expected = sample_data.iloc[sorted(train_indices[key - 1])]
+            assert train.equals(expected.reset_index(drop=True))
+
+            # Each read is a new DataFrame
+            train.loc[0, "A"] = -1
+            assert view["train"].loc[0, "A"] != -1
+
+    def test_kfold_disjoint_validation(self):
+        """Test kfold validation folds are disjoint and cover all rows
+        測試 kfold 驗證折互斥且涵蓋所有資料列
+        """
+        data = pd.DataFrame({"A": range(100)})
+        splitter = Splitter(num_samples=4, split_method="kfold", random_state=42)
+        test_schema = Schema(id="test", name="Test Schema", attributes={})
+
+        split_data, _, train_indices = splitter.split(data=data, metadata=test_schema)
+
+        assert len(split_data) == 4
+        validation = np.concatenate(
+            [view.index["validation"] for view in split_data.values()]
+        )
+        assert np.array_equal(np.sort(validation), np.arange(100))
+        for view, train_index in zip(split_data.values(), train_indices, strict=True):
+            assert len(view["train"]) == 75
+            assert not np.isin(train_index, view.index["validation"]).any()
+
+    def test_kfold_single_fold(self):
+        """Test kfold with fold returns the same fold as the full split
+        測試 kfold 指定 fold 時回傳與完整分割相同的折
+        """
+        data = pd.DataFrame({"A": range(50)})
+        test_schema = Schema(id="test", name="Test Schema", attributes={})
+        full, _, _ = Splitter(
+            num_samples=5, split_method="kfold", random_state="cv"
+        ).split(data=data.copy(), metadata=test_schema)
+
+        for fold in range(1, 6):
+            single, _, _ = Splitter(
+                num_samples=5, split_method="kfold", random_state="cv", fold=fold
+            ).split(data=data.copy(), metadata=test_schema)
+            assert list(single) == [1]
+            assert np.array_equal(
+                single[1].index["validation"], full[fold].index["validation"]
+            )
+
+    def test_kfold_invalid_config(self):
+        """Test invalid kfold configuration
+        測試無效的 kfold 設定
+        """
+        with pytest.raises(ConfigError):
+            Splitter(split_method="unknown")
+        with pytest.raises(ConfigError):
+            Splitter(num_samples=1, split_method="kfold")
+        with pytest.raises(ConfigError):
+            Splitter(num_samples=3, split_method="kfold", fold=4, random_state=42)
+        with pytest.raises(ConfigError):
+            Splitter(num_samples=3, split_method="kfold", fold=1)
+        with pytest.raises(ConfigError):
+            Splitter(num_samples=3, fold=1, random_state=42)
+
+    @pytest.mark.parametrize("split_method", ["bootstrap", "kfold"])
+    def test_stratified_split(self, split_method):
+        """Test stratified split keeps class proportions
+        測試分層分割維持類別比例
+        """
+        data = pd.DataFrame(
+            {"label": ["a"] * 60 + ["b"] * 30 + [None] * 10, "A": range(100)}
+        )
+        splitter = Splitter(
+            num_samples=2,
+            train_split_ratio=0.5,
+            split_method=split_method,
+            stratify_column="label",
+            random_state=42,
+        )
+        test_schema = Schema(id="test", name="Test Schema", attributes={})
+
+        split_data, _, _ = splitter.split(data=data, metadata=test_schema)
+
+        for view in split_data.values():
+            counts = view["validation"]["label"].value_counts(dropna=False)
+            assert counts["a"] == 30
+            assert counts["b"] == 15
+            assert counts[None] == 5
+
+    def test_stratify_column_not_found(self, sample_data):
+        """Test stratify_column not in data
+        測試 stratify_column 不存在於資料中
+        """
+        splitter = Splitter(stratify_column="missing")
+        test_schema = Schema(id="test", name="Test Schema", attributes={})
+
+        with pytest.raises(ConfigError):
+            splitter.split(data=sample_data, metadata=test_schema)
+
+    def test_split_cache_reuses_indices(self, tmp_path):
+        """Test cached split indices are reused on rerun
+        測試重新執行時沿用快取的分割索引
+        """
+        data = pd.DataFrame({"A": range(200), "B": [f"item_{i}" for i in range(200)]})
+        test_schema = Schema(id="test", name="Test Schema", attributes={})
+
+        first, _, first_indices = Splitter(
+            num_samples=2, cache_dir=str(tmp_path)
+        ).split(data=data.copy(), metadata=test_schema)
+        assert len(list(tmp_path.iterdir())) == 1
+
+        # No random_state, identical only if read from cache
+        second, _, second_indices = Splitter(
+            num_samples=2, cache_dir=str(tmp_path)
+        ).split(data=data.copy(), metadata=test_schema)
+
+        for first_index, second_index in zip(
+            first_indices, second_indices, strict=True
+        ):
+            assert np.array_equal(first_index, second_index)
+        for key in first:
+            assert second[key]["validation"].equals(first[key]["validation"])
+
+    def test_split_cache_key_changes(self, tmp_path):
+        """Test data, options and existing indices change the cache key
+        測試資料、選項與既有索引改變快取鍵
+        """
+        data = pd.DataFrame({"A": range(100)})
+        test_schema = Schema(id="test", name="Test Schema", attributes={})
+
+        Splitter(cache_dir=str(tmp_path)).split(data=data.copy(), metadata=test_schema)
+        Splitter(cache_dir=str(tmp_path)).split(
+            data=data.assign(A=data["A"] + 1), metadata=test_schema
+        )
+        Splitter(train_split_ratio=0.5, cache_dir=str(tmp_path)).split(
+            data=data.copy(), metadata=test_schema
+        )
+        Splitter(cache_dir=str(tmp_path)).split(
+            data=data.copy(), metadata=test_schema, exist_train_indices=[{0, 1, 2}]
+        )
+
+        assert len(list(tmp_path.iterdir())) == 4
+
+    def test_split_cache_keeps_index_arrays(self, tmp_path):
+        """Test cached split indices stay arrays and key like their sets
+        測試快取的分割索引維持陣列，且與對應集合產生相同快取鍵
+        """
+        data = pd.DataFrame({"A": range(100)})
+        test_schema = Schema(id="test", name="Test Schema", attributes={})
+
+        Splitter(cache_dir=str(tmp_path)).split(
+            data=data.copy(), metadata=test_schema, exist_train_indices=[{2, 0, 1}]
+        )
+        splitter = Splitter(cache_dir=str(tmp_path))
+        _, _, train_indices = splitter.split(
+            data=data.copy(),
+            metadata=test_schema,
+            exist_train_indices=[np.array([0, 1, 2])],
+        )
+
+        # Same entry reused for the array form of the existing indices
+        assert len(list(tmp_path.iterdir())) == 1
+        assert isinstance(train_indices[0], np.ndarray)
+        assert isinstance(splitter.get_train_indices()[0], np.ndarray)
@@ -3,12 +3,14 @@ Metadater 完整測試套件
 測試新架構的完整功能
 """
 
+from dataclasses import fields
+
 import numpy as np
 import pandas as pd
 import pytest
 
 from petsard.metadater import AttributeMetadater, Metadater, SchemaMetadater
-from petsard.metadater.metadata import Attribute
+from petsard.metadater.metadata import Attribute, Schema
 from petsard.metadater.stats import DatasetsStats, FieldStats, TableStats
 
 
@@ -713,6 +715,27 @@ class TestPrecisionTracking:
         # 非數值型別的 type_attr 應為 None 或不包含 precision
         assert attr.type_attr is None or "precision" not in attr.type_attr
 
+    def test_infer_decimal_places_matches_repr(self):
+        """測試向量化小數位數推斷與 Decimal(str(value)) 結果一致"""
+        from decimal import Decimal
+
+        values = [0.1 + 0.2, 1.1, 1e-7, 1e20, 123456789.123, 2.5e-12, -0.0, 7.0]
+        values += [1.2345678901234567e-5, float(np.float32(0.1)), 5e-324]
+        for value in values:
+            exponent = Decimal(str(value)).normalize().as_tuple().exponent
+            expected = abs(exponent) if exponent < 0 else 0
+            assert AttributeMetadater.infer_decimal_places([value]) == expected
+
+        assert AttributeMetadater.infer_decimal_places([np.nan, np.inf]) is None
+
+    def test_infer_decimal_places_max_precision(self):
+        """測試達到最大精度時提前結束"""
+        values = [1.5, 0.123456789]
+
+        assert AttributeMetadater.infer_decimal_places(values) == 9
+        assert AttributeMetadater.infer_decimal_places(values, max_precision=6) == 6
+        assert AttributeMetadater.infer_decimal_places([1.5], max_precision=6) == 1
+
     def test_precision_with_base_attribute(self):
         """測試有 base_attribute 時不推斷精度"""
         from petsard.metadater.metadata import Attribute
@@ -781,5 +804,451 @@ class TestPrecisionTracking:
         assert schema.attributes["value"].type_attr.get("precision") == 2
 
 
+class TestMergeFunctionality:
+    """測試分段推斷結果的合併"""
+
+    def test_merge_int_and_float_attributes(self):
+        """測試 int 與 float 合併為 float 並取最大精度"""
+        left = AttributeMetadater.from_data(pd.Series([1, 2, 3], name="value"))
+        right = AttributeMetadater.from_data(pd.Series([1.5, None, 2.25], name="value"))
+
+        merged = AttributeMetadater.merge(left, right)
+
+        assert merged.type == "float"
+        assert merged.type_attr["nullable"] is True
+        assert merged.type_attr["precision"] == 2
+        assert merged.stats is None
+
+    def test_merge_conflicting_types_fallback_to_str(self):
+        """測試不相容型別合併為 str"""
+        left = AttributeMetadater.from_data(pd.Series([1, 2, 3], name="value"))
+        right = AttributeMetadater.from_data(pd.Series(["a", "b", "c"], name="value"))
+
+        merged = AttributeMetadater.merge(left, right)
+
+        assert merged.type == "str"
+        assert "precision" not in merged.type_attr
+
+    def test_merge_logical_type_disagreement(self):
+        """測試邏輯型別不一致時清除"""
+        left = AttributeMetadater.from_data(
+            pd.Series(["a@b.com", "c@d.com"], name="contact")
+        )
+        right = AttributeMetadater.from_data(
+            pd.Series(["not mail", "c@d.com"], name="contact")
+        )
+
+        assert AttributeMetadater.merge(left, left).logical_type == "email"
+        assert AttributeMetadater.merge(left, right).logical_type is None
+
+    def test_merge_schemas(self):
+        """測試 Schema 合併保留雙方欄位"""
+        left = SchemaMetadater.from_data(
+            pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}), enable_stats=True, id="left"
+        )
+        right = SchemaMetadater.from_data(
+            pd.DataFrame({"a": [1.5, 2.5], "c": [1, 2]}), id="right"
+        )
+
+        merged = SchemaMetadater.merge(left, right)
+
+        assert merged.id == "left"
+        assert list(merged.attributes) == ["a", "b", "c"]
+        assert merged.attributes["a"].type == "float"
+        assert merged.stats is None
+
+
+class TestSampleInference:
+    """測試以抽樣推斷 Schema"""
+
+    def test_sample_inference_matches_full_inference(self):
+        """測試抽樣推斷與全量推斷結果一致"""
+        rng = np.random.default_rng(42)
+        size = 20000
+        data = pd.DataFrame(
+            {
+                "amount": rng.normal(size=size).round(2),
+                "level": rng.choice(["low", "mid", "high"], size=size),
+                "user_id": [f"u{i}" for i in range(size)],
+                "count": rng.integers(0, 10, size=size),
+            }
+        )
+        data.loc[7, "count"] = None
+
+        full = SchemaMetadater.from_data(data)
+        sampled = SchemaMetadater.from_data(data, infer_sample_size=1000)
+
+        for col in data.columns:
+            assert sampled.attributes[col].type == full.attributes[col].type
+            assert sampled.attributes[col].type_attr == full.attributes[col].type_attr
+        assert sampled.attributes["level"].type_attr["category"] is True
+        assert sampled.attributes["user_id"].type_attr["category"] is False
+
+    def test_sample_inference_keeps_exact_nullable_and_stats(self):
+        """測試抽樣推斷時 nullable 與統計值仍為精確值"""
+        data = pd.DataFrame({"value": [1.0] * 999 + [None]})
+
+        schema = SchemaMetadater.from_data(
+            data, enable_stats=True, infer_sample_size=10
+        )
+        attribute = schema.attributes["value"]
+
+        assert attribute.type_attr["nullable"] is True
+        assert attribute.stats.row_count == 1000
+        assert attribute.stats.na_count == 1
+        assert attribute.is_constant is True
+
+    def test_sample_larger_than_data(self):
+        """測試抽樣數不小於資料量時使用全部資料"""
+        data = pd.DataFrame({"value": [1.25, 2.5, 3.125]})
+
+        assert SchemaMetadater._sample_rows(data, 3) is None
+        schema = SchemaMetadater.from_data(data, infer_sample_size=100)
+        assert schema.attributes["value"].type_attr["precision"] == 3
+
+
+class TestBatchStats:
+    """測試批次計算欄位統計"""
+
+    def test_batch_stats_match_pandas(self):
+        """測試批次統計與 pandas 逐欄計算結果一致"""
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(
+            {
+                "amount": rng.normal(size=500).round(2),
+                "count": rng.integers(0, 1000, size=500),
+                "level": rng.choice(["low", "mid", "high"], size=500),
+            }
+        )
+        data.loc[::7, "amount"] = np.nan
+
+        schema = SchemaMetadater.from_data(data, enable_stats=True)
+
+        for col in ["amount", "count"]:
+            stats = schema.attributes[col].stats
+            expected = data[col].dropna().astype("float64")
+            assert stats.na_count == data[col].isna().sum()
+            assert stats.mean == pytest.approx(expected.mean())
+            assert stats.std == pytest.approx(expected.std())
+            assert stats.min == expected.min()
+            assert stats.max == expected.max()
+            assert stats.median == pytest.approx(expected.median())
+            assert stats.q1 == pytest.approx(expected.quantile(0.25))
+            assert stats.q3 == pytest.approx(expected.quantile(0.75))
+
+        level_stats = schema.attributes["level"].stats
+        value_counts = data["level"].value_counts()
+        assert level_stats.unique_count == 3
+        assert level_stats.mode == data["level"].mode().iloc[0]
+        assert level_stats.mode_frequency == value_counts.max()
+        assert level_stats.category_distribution == {
+            str(k): int(v) for k, v in value_counts.items()
+        }
+
+    def test_batch_stats_edge_columns(self):
+        """測試全為缺失值與單一值欄位的統計"""
+        data = pd.DataFrame(
+            {"all_na": [np.nan] * 4, "single": [np.nan, np.nan, np.nan, 2.5]}
+        )
+
+        schema = SchemaMetadater.from_data(data, enable_stats=True)
+
+        all_na = schema.attributes["all_na"].stats
+        assert all_na.na_count == 4
+        assert all_na.mean is None
+        single = schema.attributes["single"].stats
+        assert single.mean == 2.5
+        assert single.median == 2.5
+        assert np.isnan(single.std)
+
+    def test_duplicated_columns(self):
+        """測試重複欄位偵測"""
+        data = pd.DataFrame({"a": [1, 2, 3], "b": [1, 2, 3], "c": [1.0, 2.0, 3.0]})
+
+        schema = SchemaMetadater.from_data(data, enable_stats=True)
+
+        assert schema.stats.duplicated_columns == ["a==b"]
+
+
+class TestApproximateStats:
+    """測試以 sketch 近似計算統計值"""
+
+    def test_quantile_sketch_accuracy_and_merge(self):
+        """測試分位數 sketch 誤差與合併"""
+        from petsard.metadater.sketch import QuantileSketch
+
+        values = np.random.default_rng(0).lognormal(size=200000)
+        sorted_values = np.sort(values)
+
+        sketch = QuantileSketch(capacity=256).update(values)
+        merged = QuantileSketch(capacity=256)
+        for part in np.array_split(values, 5):
+            merged.merge(QuantileSketch(capacity=256).update(part))
+
+        assert merged.count == len(values)
+        for q in [0.25, 0.5, 0.75]:
+            for result in [sketch, merged]:
+                rank = np.searchsorted(sorted_values, result.quantile(q)) / len(values)
+                assert abs(rank - q) < 0.02
+
+    def test_quantile_sketch_small_input_is_exact(self):
+        """測試資料量小於壓縮區塊時為精確值"""
+        from petsard.metadater.sketch import QuantileSketch
+
+        sketch = QuantileSketch().update([4.0, 1.0, np.nan, 3.0, 2.0])
+
+        assert sketch.count == 4
+        assert sketch.quantile(0.5) == 2.5
+        assert QuantileSketch().quantile(0.5) is None
+
+    def test_approximate_stats_schema(self):
+        """測試近似統計模式與 base_schema 傳遞"""
+        data = pd.DataFrame(
+            {"value": np.random.default_rng(1).normal(size=50000).round(3)}
+        )
+
+        exact = SchemaMetadater.from_data(data, enable_stats=True)
+        approx = SchemaMetadater.from_data(
+            data, enable_stats=True, approximate_stats=True
+        )
+
+        exact_stats = exact.attributes["value"].stats
+        approx_stats = approx.attributes["value"].stats
+        assert approx.enable_approximate_stats is True
+        assert approx_stats.min == exact_stats.min
+        assert approx_stats.max == exact_stats.max
+        assert approx_stats.mean == pytest.approx(exact_stats.mean)
+        assert approx_stats.median == pytest.approx(exact_stats.median, abs=0.05)
+        assert approx_stats.q1 == pytest.approx(exact_stats.q1, abs=0.05)
+
+        refreshed = SchemaMetadater.from_data(
+            data.head(100), enable_stats=True, base_schema=approx
+        )
+        assert refreshed.enable_approximate_stats is True
+
+    def test_approximate_stats_fed_by_chunk(self, monkeypatch):
+        """測試近似統計逐欄分塊餵入 sketch，動差與極值仍為精確值"""
+        from petsard.metadater.sketch import QuantileSketch
+
+        rng = np.random.default_rng(2)
+        data = pd.DataFrame(
+            {
+                "value": rng.normal(size=20000).round(3),
+                "count": rng.integers(0, 1000, size=20000),
+            }
+        )
+        data.loc[::11, "value"] = np.nan
+        monkeypatch.setattr(AttributeMetadater, "SKETCH_CHUNK_ROWS", 1000)
+        fed = []
+        update = QuantileSketch.update
+
+        def record_update(sketch, values):
+            fed.append(len(values))
+            return update(sketch, values)
+
+        monkeypatch.setattr(QuantileSketch, "update", record_update)
+
+        exact = SchemaMetadater.from_data(data, enable_stats=True)
+        approx = SchemaMetadater.from_data(
+            data, enable_stats=True, approximate_stats=True
+        )
+
+        # 每次最多餵入一個分塊，不建立整份 float64 矩陣
+        assert len(fed) == 40
+        assert max(fed) <= 1000
+        for col in data.columns:
+            exact_stats = exact.attributes[col].stats
+            approx_stats = approx.attributes[col].stats
+            assert approx_stats.min == exact_stats.min
+            assert approx_stats.max == exact_stats.max
+            assert approx_stats.mean == pytest.approx(exact_stats.mean)
+            assert approx_stats.std == pytest.approx(exact_stats.std)
+            assert approx_stats.median == pytest.approx(
+                exact_stats.median, abs=0.05 * exact_stats.std
+            )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestIncrementalStats:
+    """測試依增刪資料列增量更新統計"""
+
+    @staticmethod
+    def _make_data(size: int = 1000) -> pd.DataFrame:
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(
+            {
+                "amount": rng.normal(size=size).round(2),
+                "count": rng.integers(0, 100, size=size),
+                "level": rng.choice(
+                    ["low", "mid", "high"], size=size, p=[0.5, 0.3, 0.2]
+                ),
+                "name": [f"user_{i % 50}" for i in range(size)],
+            }
+        )
+        data.loc[::7, "amount"] = np.nan
+        return data
+
+    @staticmethod
+    def _assert_stats_equal(expected: Schema, actual: Schema):
+        for col, attr in expected.attributes.items():
+            for name, value in attr.stats.__dict__.items():
+                if isinstance(value, float):
+                    assert getattr(actual.attributes[col].stats, name) == pytest.approx(
+                        value, nan_ok=True
+                    ), f"{col}.{name}"
+                else:
+                    assert getattr(actual.attributes[col].stats, name) == value, (
+                        f"{col}.{name}"
+                    )
+        for stats_field in fields(expected.stats):
+            if stats_field.compare and stats_field.name != "field_stats":
+                name = stats_field.name
+                value = getattr(expected.stats, name)
+                assert getattr(actual.stats, name) == value, f"stats.{name}"
+        # 增量狀態與重新計算一致
+        for expected_state, actual_state in zip(
+            expected.stats.row_hash_counts, actual.stats.row_hash_counts, strict=True
+        ):
+            np.testing.assert_array_equal(actual_state, expected_state)
+        assert actual.stats.object_memory_usage == expected.stats.object_memory_usage
+
+    def test_update_stats_removed_rows(self):
+        """測試移除資料列後的統計與重新計算一致"""
+        data = self._make_data()
+        schema = SchemaMetadater.from_data(data, enable_stats=True)
+        removed = data.sample(frac=0.2, random_state=0)
+        remaining = data.drop(removed.index)
+
+        updated = SchemaMetadater.update_stats(schema, remaining, removed=removed)
+        expected = SchemaMetadater.from_data(
+            remaining, enable_stats=True, base_schema=schema
+        )
+
+        self._assert_stats_equal(expected, updated)
+        # 原 Schema 統計不變
+        assert schema.stats.row_count == len(data)
+
+    def test_update_stats_removed_validation_rows(self):
+        """測試移除驗證集後的各項統計與訓練集重新計算一致"""
+        from petsard.loader import Splitter
+
+        data = self._make_data()
+        data["when"] = pd.Timestamp("2020-01-01") + pd.to_timedelta(
+            np.arange(len(data)) % 97, unit="D"
+        )
+        data["level"] = data["level"].astype("category")
+        schema = SchemaMetadater.from_data(data, enable_stats=True)
+        split_data, _, _ = Splitter(
+            num_samples=1, train_split_ratio=0.8, random_state=42
+        ).split(data=data.copy(), metadata=schema)
+        train = split_data[1]["train"]
+        validation = split_data[1]["validation"]
+
+        updated = SchemaMetadater.update_stats(schema, train, removed=validation)
+        expected = SchemaMetadater.from_data(
+            train, enable_stats=True, base_schema=schema
+        )
+
+        self._assert_stats_equal(expected, updated)
+        # 順序統計量由剩餘資料重新計算，而非沿用舊值
+        assert updated.attributes["amount"].stats.median == pytest.approx(
+            train["amount"].median()
+        )
+
+    def test_update_stats_added_rows(self):
+        """測試新增資料列後的統計與重新計算一致"""
+        data = self._make_data()
+        head, tail = data.iloc[:600], data.iloc[600:]
+        schema = SchemaMetadater.from_data(head, enable_stats=True)
+
+        updated = SchemaMetadater.update_stats(schema, data, added=tail)
+        expected = SchemaMetadater.from_data(
+            data, enable_stats=True, base_schema=schema
+        )
+
+        self._assert_stats_equal(expected, updated)
+
+    def test_update_stats_table_stats_from_changed_rows(self, monkeypatch):
+        """測試重複列數與記憶體用量僅由變動資料列增量更新"""
+        data = self._make_data()
+        # 加入重複列，部分重複列之後會被移除
+        data = pd.concat([data, data.iloc[:30], data.iloc[:10]], ignore_index=True)
+        schema = SchemaMetadater.from_data(data, enable_stats=True)
+        assert schema.stats.duplicated_rows == int(data.duplicated().sum())
+
+        removed = data.iloc[::3]
+        remaining = data.drop(removed.index)
+        added = data.iloc[:25].assign(count=data["count"].iloc[:25] + 1000)
+
+        hashed_rows = []
+        count_row_hashes = SchemaMetadater._count_row_hashes.__func__
+
+        def record_count_row_hashes(cls, df):
+            hashed_rows.append(len(df))
+            return count_row_hashes(cls, df)
+
+        monkeypatch.setattr(
+            SchemaMetadater,
+            "_count_row_hashes",
+            classmethod(record_count_row_hashes),
+        )
+        updated = SchemaMetadater.update_stats(schema, remaining, removed=removed)
+        updated = SchemaMetadater.update_stats(
+            updated, pd.concat([remaining, added]), added=added
+        )
+        monkeypatch.undo()
+
+        # 只有變動的資料列被雜湊
+        assert hashed_rows == [len(removed), len(added)]
+        changed = pd.concat([remaining, added])
+        expected = SchemaMetadater.from_data(
+            changed, enable_stats=True, base_schema=schema
+        )
+        self._assert_stats_equal(expected, updated)
+        assert updated.stats.duplicated_rows == int(changed.duplicated().sum())
+        assert updated.stats.object_memory_usage == {
+            col: int(changed[col].memory_usage(index=False, deep=True))
+            for col in ("level", "name")
+        }
+
+    def test_update_stats_row_count_mismatch(self):
+        """測試列數不符時改為重新計算"""
+        data = self._make_data()
+        schema = SchemaMetadater.from_data(data, enable_stats=True)
+        subset = data.iloc[:500]
+
+        updated = SchemaMetadater.update_stats(schema, subset, removed=data.iloc[:10])
+
+        assert updated.stats.row_count == 500
+        assert updated.attributes["count"].stats.row_count == 500
+
+    def test_attribute_update_stats(self):
+        """測試欄位統計的增量合併"""
+        series = pd.Series([1.0, 2.0, 4.0, np.nan, 8.0])
+        attr = AttributeMetadater.from_data(series, enable_stats=True)
+        added = AttributeMetadater._calculate_field_stats(
+            pd.Series([16.0, np.nan]), "float", False
+        )
+
+        updated = AttributeMetadater.update_stats(attr.stats, added=added)
+        expected = pd.Series([1.0, 2.0, 4.0, 8.0, 16.0])
+
+        assert updated.row_count == 7
+        assert updated.na_count == 2
+        assert updated.mean == pytest.approx(expected.mean())
+        assert updated.std == pytest.approx(expected.std())
+        assert updated.min == 1.0
+        assert updated.max == 16.0
+
+    def test_attribute_update_stats_ambiguous_mode(self):
+        """測試眾數並列時無法增量更新"""
+        series = pd.Series(["a", "a", "b"], dtype="category")
+        attr = AttributeMetadater.from_data(series, enable_stats=True)
+        removed = AttributeMetadater._calculate_field_stats(
+            series.iloc[:1], "str", True
+        )
+
+        assert AttributeMetadater.update_stats(attr.stats, removed=removed) is None
@@ -116,6 +116,29 @@ class TestConstantProcessor:
         assert "normal" in restored.columns
         assert all(restored["constant"] == 777)
         assert list(restored["normal"]) == [1, 2, 3, 4, 5]
+        # 預設不修改輸入資料
+        assert "constant" not in transformed.columns
+
+    def test_constant_processor_inverse_transform_without_copy(self):
+        """測試 ConstantProcessor 的 inverse_transform 不複製資料"""
+        original_data = pd.DataFrame(
+            {
+                "normal": [1, 2, 3],
+                "constant": [777, 777, 777],
+            }
+        )
+        schema = SchemaMetadater.from_data(original_data, enable_stats=True)
+
+        processor = ConstantProcessor()
+        processor.fit(original_data, schema)
+        transformed = processor.transform(original_data)
+
+        restored = processor.inverse_transform(transformed, copy=False)
+
+        assert list(restored.columns) == ["normal", "constant"]
+        assert all(restored["constant"] == 777)
+        # copy=False 直接在輸入資料上還原
+        assert "constant" in transformed.columns
 
     def test_no_constant_columns(self):
         """測試沒有 constant columns 的情況"""
@@ -3,7 +3,7 @@ import pandas as pd
 import pytest
 
 from petsard.exceptions import UnfittedError
-from petsard.processor.encoder import EncoderLabel, EncoderUniform
+from petsard.processor.encoder import EncoderDateDiff, EncoderLabel, EncoderUniform
 
 
 class Test_EncoderUniform:
@@ -57,6 +57,38 @@ class Test_EncoderUniform:
 
         assert list(rtransformed) == list(df_data["col1"].values)
 
+    def test_EncoderUniform_na_and_bounds(self):
+        # Values with NA, as object and as categorical
+        data = pd.Series(["A", None, "B", "A", np.nan, "C"] * 1000, dtype=object)
+
+        encoder = EncoderUniform()
+        encoder.fit(data)
+        # NA values take the bounds of the first NA label, as dict_get_na does
+        bounds = {}
+        for label, lower, upper in zip(
+            encoder.labels, encoder.lower_values, encoder.upper_values, strict=True
+        ):
+            bounds.setdefault("NA" if pd.isna(label) else label, (lower, upper))
+
+        for series in [data, data.astype("category")]:
+            transformed = encoder.transform(series)
+
+            assert isinstance(transformed, np.ndarray)
+            assert transformed.dtype == np.float64
+            assert len(transformed) == len(series)
+            keys = series.astype(object).fillna("NA")
+            for key, value in zip(keys, transformed, strict=True):
+                assert bounds[key][0] <= value <= bounds[key][1]
+
+            rtransformed = encoder.inverse_transform(pd.Series(transformed))
+            assert rtransformed.isna().equals(series.isna())
+            assert list(rtransformed.dropna()) == list(series.dropna())
+
+        # NA unseen in the fitting process
+        encoder.fit(data.dropna())
+        with pytest.raises(ValueError):
+            encoder.transform(data)
+
 
 class Test_EncoderLabel:
     def test_EncoderLabel(self):
@@ -96,3 +128,57 @@ class Test_EncoderLabel:
         rtransformed = encoder.inverse_transform(transformed)
 
         assert list(rtransformed) == list(df_data["col1"].values)
+
+
+class Test_EncoderDateDiff:
+    def test_EncoderDateDiff(self):
+        # Prepare test data, with NaT in both baseline and related dates
+        df_data = pd.DataFrame(
+            {
+                "base": pd.to_datetime(
+                    ["2020-01-01 00:00", "2020-01-10 00:00", None, "2020-01-01 12:00"]
+                ),
+                "event": ["2020-01-15", "2020-01-03", "2020-01-01", None],
+            }
+        )
+
+        encoder = EncoderDateDiff(baseline_date="base", related_date_list=["event"])
+
+        with pytest.raises(UnfittedError):
+            encoder.transform(df_data)
+
+        encoder.fit(df_data)
+        transformed = encoder.transform(df_data)
+
+        # Whole days, floored as Timedelta.days, NaN where either date is NaT
+        assert transformed["event"].iloc[:2].tolist() == [14, -7]
+        assert transformed["event"].iloc[2:].isna().all()
+
+        rtransformed = encoder.inverse_transform(transformed)
+        assert rtransformed["event"].tolist()[:2] == ["2020-01-15", "2020-01-03"]
+        assert rtransformed["event"].iloc[2:].isna().all()
+
+    def test_EncoderDateDiff_units(self):
+        df_data = pd.DataFrame(
+            {
+                "base": pd.to_datetime(["2020-01-15", "2020-01-01"]),
+                "event": pd.to_datetime(["2020-01-01 00:00", "2020-01-15 18:00"]),
+            }
+        )
+
+        encoder = EncoderDateDiff(
+            baseline_date="base",
+            related_date_list=["event"],
+            diff_unit="weeks",
+            absolute_value=True,
+        )
+        encoder.fit(df_data)
+        transformed = encoder.transform(df_data)
+
+        assert transformed["event"].tolist() == [2.0, 2.0]
+
+        rtransformed = encoder.inverse_transform(transformed)
+        assert pd.api.types.is_datetime64_any_dtype(rtransformed["event"])
+        assert rtransformed["event"].tolist() == list(
+            pd.to_datetime(["2020-01-29", "2020-01-15"])
+        )
@@ -0,0 +1,254 @@
+"""測試 Processor 欄位平行化、執行計畫與效能剖析功能"""
+
+from copy import deepcopy
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from petsard.exceptions import ConfigError
+from petsard.metadater import SchemaMetadater
+from petsard.processor import Processor
+from petsard.processor.base import ColumnRun, ProcessorPlan
+
+
+@pytest.fixture
+def sample_data():
+    """建立含數值、類別與日期欄位的測試資料"""
+    rng = np.random.default_rng(42)
+    n = 200
+    data = pd.DataFrame(
+        {
+            "num_a": rng.normal(size=n),
+            "num_b": rng.normal(loc=10.0, size=n),
+            "cat_a": rng.choice(["x", "y", "z"], size=n),
+            "cat_b": rng.choice(["p", "q"], size=n),
+            "start": pd.Timestamp("2020-01-01")
+            + pd.to_timedelta(rng.integers(0, 365, size=n), unit="D"),
+            "end": pd.Timestamp("2021-01-01")
+            + pd.to_timedelta(rng.integers(0, 365, size=n), unit="D"),
+        }
+    )
+    return data
+
+
+@pytest.fixture
+def sample_config():
+    """使用可重現的處理器，並以 EncoderDateDiff 作為同步點"""
+    return {
+        "encoder": {
+            "cat_a": "encoder_label",
+            "cat_b": "encoder_label",
+            "end": {"method": "encoder_datediff", "baseline_date": "start"},
+        },
+    }
+
+
+def _run(data, config, **kwargs):
+    """以指定平行化參數執行 fit / transform / inverse_transform"""
+    schema = SchemaMetadater.from_data(data)
+    # update_config() 會修改傳入的 config，每次執行使用副本
+    processor = Processor(metadata=schema, config=deepcopy(config), **kwargs)
+    processor.fit(data, sequence=["encoder", "scaler"])
+    transformed = processor.transform(data)
+    restored = processor.inverse_transform(transformed)
+    return processor, transformed, restored
+
+
+class TestProcessorParallel:
+    """測試欄位平行化執行模式"""
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_parallel_matches_serial(self, sample_data, sample_config, executor):
+        """測試平行執行結果與序列執行一致"""
+        _, serial_transformed, serial_restored = _run(sample_data, sample_config)
+        processor, transformed, restored = _run(
+            sample_data, sample_config, max_workers=4, executor=executor
+        )
+
+        pd.testing.assert_frame_equal(transformed, serial_transformed)
+        pd.testing.assert_frame_equal(restored, serial_restored)
+        # 執行結束後不保留 worker pool
+        assert processor._pool is None
+
+    def test_process_executor_keeps_fitted_state(self, sample_data, sample_config):
+        """測試 process pool 擬合後的處理器狀態寫回 config"""
+        processor, _, _ = _run(
+            sample_data, sample_config, max_workers=2, executor="process"
+        )
+
+        assert processor._config["encoder"]["cat_a"]._is_fitted
+        assert processor._config["scaler"]["num_b"].model.mean_[0] == pytest.approx(
+            sample_data["num_b"].mean()
+        )
+
+    def test_column_runs_barrier(self, sample_data, sample_config):
+        """測試 EncoderDateDiff 單獨成為一個批次"""
+        schema = SchemaMetadater.from_data(sample_data)
+        processor = Processor(metadata=schema, config=sample_config)
+        encoders = processor._config["encoder"]
+        items = [(col, encoders[col]) for col in ["cat_a", "end", "cat_b", "num_a"]]
+
+        runs = processor._column_runs(items)
+
+        assert runs == (
+            ColumnRun(columns=("cat_a",)),
+            ColumnRun(columns=("end",), whole_frame=True),
+            ColumnRun(columns=("cat_b", "num_a")),
+        )
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_workers": 0},
+            {"max_workers": 1.5},
+            {"max_workers": True},
+            {"executor": "gpu"},
+        ],
+    )
+    def test_invalid_parallel_config(self, sample_data, kwargs):
+        """測試無效的平行化參數"""
+        schema = SchemaMetadater.from_data(sample_data)
+
+        with pytest.raises(ConfigError):
+            Processor(metadata=schema, **kwargs)
+
+
+class TestProcessorPlan:
+    """測試 fit 後編譯的執行計畫"""
+
+    def test_plan_compiled_after_fit(self, sample_data, sample_config):
+        """測試 fit 後產生與處理序列對齊的執行計畫"""
+        processor, _, _ = _run(sample_data, sample_config)
+        plan = processor._plan
+
+        assert isinstance(plan, ProcessorPlan)
+        assert [step.processor for step in plan.transform_steps] == (
+            processor._fitting_sequence
+        )
+        assert [step.processor for step in plan.inverse_steps] == (
+            processor._inverse_sequence
+        )
+        encoder_step = plan.transform_steps[
+            processor._fitting_sequence.index("encoder")
+        ]
+        assert ColumnRun(columns=("end",), whole_frame=True) in encoder_step.runs
+
+    def test_repeated_transform_reuses_plan(self, sample_data, sample_config):
+        """測試重複 transform 沿用執行計畫，且只記錄一次 schema 變化"""
+        schema = SchemaMetadater.from_data(sample_data)
+        processor = Processor(metadata=schema, config=deepcopy(sample_config))
+        processor.fit(sample_data)
+        original = sample_data.copy()
+
+        first = processor.transform(sample_data)
+        plan = processor._plan
+        history_len = len(processor.get_schema_history())
+        second = processor.transform(sample_data)
+
+        pd.testing.assert_frame_equal(first, second)
+        pd.testing.assert_frame_equal(sample_data, original)
+        assert first is not second
+        assert processor._plan is plan
+        assert len(processor.get_schema_history()) == history_len
+
+    def test_onehot_recompiles_plan_once(self, sample_data):
+        """測試 one-hot 新增欄位時重新編譯計畫，之後的呼叫沿用"""
+        schema = SchemaMetadater.from_data(sample_data)
+        processor = Processor(
+            metadata=schema,
+            config={"encoder": {"cat_a": "encoder_onehot", "cat_b": "encoder_label"}},
+        )
+        processor.fit(sample_data)
+        fitted_plan = processor._plan
+
+        first = processor.transform(sample_data)
+        plan = processor._plan
+        second = processor.transform(sample_data)
+
+        assert plan is not fitted_plan
+        assert processor._plan is plan
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_refit_compiles_new_plan(self, sample_data, sample_config):
+        """測試重新 fit 時重新編譯計畫並記錄 schema 變化"""
+        processor, _, _ = _run(sample_data, sample_config)
+        plan = processor._plan
+
+        processor.fit(sample_data, sequence=["encoder"])
+
+        assert processor._plan is not plan
+        assert [step.processor for step in processor._plan.transform_steps] == (
+            processor._fitting_sequence
+        )
+        assert processor._is_recorded is False
+
+
+class TestProcessorProfile:
+    """測試 Processor 效能剖析"""
+
+    def test_profile_disabled_skips_stats(
+        self, sample_data, sample_config, monkeypatch
+    ):
+        """測試未啟用剖析時不計算任何欄位統計"""
+
+        def fail_stats(data):
+            raise AssertionError("column statistics computed without profiling")
+
+        monkeypatch.setattr(Processor, "_column_stats", staticmethod(fail_stats))
+
+        processor, _, _ = _run(sample_data, sample_config)
+
+        profile = processor.get_profile()
+        assert profile.empty
+        assert list(profile.columns) == Processor.PROFILE_COLUMNS
+
+    def test_profile_records(self, sample_data, sample_config):
+        """測試啟用剖析時記錄各步驟、各欄位的統計與耗時"""
+        _, serial_transformed, serial_restored = _run(sample_data, sample_config)
+        processor, transformed, restored = _run(
+            sample_data, sample_config, profile=True
+        )
+
+        # 剖析不影響處理結果
+        pd.testing.assert_frame_equal(transformed, serial_transformed)
+        pd.testing.assert_frame_equal(restored, serial_restored)
+
+        profile = processor.get_profile()
+        assert list(profile.columns) == Processor.PROFILE_COLUMNS
+        assert set(profile["method"]) == {"transform", "inverse_transform"}
+        assert (profile["seconds"] >= 0).all()
+
+        scaler = profile[
+            (profile["method"] == "transform")
+            & (profile["step"] == "scaler")
+            & (profile["column"] == "num_b")
+        ].iloc[0]
+        assert scaler["call"] == 1
+        assert scaler["processor"] == "ScalerStandard"
+        assert scaler["mean_before"] == pytest.approx(sample_data["num_b"].mean())
+        assert scaler["mean_after"] == pytest.approx(0.0, abs=1e-9)
+        assert scaler["na_count_after"] == 0
+
+        mediators = profile[profile["column"].isna()]
+        assert "MediatorEncoder" in set(mediators["step"])
+        assert mediators["mean_before"].isna().all()
+
+        inverse = profile[profile["method"] == "inverse_transform"]
+        assert set(inverse["call"]) == {2}
+        assert "outlier" not in set(inverse["step"])
+
+    def test_profile_reset_by_fit(self, sample_data, sample_config):
+        """測試重新 fit 時清空剖析紀錄"""
+        processor, _, _ = _run(sample_data, sample_config, profile=True)
+        assert not processor.get_profile().empty
+
+        processor.fit(sample_data)
+
+        assert processor.get_profile().empty
+        processor.transform(sample_data)
+        assert set(processor.get_profile()["call"]) == {1}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
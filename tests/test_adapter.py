@@ -1,5 +1,6 @@
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -881,7 +882,7 @@ class TestSplitterAdapter:
     def test_get_train_indices(self):
         """測試訓練索引取得"""
         config = {"method": "random"}
-        mock_train_indices = {1: [0, 1, 2], 2: [3, 4, 5]}
+        mock_train_indices = [np.array([0, 1, 2]), np.array([3, 4, 5])]
 
         with patch("petsard.adapter.Splitter") as mock_splitter_class:
             mock_splitter = Mock()
@@ -890,13 +891,13 @@ class TestSplitterAdapter:
             operator = SplitterAdapter(config)
             operator.train_indices = mock_train_indices
 
-            with patch(
-                "petsard.adapter.deepcopy", return_value=mock_train_indices
-            ) as mock_deepcopy:
-                result = operator.get_train_indices()
+            result = operator.get_train_indices()
 
-                mock_deepcopy.assert_called_once_with(mock_train_indices)
-                assert result == mock_train_indices
+            # 索引陣列原樣回傳，不轉為集合
+            assert len(result) == 2
+            for index, expected in zip(result, mock_train_indices, strict=True):
+                assert isinstance(index, np.ndarray)
+                np.testing.assert_array_equal(index, expected)
 
 
 class TestPreprocessorAdapter:
@@ -973,6 +974,44 @@ class TestPreprocessorAdapter:
                 data=input_data["data"], sequence=["encoder", "scaler"]
             )
 
+    def test_run_parallel_options(self):
+        """測試欄位平行化與剖析參數傳遞給 Processor"""
+        config = {
+            "method": "custom",
+            "max_workers": 4,
+            "executor": "process",
+            "profile": True,
+            "encoder": {"A": "encoder_label"},
+        }
+        mock_metadata = Mock(spec=Schema)
+        mock_metadata.enable_stats = False
+        mock_metadata.attributes = {}  # 空字典，可以迭代
+        input_data = {
+            "data": pd.DataFrame({"A": [1, 2, 3]}),
+            "metadata": mock_metadata,
+        }
+
+        with patch("petsard.adapter.Processor") as mock_processor_class:
+            mock_processor = Mock()
+            mock_processor.transform.return_value = pd.DataFrame({"A": [1, 2, 3]})
+            mock_processor._metadata = mock_metadata
+            mock_processor_class.return_value = mock_processor
+
+            operator = PreprocessorAdapter(config)
+            assert "max_workers" not in operator._config
+            assert "executor" not in operator._config
+            assert "profile" not in operator._config
+
+            operator._run(input_data)
+
+            mock_processor_class.assert_called_once_with(
+                metadata=mock_metadata,
+                config={"encoder": {"A": "encoder_label"}},
+                max_workers=4,
+                executor="process",
+                profile=True,
+            )
+
     def test_set_input_from_splitter(self):
         """測試從 Splitter 設定輸入"""
         config = {"method": "default"}
@@ -75,6 +75,22 @@ class TestConfig:
         for expt_config in splitter_config.values():
             assert expt_config["num_samples"] == 1
 
+    def test_splitter_handler_kfold(self):
+        """測試 kfold 的 Splitter 配置為每個實驗指定折次"""
+        config_dict = {
+            "Splitter": {
+                "cv": {"split_method": "kfold", "num_samples": 3, "random_state": 42}
+            }
+        }
+
+        config = Config(config_dict)
+
+        splitter_config = config.yaml["Splitter"]
+        for n in range(1, 4):
+            expt_config = splitter_config[f"cv_[3-{n}]"]
+            assert expt_config["num_samples"] == 3
+            assert expt_config["fold"] == n
+
     def test_set_flow(self):
         """測試流程設定
         Test flow setup"""
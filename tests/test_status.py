@@ -4,7 +4,9 @@
 
 from unittest.mock import Mock
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from petsard.adapter import BaseAdapter
 from petsard.config import Config
@@ -339,3 +341,131 @@ class TestStatusTiming:
         # 過濾不存在的模組
         nonexistent_records = self.status.get_timing_records("NonExistentModule")
         assert len(nonexistent_records) == 0
+
+
+class TestStatusTimingContext:
+    """測試 TIMING_END 附帶量測值的計時記錄（使用本機檔案，不需網路）"""
+
+    @pytest.fixture(autouse=True)
+    def setup_status(self, tmp_path):
+        """以本機 CSV 設定測試環境"""
+        self.filepath = tmp_path / "data.csv"
+        pd.DataFrame({"a": range(1000), "b": ["x", "y"] * 500}).to_csv(
+            self.filepath, index=False
+        )
+        self.config = Config(
+            {
+                "Loader": {
+                    "data": {"filepath": str(self.filepath), "memory_mode": "compact"}
+                }
+            }
+        )
+        self.status = Status(self.config)
+
+    def test_timing_end_context_parsing(self):
+        """測試 TIMING_END 附帶的量測值寫入計時記錄 context"""
+        import logging
+
+        petsard_logger = logging.getLogger("PETsARD")
+        petsard_logger.setLevel(logging.INFO)
+
+        logger = logging.getLogger("PETsARD.test")
+        self.status._current_experiments["Loader"] = "load_exp"
+
+        logger.info("TIMING_START|Loader|compact|1000.0")
+        logger.info(
+            "TIMING_END|Loader|compact|1000.5|0.5|"
+            "memory_bytes_before=4096,memory_bytes_after=1024"
+        )
+
+        record = self.status.get_timing_records("Loader")[0]
+        assert record.step_name == "compact"
+        assert record.context["status"] == "completed"
+        assert record.context["memory_bytes_before"] == 4096
+        assert record.context["memory_bytes_after"] == 1024
+
+        timing_df = self.status.get_timing_report_data()
+        assert timing_df.iloc[0]["memory_bytes_after"] == 1024
+
+    def test_compact_loader_timing_reaches_status(self):
+        """測試 Loader 精簡模式的前後位元組數寫入 Status 計時記錄"""
+        import logging
+
+        logging.getLogger("PETsARD").setLevel(logging.INFO)
+
+        ops = self.config.config.get()
+        ops.run(ops.set_input(status=self.status))
+        self.status.put(self.config.module_flow.get(), self.config.expt_flow.get(), ops)
+
+        timing_df = self.status.get_timing_report_data()
+        compact = timing_df[timing_df["step_name"] == "compact"]
+        assert len(compact) == 1
+        memory_usage = ops.loader.memory_usage
+        row = compact.iloc[0]
+        assert row["module_name"] == "Loader"
+        assert row["memory_bytes_before"] == memory_usage["memory_bytes_before"]
+        assert row["memory_bytes_after"] == memory_usage["memory_bytes_after"]
+        assert row["memory_bytes_after"] < row["memory_bytes_before"]
+
+
+class TestStatusTrainIndices:
+    """測試 Status 保存 Splitter 訓練索引"""
+
+    @pytest.fixture(autouse=True)
+    def setup_data(self, tmp_path):
+        """建立本機 CSV 測試資料"""
+        self.tmp_path = tmp_path
+        self.filepath = tmp_path / "data.csv"
+        pd.DataFrame({"a": range(100), "b": ["x", "y"] * 50}).to_csv(
+            self.filepath, index=False
+        )
+
+    def _run_status(self, splitter_options: dict | None = None) -> Status:
+        """依序執行 Loader 與兩次 Splitter，回傳 Status"""
+        splitter_options = splitter_options or {}
+        config = Config(
+            {
+                "Loader": {"data": {"filepath": str(self.filepath)}},
+                "Splitter": {
+                    "split_1": {
+                        "train_split_ratio": 0.8,
+                        "random_state": 1,
+                        **splitter_options,
+                    },
+                    "split_2": {
+                        "train_split_ratio": 0.8,
+                        "random_state": 2,
+                        **splitter_options,
+                    },
+                },
+            }
+        )
+        status = Status(config)
+        while config.config.qsize() > 0:
+            ops = config.config.get()
+            module = config.module_flow.get()
+            expt = config.expt_flow.get()
+            ops.run(ops.set_input(status=status))
+            status.put(module, expt, ops)
+        return status
+
+    def test_exist_train_indices_kept_as_arrays(self):
+        """測試訓練索引以 np.ndarray 傳回 Status 並供下一次分割使用"""
+        exist_train_indices = self._run_status().get_exist_train_indices()
+        assert len(exist_train_indices) == 2
+        for index in exist_train_indices:
+            assert isinstance(index, np.ndarray)
+            assert len(index) == 80
+
+    def test_cached_train_indices_kept_as_arrays(self):
+        """測試由分割快取讀回的訓練索引同樣以 np.ndarray 保存於 Status"""
+        cache_dir = str(self.tmp_path / "split_cache")
+        first = self._run_status({"cache_dir": cache_dir}).get_exist_train_indices()
+        # 第二次執行由快取讀回索引
+        second = self._run_status({"cache_dir": cache_dir}).get_exist_train_indices()
+
+        assert len(list((self.tmp_path / "split_cache").iterdir())) == 2
+        assert len(second) == 2
+        for cached, computed in zip(second, first, strict=True):
+            assert isinstance(cached, np.ndarray)
+            np.testing.assert_array_equal(cached, computed)